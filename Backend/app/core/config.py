@@ -3,14 +3,117 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_db: str = "learning_academy"
+    # Log hot-path queries that fall back to a collection scan at startup
+    mongo_explain_check: bool = True
     groq_api_key: str | None = None
     jwt_secret: str = "replace_me"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
+    # bcrypt runs on a bounded thread pool; beyond the queue limit requests get 503
+    password_hash_workers: int = 4
+    password_hash_queue_limit: int = 64
+    password_hash_retry_after: int = 2
+    # Cache of decoded tokens / user documents used by get_current_user
+    user_cache_ttl_seconds: int = 60
+    user_cache_max_entries: int = 10000
+    # Optional Redis URL so all uvicorn workers share cached user documents
+    user_cache_redis_url: str | None = None
     tmp_dir: str = "tmp"
     certificates_dir: str = "certificates"
     port: int = 8080
 
+    # Uploads
+    max_upload_bytes: int = 2 * 1024 * 1024 * 1024
+    upload_chunk_size: int = 1024 * 1024
+
+    # Audio extraction: "ffmpeg" (audio stream only, 16 kHz mono WAV) or "moviepy"
+    audio_extractor: str = "ffmpeg"
+    ffmpeg_binary: str | None = None
+    # Pipe ffmpeg PCM straight into the transcriber instead of writing a temp file
+    audio_pipe_to_transcriber: bool = False
+
+    # Transcription: long audio is split on silence into chunks transcribed concurrently
+    transcribe_chunk_seconds: int = 600
+    transcribe_concurrency: int = 4
+
+    # Local Whisper backend (used when no Groq key is set)
+    whisper_model: str = "small"
+    whisper_workers: int = 0  # 0 = one worker per whisper_threads_per_worker CPU cores
+    whisper_threads_per_worker: int = 2
+    whisper_warmup: bool = False
+
+    # Groq calls: one pooled async client, retried with jittered backoff on 429/5xx
+    llm_timeout_seconds: float = 60.0
+    llm_max_retries: int = 4
+    llm_backoff_base_seconds: float = 0.5
+    llm_backoff_max_seconds: float = 20.0
+    llm_concurrency_per_model: int = 8
+    llm_max_connections: int = 32
+
+    # Transcripts longer than this many tokens are split into sections whose
+    # questions are generated concurrently (0 = always a single prompt)
+    quiz_section_tokens: int = 6000
+    quiz_tokenizer: str = "o200k_base"
+
+    # Generated quizzes cached in Mongo by hash(model, prompt, transcript, num_questions)
+    quiz_cache_ttl_seconds: int = 30 * 24 * 3600
+    # Total size of cached quiz JSON; least recently used entries go first
+    quiz_cache_max_bytes: int = 64 * 1024 * 1024
+
+    # Ask the LLM about free-text quiz answers the local grader can't match exactly
+    quiz_llm_fallback: bool = False
+
+    # Content-addressed cache of audio/transcripts per video hash
+    artifacts_dir: str = "artifacts"
+    artifacts_max_bytes: int = 10 * 1024 * 1024 * 1024
+
+    # Certificate rendering processes (0 = one per CPU core up to 4, -1 = render on a thread)
+    certificate_workers: int = 0
+    certificate_bulk_max: int = 5000
+
+    # Progress saves are buffered and written in batches (latest value per user/video)
+    progress_write_behind: bool = True
+    progress_flush_interval: float = 2.0
+    progress_flush_max_pending: int = 5000
+    # Per-user dashboard (enrollments + progress + courses) response cache
+    dashboard_cache_ttl_seconds: int = 5
+    dashboard_cache_max_entries: int = 10000
+
+    # Per-day "active learner" markers behind the analytics rollups are kept this long
+    analytics_learner_days_ttl_days: int = 3
+
+    # Catalogue listing pages (/api/courses, /api/quizzes)
+    page_size_default: int = 100
+    page_size_max: int = 1000
+
+    # Logging: "text" or "json" lines on stderr. With log_async the event loop
+    # only enqueues records and a background thread formats and writes them.
+    log_level: str = "INFO"
+    log_format: str = "text"
+    log_async: bool = True
+    # Share of debug-level payload logs (raw LLM output) actually written, and their max length
+    log_payload_sample_rate: float = 0.01
+    log_payload_max_chars: int = 2000
+
+    # Prometheus-style metrics at /metrics (request, job stage, Groq and MongoDB timings)
+    metrics_enabled: bool = True
+    # `python -m app.worker` has no API, so it serves /metrics on its own port (0 = off)
+    worker_metrics_host: str = "0.0.0.0"
+    worker_metrics_port: int = 9100
+
+    # Deployment role. "all" serves the API and runs video -> quiz jobs in the
+    # same process; "api" only serves HTTP (the media stack is never imported)
+    # and leaves jobs in the Mongo queue for `python -m app.worker` processes.
+    # With separate workers, tmp_dir must be a volume shared with the API.
+    app_role: str = "all"  # "all" | "api"
+
+    # Background jobs (video -> quiz pipeline), queued in the `jobs` collection
+    job_workers: int = 2  # concurrent jobs per process that runs them
+    job_queue_size: int = 100  # uploads are refused with 503 beyond this many queued jobs
+    job_poll_interval: float = 1.0
+    job_lease_seconds: float = 300.0  # a job whose runner stops renewing this is claimed again
+    job_max_attempts: int = 3
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,9 +1,181 @@
+import sys
+import copy
+import json
+import uuid
+import atexit
+import queue
+import random
 import logging
+import logging.handlers
+import threading
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Optional, TextIO, Tuple
+
+from app.core.config import settings
+
+# Id of the request (or job) being handled; stamped on every record so log
+# lines from one request can be found together
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+TEXT_FORMAT = "%(asctime)s — %(name)s — %(levelname)s — [%(request_id)s] %(message)s"
+
+# LogRecord attributes that are not `extra=` fields
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "request_id"}
+
+_configured = False
+_configure_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _RequestIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any `extra=` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the writer thread. Only the message is rendered on the
+    calling thread (so mutable args can't change before it's written); the
+    line format and the I/O happen on the writer.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        # Copy so other handlers of the record still see the original
+        record = copy.copy(record)
+        record.msg, record.args, record.exc_info = message, None, None
+        return record
+
+
+def _formatter(fmt: str) -> logging.Formatter:
+    return JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT)
+
+
+def build_handler(
+    stream: TextIO, fmt: str = "text", use_queue: bool = True
+) -> Tuple[logging.Handler, Optional[logging.handlers.QueueListener]]:
+    """
+    Handler writing `fmt` ("text" or "json") lines to `stream`. With
+    `use_queue` the caller only enqueues the record and a background thread,
+    the returned listener, does the formatting and writing; start it before
+    logging and stop it to flush.
+    """
+    writer = logging.StreamHandler(stream)
+    writer.setFormatter(_formatter(fmt))
+    if not use_queue:
+        writer.addFilter(_RequestIdFilter())
+        return writer, None
+    handler = _QueueHandler(queue.SimpleQueue())
+    # Runs on the calling thread, where the request's context is
+    handler.addFilter(_RequestIdFilter())
+    listener = logging.handlers.QueueListener(handler.queue, writer)
+    return handler, listener
+
+
+def configure_logging() -> None:
+    """
+    Set up the root logger once per process from settings (level, text or
+    JSON, queued or direct). Leaves it alone if something else, such as a
+    test runner, already configured it.
+    """
+    global _configured, _listener
+    with _configure_lock:
+        if _configured:
+            return
+        _configured = True
+        root = logging.getLogger()
+        if root.handlers:
+            return
+        handler, _listener = build_handler(sys.stderr, settings.log_format, settings.log_async)
+        root.addHandler(handler)
+        root.setLevel(settings.log_level.upper())
+        if _listener is not None:
+            _listener.start()
+            atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Write out queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def get_logger(name: str) -> logging.Logger:
-    # configure only if not configured yet
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s — %(name)s — %(levelname)s — %(message)s"
-    )
+    configure_logging()
     return logging.getLogger(name)
+
+
+def log_payload(logger: logging.Logger, message: str, payload: Any, *args: Any) -> None:
+    """
+    Debug-log a large payload (e.g. raw LLM output) for a sample of calls:
+    `settings.log_payload_sample_rate` of them, truncated to
+    `settings.log_payload_max_chars`. Free when debug logging is off.
+    """
+    if not logger.isEnabledFor(logging.DEBUG) or random.random() >= settings.log_payload_sample_rate:
+        return
+    text = payload if isinstance(payload, str) else repr(payload)
+    if len(text) > settings.log_payload_max_chars:
+        text = f"{text[:settings.log_payload_max_chars]}... ({len(text)} chars)"
+    logger.debug(message + ": %s", *args, text)
+
+
+class RequestIdMiddleware:
+    """
+    ASGI middleware that takes the request id from the X-Request-ID header
+    (or makes one), makes it available to every log record of the request
+    and echoes it on the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:128]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id_var.reset(token)
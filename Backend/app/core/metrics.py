@@ -0,0 +1,271 @@
+"""
+Minimal Prometheus-style metrics: counters and histograms updated in
+process, plus collectors that report gauges read from the services at
+scrape time. `render()` produces the text exposition format served at
+/metrics.
+
+Recording is a dict lookup and a few additions under a lock, so it is
+cheap enough for every request and database command; everything else
+(cumulative buckets, formatting, service stats) happens only on scrape.
+"""
+import time
+import bisect
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple, Union
+
+from app.core.logger import get_logger
+
+logger = get_logger("core.metrics")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, from a fast Mongo command up to a long transcription
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+class Family(NamedTuple):
+    """One metric as reported by a collector: (labels, value) per series."""
+    name: str
+    kind: str  # "counter" | "gauge"
+    documentation: str
+    samples: List[Tuple[Dict[str, Any], float]]
+
+
+Collector = Callable[[], Union[Iterable[Family], Awaitable[Iterable[Family]]]]
+
+_metrics: List["_Metric"] = []
+_collectors: List[Collector] = []
+
+
+def register_collector(collector: Collector) -> None:
+    """
+    Add a function (sync or async) called on every scrape that returns
+    Family tuples, for values that already live elsewhere such as queue
+    lengths and cache stats.
+    """
+    _collectors.append(collector)
+
+
+def stats_families(
+    prefix: str, documentation: str, stats: Dict[str, Any], counters: Sequence[str] = ()
+) -> List[Family]:
+    """
+    Families for a service's stats() dict: keys listed in `counters` become
+    `<prefix>_<key>_total` counters, the other numeric keys gauges.
+    """
+    families = []
+    for key, value in stats.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        if key in counters:
+            families.append(Family(f"{prefix}_{key}_total", "counter", f"{documentation}: {key}", [({}, value)]))
+        else:
+            families.append(Family(f"{prefix}_{key}", "gauge", f"{documentation}: {key}", [({}, value)]))
+    return families
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        _metrics.append(self)
+
+    def _lines(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def _lines(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{_labels(dict(zip(self.labelnames, key)))} {_number(value)}"
+            for key, value in values
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._upper = tuple(sorted(buckets))
+        # Per label set: [count per bucket..., count above the last bucket], sum
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self._upper, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = ([0] * (len(self._upper) + 1), [0.0])
+            state[0][index] += 1
+            state[1][0] += value
+
+    def time(self, *labels: str) -> "_Timer":
+        """Context manager that observes the seconds spent inside it."""
+        return _Timer(self, labels)
+
+    def _lines(self) -> List[str]:
+        with self._lock:
+            values = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        lines = []
+        for key, counts, total in values:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for upper, count in zip(self._upper, counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_labels({**labels, 'le': _number(upper)})} {cumulative}")
+            cumulative += counts[-1]
+            lines.append(f"{self.name}_bucket{_labels({**labels, 'le': '+Inf'})} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(labels)} {cumulative}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_started")
+
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._histogram.observe(time.perf_counter() - self._started, *self._labels)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+async def render() -> str:
+    """Every metric and collector in the text exposition format."""
+    lines: List[str] = []
+    for metric in _metrics:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric._lines())
+
+    for collector in _collectors:
+        try:
+            families = collector()
+            if asyncio.iscoroutine(families):
+                families = await families
+            collected = []
+            for family in families:
+                collected.append(f"# HELP {family.name} {family.documentation}")
+                collected.append(f"# TYPE {family.name} {family.kind}")
+                for labels, value in family.samples:
+                    collected.append(f"{family.name}{_labels(labels)} {_number(value)}")
+            lines.extend(collected)
+        except Exception as e:
+            logger.warning("Metrics collector %s failed: %s", getattr(collector, "__qualname__", collector), e)
+    return "\n".join(lines) + "\n"
+
+
+async def _handle_scrape(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), 10)
+        # Headers are not needed, only read past them
+        while (await asyncio.wait_for(reader.readline(), 10)).strip():
+            pass
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+            status, content_type, body = "200 OK", CONTENT_TYPE, (await render()).encode()
+        else:
+            status, content_type, body = "404 Not Found", "text/plain; charset=utf-8", b"Not found\n"
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(host: str, port: int) -> asyncio.AbstractServer:
+    """
+    Serve `render()` at GET /metrics on `host`:`port`, for processes without
+    the FastAPI app (the media worker). One request per connection.
+    """
+    server = await asyncio.start_server(_handle_scrape, host, port)
+    logger.info("Metrics at http://%s:%d/metrics", host, port)
+    return server
+
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve an HTTP request, until the last byte of the response",
+    ("method", "route", "status"),
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that times every HTTP request by route template (so
+    /api/quiz/{video_id} is one series, not one per video).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status),
+            )
@@ -1,18 +1,47 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
 from app.core.config import settings
 from app.core.logger import get_logger
+from app.core.metrics import Counter, Histogram
 
 logger = get_logger("db.client")
 
+MONGO_COMMAND_SECONDS = Histogram(
+    "mongodb_command_duration_seconds", "Round trip of MongoDB commands as seen by the driver", ("command",)
+)
+MONGO_COMMAND_FAILURES = Counter("mongodb_command_failures_total", "MongoDB commands that failed", ("command",))
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """Feeds driver command events into the MongoDB metrics."""
+
+    def started(self, event) -> None:
+        pass
+
+    def succeeded(self, event) -> None:
+        MONGO_COMMAND_SECONDS.observe(event.duration_micros / 1e6, event.command_name)
+
+    def failed(self, event) -> None:
+        MONGO_COMMAND_SECONDS.observe(event.duration_micros / 1e6, event.command_name)
+        MONGO_COMMAND_FAILURES.inc(event.command_name)
+
+
 _client: AsyncIOMotorClient | None = None
 
 def get_client() -> AsyncIOMotorClient:
     global _client
     if _client is None:
         logger.info("Creating AsyncIOMotorClient")
-        _client = AsyncIOMotorClient(settings.mongodb_url)
+        listeners = [CommandMetrics()] if settings.metrics_enabled else []
+        _client = AsyncIOMotorClient(settings.mongodb_url, event_listeners=listeners)
     return _client
 
 def get_db():
     client = get_client()
     return client[settings.mongodb_db]
+
+def close_client() -> None:
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
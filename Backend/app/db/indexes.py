@@ -0,0 +1,127 @@
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from bson import ObjectId
+from pymongo import ASCENDING, IndexModel
+
+from app.core.logger import get_logger
+
+logger = get_logger("db.indexes")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(title: str) -> str:
+    """Key for case-insensitive course title uniqueness (`course_title_normalized`)."""
+    return _WHITESPACE.sub(" ", title).strip().casefold()
+
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "courses": [
+        IndexModel([("video_id", ASCENDING)], unique=True, name="video_id_unique"),
+        # Partial so courses created before the field existed don't collide on null
+        IndexModel(
+            [("course_title_normalized", ASCENDING)],
+            unique=True,
+            name="course_title_normalized_unique",
+            partialFilterExpression={"course_title_normalized": {"$type": "string"}},
+        ),
+    ],
+    "users": [
+        IndexModel([("email", ASCENDING)], unique=True, name="email_unique"),
+        IndexModel([("username", ASCENDING)], unique=True, name="username_unique"),
+    ],
+    "video_progress": [
+        IndexModel([("user_email", ASCENDING), ("video_id", ASCENDING)], unique=True, name="user_video_unique"),
+    ],
+    "enrollments": [
+        # Also serves lookups on user_email alone (index prefix)
+        IndexModel([("user_email", ASCENDING), ("video_id", ASCENDING)], unique=True, name="user_video_unique"),
+    ],
+    "jobs": [
+        IndexModel([("job_id", ASCENDING)], unique=True, name="job_id_unique"),
+        IndexModel([("status", ASCENDING), ("created_at", ASCENDING)], name="status_created_at"),
+    ],
+    "quiz_results": [
+        IndexModel([("video_id", ASCENDING), ("created_at", ASCENDING)], name="video_created_at"),
+        IndexModel([("user_email", ASCENDING), ("created_at", ASCENDING)], name="user_created_at"),
+    ],
+    "analytics_learner_days": [
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0, name="expires_at_ttl"),
+    ],
+    "llm_cache": [
+        # Mongo drops entries once expires_at has passed
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0, name="expires_at_ttl"),
+        IndexModel([("last_used_at", ASCENDING)], name="last_used_at"),
+    ],
+}
+
+# Representative hot-path queries checked with explain at startup:
+# (collection, filter, sort)
+HOT_QUERIES: List[Tuple[str, Dict[str, Any], List[Tuple[str, int]]]] = [
+    ("courses", {"video_id": "x"}, []),
+    ("courses", {"course_title_normalized": "x"}, []),
+    ("courses", {"_id": {"$gt": ObjectId("0" * 24)}}, [("_id", ASCENDING)]),
+    ("users", {"email": "x"}, []),
+    ("users", {"username": "x"}, []),
+    ("video_progress", {"user_email": "x", "video_id": "x"}, []),
+    ("enrollments", {"user_email": "x"}, []),
+    ("enrollments", {"user_email": "x", "video_id": "x"}, []),
+    ("jobs", {"job_id": "x"}, []),
+    ("jobs", {"status": "queued"}, []),
+    # Job claim: queued, or running with a lapsed lease
+    ("jobs", {"$or": [
+        {"status": "queued"},
+        {"status": "running", "lease_until": {"$lt": datetime(2000, 1, 1)}},
+    ]}, [("created_at", ASCENDING)]),
+    ("llm_cache", {}, [("last_used_at", ASCENDING)]),
+]
+
+
+async def ensure_indexes(db) -> None:
+    """
+    Create the indexes declared in INDEXES. create_indexes is a no-op for
+    indexes that already exist; a failure on one collection (e.g. existing
+    duplicates blocking a unique index) is logged and doesn't stop the others.
+    """
+    for collection, models in INDEXES.items():
+        try:
+            names = await db[collection].create_indexes(models)
+            logger.info("Indexes ready on %s: %s", collection, ", ".join(names))
+        except Exception as e:
+            logger.error("Could not create indexes on %s: %s", collection, e)
+
+
+def _stages(plan: Dict[str, Any]):
+    yield plan.get("stage")
+    for key in ("inputStage", "queryPlan"):
+        if isinstance(plan.get(key), dict):
+            yield from _stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from _stages(child)
+
+
+async def check_query_plans(db) -> List[str]:
+    """
+    Explain every query in HOT_QUERIES and log the ones whose winning plan
+    is a collection scan. Returns a description of each offending query.
+    """
+    collscans = []
+    for collection, query, sort in HOT_QUERIES:
+        command = {"find": collection, "filter": query}
+        if sort:
+            command["sort"] = dict(sort)
+        try:
+            explain = await db.command({"explain": command, "verbosity": "queryPlanner"})
+        except Exception as e:
+            logger.warning("Skipping query plan check, explain failed: %s", e)
+            return collscans
+        winning = explain.get("queryPlanner", {}).get("winningPlan", {})
+        if "COLLSCAN" in _stages(winning):
+            description = f"{collection} filter={query} sort={sort}"
+            collscans.append(description)
+            logger.warning("Query falls back to COLLSCAN: %s", description)
+    if not collscans:
+        logger.info("All %d hot-path queries use an index", len(HOT_QUERIES))
+    return collscans
@@ -0,0 +1,93 @@
+"""
+One-off seed of the analytics rollups from data that predates them:
+per-course `enrollments` from the enrollments collection and `learners`
+(plus their analytics_learners markers) from video_progress. Quiz results
+were not stored before, so quiz counters start from zero.
+Run it once, before the API starts recording events; it overwrites the two
+counters rather than adding to them.
+
+    python -m app.db.migrations.backfill_analytics [--batch-size 500] [--dry-run]
+"""
+import asyncio
+import argparse
+from datetime import datetime
+
+from pymongo import UpdateOne
+
+from app.core.logger import get_logger
+from app.db.client import get_db
+from app.services.analytics import rollups
+
+logger = get_logger("db.migrations.backfill_analytics")
+
+
+async def _group_counts(collection, key: str):
+    pipeline = [{"$group": {"_id": f"${key}", "count": {"$sum": 1}}}]
+    return {doc["_id"]: doc["count"] async for doc in collection.aggregate(pipeline) if doc["_id"]}
+
+
+async def migrate(batch_size: int = 500, dry_run: bool = False) -> int:
+    db = get_db()
+    now = datetime.utcnow()
+    enrollments = await _group_counts(db["enrollments"], "video_id")
+    learners = await _group_counts(db["video_progress"], "video_id")
+
+    courses = [
+        UpdateOne(
+            {"_id": video_id},
+            {"$set": {
+                "enrollments": enrollments.get(video_id, 0),
+                "learners": learners.get(video_id, 0),
+                "updated_at": now,
+            }},
+            upsert=True,
+        )
+        for video_id in set(enrollments) | set(learners)
+    ]
+
+    markers = 0
+    batch = []
+    cursor = db["video_progress"].find({}, {"_id": 0, "user_email": 1, "video_id": 1, "updated_at": 1})
+    async for doc in cursor:
+        if not doc.get("user_email") or not doc.get("video_id"):
+            continue
+        batch.append(UpdateOne(
+            {"_id": f"{doc['video_id']}:{doc['user_email']}"},
+            {"$setOnInsert": {
+                "video_id": doc["video_id"],
+                "user_email": doc["user_email"],
+                "first_active_at": doc.get("updated_at") or now,
+            }},
+            upsert=True,
+        ))
+        if len(batch) >= batch_size:
+            markers += len(batch)
+            if not dry_run:
+                await db[rollups.LEARNERS].bulk_write(batch, ordered=False)
+            batch = []
+    if batch:
+        markers += len(batch)
+        if not dry_run:
+            await db[rollups.LEARNERS].bulk_write(batch, ordered=False)
+
+    for start in range(0, len(courses), batch_size):
+        if not dry_run:
+            await db[rollups.COURSES].bulk_write(courses[start:start + batch_size], ordered=False)
+
+    logger.info(
+        "%s %d course rollups and %d learner markers",
+        "Would seed" if dry_run else "Seeded", len(courses), markers
+    )
+    return len(courses)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(migrate(args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
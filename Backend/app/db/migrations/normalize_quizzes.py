@@ -0,0 +1,56 @@
+"""
+One-off backfill of `normalized_quiz` on courses created before it was
+computed at write time.
+
+    python -m app.db.migrations.normalize_quizzes [--batch-size 500] [--dry-run]
+"""
+import asyncio
+import argparse
+
+from pymongo import UpdateOne
+
+from app.core.logger import get_logger
+from app.db.client import get_db
+from app.services.quiz.parser import normalize_quiz
+
+logger = get_logger("db.migrations.normalize_quizzes")
+
+
+async def migrate(batch_size: int = 500, dry_run: bool = False) -> int:
+    courses = get_db()["courses"]
+    cursor = courses.find({"normalized_quiz": {"$exists": False}}, {"_id": 1, "quiz": 1})
+
+    migrated = 0
+    batch = []
+    async for doc in cursor:
+        normalized = normalize_quiz(doc.get("quiz", "[]"))
+        batch.append(UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {"normalized_quiz": normalized, "quiz_answers": [q["answer"] for q in normalized]}},
+        ))
+        if len(batch) >= batch_size:
+            migrated += await _flush(courses, batch, dry_run)
+            batch = []
+    if batch:
+        migrated += await _flush(courses, batch, dry_run)
+
+    logger.info("%s %d courses", "Would migrate" if dry_run else "Migrated", migrated)
+    return migrated
+
+
+async def _flush(courses, batch, dry_run: bool) -> int:
+    if not dry_run:
+        await courses.bulk_write(batch, ordered=False)
+    return len(batch)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(migrate(args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
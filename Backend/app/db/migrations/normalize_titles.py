@@ -0,0 +1,65 @@
+"""
+One-off backfill of `course_title_normalized`, the key behind the unique
+case-insensitive course title index. Reports titles that collide after
+normalization; those must be renamed by hand before they are protected.
+
+    python -m app.db.migrations.normalize_titles [--batch-size 500] [--dry-run]
+"""
+import asyncio
+import argparse
+
+from pymongo import UpdateOne
+
+from app.core.logger import get_logger
+from app.db.client import get_db
+from app.db.indexes import normalize_title, ensure_indexes
+
+logger = get_logger("db.migrations.normalize_titles")
+
+
+async def migrate(batch_size: int = 500, dry_run: bool = False) -> int:
+    db = get_db()
+    courses = db["courses"]
+    taken = {
+        doc["course_title_normalized"]
+        async for doc in courses.find(
+            {"course_title_normalized": {"$type": "string"}}, {"course_title_normalized": 1}
+        )
+    }
+
+    migrated = 0
+    batch = []
+    cursor = courses.find({"course_title_normalized": {"$exists": False}}, {"_id": 1, "course_title": 1})
+    async for doc in cursor:
+        key = normalize_title(doc.get("course_title") or "")
+        if not key or key in taken:
+            logger.warning("Skipping course %s: title %r is empty or duplicated", doc["_id"], doc.get("course_title"))
+            continue
+        taken.add(key)
+        batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"course_title_normalized": key}}))
+        if len(batch) >= batch_size:
+            migrated += len(batch)
+            if not dry_run:
+                await courses.bulk_write(batch, ordered=False)
+            batch = []
+    if batch:
+        migrated += len(batch)
+        if not dry_run:
+            await courses.bulk_write(batch, ordered=False)
+
+    if not dry_run:
+        await ensure_indexes(db)
+    logger.info("%s %d courses", "Would migrate" if dry_run else "Migrated", migrated)
+    return migrated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(migrate(args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+
+
+def parse_cursor(after: Optional[str]) -> Optional[ObjectId]:
+    """Decode the `after` keyset cursor (the `_id` of the last item seen)."""
+    if after is None:
+        return None
+    try:
+        return ObjectId(after)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid 'after' cursor")
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str], default: Iterable[str]) -> List[str]:
+    """
+    Turn a comma-separated `fields` query parameter into a list of field
+    names, rejecting anything outside `allowed`.
+    """
+    if not fields:
+        return list(default)
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = sorted(set(requested) - set(allowed))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(sorted(allowed))}",
+        )
+    return requested
+
+
+def keyset_find(collection, query: Dict[str, Any], fields: List[str], after: Optional[ObjectId], limit: Optional[int]):
+    """
+    Cursor over `collection` in `_id` order starting after `after`. Fetches
+    one document past `limit` so callers can tell whether another page exists.
+    """
+    if after is not None:
+        query = {**query, "_id": {"$gt": after}}
+    projection = {name: 1 for name in fields}
+    projection["_id"] = 1
+    cursor = collection.find(query, projection).sort("_id", 1)
+    if limit is not None:
+        cursor = cursor.limit(limit + 1)
+    return cursor
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def to_ndjson_line(item: Dict[str, Any]) -> str:
+    return json.dumps(item, default=_json_default, ensure_ascii=False) + "\n"
+
+
+async def collect_page(items: AsyncIterator[Dict[str, Any]], limit: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Gather up to `limit` items (each carrying a string `_id`) and return them
+    with the cursor for the next page, or None when this is the last page.
+    """
+    page = []
+    async for item in items:
+        if len(page) == limit:
+            return page, page[-1]["_id"]
+        page.append(item)
+    return page, None
+
+
+async def ndjson_page(items: AsyncIterator[Dict[str, Any]], limit: int) -> AsyncIterator[str]:
+    """
+    Stream up to `limit` items as NDJSON, one line each. If more remain, a
+    final {"next_after": ...} line carries the cursor for the next page.
+    """
+    count = 0
+    async for item in items:
+        if count == limit:
+            yield to_ndjson_line({"next_after": last_id})
+            return
+        yield to_ndjson_line(item)
+        last_id = item["_id"]
+        count += 1
@@ -1,14 +1,53 @@
 import os
-import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.core.logger import get_logger
+from app.core.logger import RequestIdMiddleware, get_logger
 from app.core.config import settings
-from app.routers import auth, video, progress
+from app.core.metrics import MetricsMiddleware
+from app.routers import auth, video, progress, jobs, analytics, metrics
+from app.db.client import get_db, close_client
+from app.db.indexes import ensure_indexes, check_query_plans
+from app.services.auth import passwords, user_cache
+from app.services.certificate.renderer import shutdown_certificate_renderer
+from app.services.progress.buffer import get_progress_buffer
+from app.services.llm.gateway import close_gateway, get_gateway, groq_configured
+from app.worker import start_jobs, stop_jobs
 from fastapi.middleware.cors import CORSMiddleware
 
 logger = get_logger("app.main")
 
-app = FastAPI(title="Video→Quiz API (modular)")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Clients and directories are set up here rather than at import time, so
+    # importing the app stays cheap and free of side effects
+    os.makedirs(settings.tmp_dir, exist_ok=True)
+    os.makedirs(settings.certificates_dir, exist_ok=True)
+    db = get_db()
+    await ensure_indexes(db)
+    if settings.mongo_explain_check:
+        await check_query_plans(db)
+    await user_cache.connect()
+    if groq_configured():
+        get_gateway()
+    # In the "api" role jobs are left in the queue for `python -m app.worker`
+    # and the media stack is never imported
+    job_pool = await start_jobs() if settings.app_role == "all" else None
+    progress_buffer = get_progress_buffer()
+    if settings.progress_write_behind:
+        await progress_buffer.start()
+    yield
+    await progress_buffer.stop()
+    if job_pool is not None:
+        await stop_jobs(job_pool)
+    passwords.shutdown()
+    shutdown_certificate_renderer()
+    await close_gateway()
+    await user_cache.close()
+    close_client()
+
+
+app = FastAPI(title="Video→Quiz API (modular)", lifespan=lifespan)
 
 
 app.add_middleware(
@@ -18,11 +57,18 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestIdMiddleware)
 
 # include routers
 app.include_router(auth.router)
 app.include_router(video.router)
 app.include_router(progress.router)
+app.include_router(jobs.router)
+app.include_router(analytics.router)
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
 
 @app.get("/health")
 async def health():
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.core.logger import get_logger
+from app.db.client import get_db
+from app.services.analytics import rollups
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"])
+logger = get_logger("routers.analytics")
+
+
+@router.get("/courses")
+async def list_course_analytics(
+    video_ids: str = Query(..., description="Comma-separated video_ids"),
+):
+    """
+    Summary rollups (enrollments, learners, completion rate, average quiz
+    percentage, active learners today) for several courses at once.
+    Each course costs two primary-key reads, whatever its size.
+    """
+    ids = [v.strip() for v in video_ids.split(",") if v.strip()]
+    if not ids:
+        raise HTTPException(status_code=400, detail="video_ids must not be empty")
+    try:
+        db = get_db()
+        today = rollups.day_key(datetime.utcnow())
+        courses = {doc["_id"]: doc async for doc in db[rollups.COURSES].find({"_id": {"$in": ids}})}
+        days = {
+            doc["video_id"]: doc
+            async for doc in db[rollups.COURSE_DAYS].find(
+                {"_id": {"$in": [rollups.course_day_id(v, today) for v in ids]}}
+            )
+        }
+        items = [rollups.course_summary(v, courses.get(v), days.get(v)) for v in ids]
+        return {"count": len(items), "courses": items}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error reading course analytics: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/courses/{video_id}")
+async def get_course_analytics(video_id: str):
+    """Summary rollup for one course."""
+    try:
+        db = get_db()
+        today = rollups.day_key(datetime.utcnow())
+        doc = await db[rollups.COURSES].find_one({"_id": video_id})
+        today_doc = await db[rollups.COURSE_DAYS].find_one({"_id": rollups.course_day_id(video_id, today)})
+        return rollups.course_summary(video_id, doc, today_doc)
+    except Exception as e:
+        logger.exception("Error reading analytics for %s: %s", video_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/courses/{video_id}/daily")
+async def get_course_daily_analytics(
+    video_id: str,
+    days: int = Query(30, ge=1, le=366),
+    end: Optional[str] = Query(None, description="Last day to include (YYYY-MM-DD, UTC); defaults to today"),
+):
+    """
+    Per-day rollups for the `days` days ending at `end`, oldest first.
+    Days without activity are returned with zero counts.
+    """
+    try:
+        last = datetime.strptime(end, "%Y-%m-%d") if end else datetime.utcnow()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="end must be YYYY-MM-DD")
+    try:
+        day_keys = [rollups.day_key(last - timedelta(days=i)) for i in reversed(range(days))]
+        cursor = get_db()[rollups.COURSE_DAYS].find(
+            {"_id": {"$in": [rollups.course_day_id(video_id, d) for d in day_keys]}}
+        )
+        found = {doc["day"]: doc async for doc in cursor}
+        items = [rollups.day_summary(video_id, d, found.get(d)) for d in day_keys]
+        return {"video_id": video_id, "count": len(items), "days": items}
+    except Exception as e:
+        logger.exception("Error reading daily analytics for %s: %s", video_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
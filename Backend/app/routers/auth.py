@@ -1,7 +1,7 @@
 # ======= updated app/routers/auth.py =======
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from fastapi.security import OAuth2PasswordRequestForm
-from passlib.context import CryptContext
+from pymongo.errors import DuplicateKeyError
 import jwt
 from datetime import datetime, timedelta
 from typing import Optional, List
@@ -9,13 +9,12 @@ from app.core.config import settings
 from app.db.client import get_db
 from app.schemas import SignupRequest, TokenResponse, UserResponse
 from app.core.logger import get_logger
+from app.services.auth import user_cache
+from app.services.auth.passwords import hash_password, verify_password, PasswordHasherBusy
 
 logger = get_logger("routers.auth")
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 def _create_access_token(data: dict, expires_minutes: Optional[int] = None) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=(expires_minutes or settings.access_token_expire_minutes))
@@ -24,6 +23,14 @@ def _create_access_token(data: dict, expires_minutes: Optional[int] = None) -> s
     return token
 
 
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry shortly",
+        headers={"Retry-After": str(settings.password_hash_retry_after)},
+    )
+
+
 async def get_user_by_email(email: str):
     """Return user document by email."""
     db = get_db()
@@ -51,14 +58,22 @@ async def signup(payload: SignupRequest):
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # password was validated by Pydantic validator in SignupRequest
-    hashed = pwd_ctx.hash(payload.password)
+    try:
+        hashed = await hash_password(payload.password)
+    except PasswordHasherBusy:
+        raise _busy()
     user_doc = {
         "username": payload.username,
         "email": payload.email,
         "password": hashed,
         "created_at": datetime.utcnow()
     }
-    await users.insert_one(user_doc)
+    try:
+        await users.insert_one(user_doc)
+    except DuplicateKeyError:
+        # Lost a race with a concurrent signup for the same username/email
+        raise HTTPException(status_code=400, detail="Username or email already registered")
+    await user_cache.invalidate_user(payload.email)
     logger.info("New signup: %s", payload.username)
     return {"message": "Signup successful"}
 
@@ -74,7 +89,11 @@ async def token(form_data: OAuth2PasswordRequestForm = Depends()):
     # Treat form_data.username as email
     email = form_data.username
     user = await get_user_by_email(email)
-    if not user or not pwd_ctx.verify(form_data.password, user["password"]):
+    try:
+        valid = user is not None and await verify_password(form_data.password, user.get("password"))
+    except PasswordHasherBusy:
+        raise _busy()
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     # Use email as subject (sub) in token
     access_token = _create_access_token({"sub": user["email"]})
@@ -86,26 +105,47 @@ async def token(form_data: OAuth2PasswordRequestForm = Depends()):
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 security_scheme = HTTPBearer()
+optional_security_scheme = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(token: str):
     """
     Decode JWT and fetch user by email (sub).
     Expects `sub` claim to be email.
+    Decoded claims and user documents are cached until the token expires
+    (user documents for at most user_cache_ttl_seconds).
     """
     try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+        payload = user_cache.get_claims(token)
+        if payload is None:
+            payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+            user_cache.put_claims(token, payload)
         email = payload.get("sub")
         if not email:
             raise HTTPException(status_code=401, detail="Invalid token payload")
-        user = await get_user_by_email(email)
-        if not user:
-            raise HTTPException(status_code=401, detail="User not found")
+        user = await user_cache.get_user(email)
+        if user is None:
+            user = await get_user_by_email(email)
+            if not user:
+                raise HTTPException(status_code=401, detail="User not found")
+            await user_cache.put_user(email, user, payload.get("exp"))
         return user
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
+async def get_optional_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security_scheme),
+):
+    """
+    User of the `Authorization: Bearer` token, or None when the request has
+    no token. A token that is present but invalid is still a 401.
+    """
+    if credentials is None:
+        return None
+    return await get_current_user(credentials.credentials)
+
+
 # New endpoint to return current user info based on user-provided token
 @router.get("/me", response_model=UserResponse)
 async def read_current_user(token: str = Query(..., description="JWT access token")):
@@ -117,6 +157,12 @@ async def read_current_user(token: str = Query(..., description="JWT access toke
     }
 
 
+@router.get("/cache-stats")
+async def auth_cache_stats():
+    """Hit/miss counters of the authenticated-user cache in this process."""
+    return user_cache.stats()
+
+
 # 🚀 New endpoint: Get all users
 @router.get("/users", response_model=List[UserResponse])
 async def get_all_users():
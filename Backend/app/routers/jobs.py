@@ -0,0 +1,54 @@
+import json
+import asyncio
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.schemas import JobStatusResponse
+from app.services.jobs import store as job_store
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+logger = get_logger("routers.jobs")
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job_status(job_id: str):
+    """
+    Return the status, per-stage timings and result (once finished) of a job.
+    """
+    job = await job_store.get_job(job_id, public=True)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+async def _job_events(job_id: str):
+    last_update = None
+    while True:
+        job = await job_store.get_job(job_id, public=True)
+        if job is None:
+            yield "event: error\ndata: {\"detail\": \"Job not found\"}\n\n"
+            return
+        if job["updated_at"] != last_update:
+            last_update = job["updated_at"]
+            yield f"data: {json.dumps(job, default=str)}\n\n"
+        if job["status"] in job_store.TERMINAL_STATUSES:
+            return
+        await asyncio.sleep(settings.job_poll_interval)
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """
+    Server-sent events stream that emits the job document whenever it changes
+    and closes once the job has succeeded or failed.
+    """
+    if not await job_store.get_job(job_id, public=True):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        _job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.metrics import CONTENT_TYPE, render
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus scrape endpoint: request, job stage, Groq and MongoDB timings,
+    queue depths and cache statistics.
+    """
+    return Response(await render(), media_type=CONTENT_TYPE)
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 from app.schemas import SaveProgressRequest, GetProgressResponse
 from app.db.client import get_db
+from app.core.config import settings
 from app.core.logger import get_logger
+from app.services.progress.buffer import get_progress_buffer
+from app.services.progress import dashboard
+from app.services.analytics.rollups import record_activity, record_enrollment
 from datetime import datetime
 
 router = APIRouter(prefix="/progress", tags=["progress"])
@@ -12,6 +16,14 @@ logger = get_logger("routers.progress")
 
 @router.post("/save")
 async def save_progress(payload: SaveProgressRequest):
+    """
+    Record playback position. With the write-behind buffer enabled the value
+    is kept in memory and written with the next batched flush.
+    """
+    if settings.progress_write_behind:
+        get_progress_buffer().put(payload.user_email, payload.video_id, payload.progress_time)
+        return {"message": "Progress saved"}
+
     db = get_db()
     coll = db["video_progress"]
     await coll.update_one(
@@ -19,19 +31,35 @@ async def save_progress(payload: SaveProgressRequest):
         {"$set": {"progress_time": payload.progress_time, "updated_at": datetime.utcnow()}},
         upsert=True
     )
+    dashboard.invalidate_user(payload.user_email)
+    try:
+        await record_activity([(payload.user_email, payload.video_id)])
+    except Exception as e:
+        logger.warning("Could not update learner activity rollups: %s", e)
     return {"message": "Progress saved"}
 
 
 @router.get("/get", response_model=GetProgressResponse)
 async def get_progress(user_email: str, video_id: str):
+    # Unflushed saves are newer than what Mongo has
+    buffered = get_progress_buffer().get(user_email, video_id) if settings.progress_write_behind else None
+    if buffered is not None:
+        return {"progress_time": buffered}
+
     db = get_db()
     coll = db["video_progress"]
-    record = await coll.find_one({"user_email": user_email, "video_id": video_id})
+    record = await coll.find_one({"user_email": user_email, "video_id": video_id}, {"_id": 0, "progress_time": 1})
     if not record:
         raise HTTPException(status_code=404, detail="No progress found")
     return {"progress_time": record["progress_time"]}
 
 
+@router.get("/buffer-stats")
+async def progress_buffer_stats():
+    """Counters of the progress write-behind buffer in this process."""
+    return get_progress_buffer().stats()
+
+
 # ---------------------------
 # New: enrollment endpoints
 # ---------------------------
@@ -62,6 +90,12 @@ async def enroll(payload: EnrollRequest):
         upsert=True
     )
 
+    dashboard.invalidate_user(payload.user_email)
+    if result.upserted_id is not None:
+        try:
+            await record_enrollment(payload.video_id, payload.user_email)
+        except Exception as e:
+            logger.warning("Could not count enrollment in analytics: %s", e)
     logger.info("Enrollment saved for %s video=%s", payload.user_email, payload.video_id)
     return {"message": "Enrollment saved"}
 
@@ -84,3 +118,23 @@ async def get_enrolled(user_email: str):
         raise HTTPException(status_code=404, detail="No enrollments found for this email")
 
     return enrollments
+
+
+@router.get("/dashboard")
+async def get_dashboard(
+    user_email: str,
+    video_ids: Optional[str] = Query(None, description="Comma-separated video_ids to restrict to"),
+):
+    """
+    Everything the dashboard's course list needs in one call: the user's
+    enrollments, each joined with its saved progress and the course's title
+    and passing criteria (one aggregation, no per-video requests).
+    Courses the user hasn't started have progress_time null.
+    """
+    ids = [v.strip() for v in video_ids.split(",") if v.strip()] if video_ids else None
+    try:
+        rows = await dashboard.load_dashboard(user_email, ids)
+    except Exception as e:
+        logger.exception("Error loading dashboard for %s: %s", user_email, e)
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"user_email": user_email, "count": len(rows), "courses": rows}
@@ -1,210 +1,197 @@
 # app/routers/video.py
 import os
-import re
 import uuid
 import json
-import asyncio
-from datetime import datetime
+import logging
 from typing import List, Dict, Any, Optional
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, Form, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse
 
 from app.core.config import settings
 from app.core.logger import get_logger
-from app.schemas import VideoToQuizResponse, QuizCheckResponse, QuizQuestion
-from app.services.audio.extractor import extract_audio
-from app.services.transcribe.transcriber import transcribe
-from app.services.quiz.generator import generate_quiz
-from app.services.certificate.generator import generate_certificate
+from app.schemas import BulkCertificateRequest, JobSubmittedResponse, QuizCheckResponse, QuizQuestion
+from app.services.quiz.parser import normalize_quiz
+from app.services.quiz.grader import grade_quiz, add_marks
+from app.services.certificate.generator import (
+    generate_certificate,
+    get_certificate_course,
+    certificate_date,
+    render_certificates,
+)
+from app.services.certificate.bundle import certificate_filenames, safe_filename, zip_stream, merged_pdf_stream
+from app.services.certificate.renderer import get_certificate_renderer
+from app.services.storage.upload import save_upload, UploadTooLarge
+from app.services.jobs import store as job_store
+from app.services.analytics.rollups import record_quiz_result
+from app.services.jobs.store import VIDEO_TO_QUIZ, VIDEO_TO_QUIZ_STAGES
+from app.services.jobs.pool import get_job_pool
 from app.db.client import get_db
+from app.db.indexes import normalize_title
+from app.db.pagination import parse_cursor, parse_fields, keyset_find, collect_page, ndjson_page
+from app.routers.auth import get_optional_user
 
 router = APIRouter(prefix="/api", tags=["video"])
 logger = get_logger("routers.video")
 
-# Ensure tmp dirs exist
-os.makedirs(settings.tmp_dir, exist_ok=True)
-os.makedirs(settings.certificates_dir, exist_ok=True)
-
-
-def _parse_raw_quiz(raw_quiz: Any) -> List[Dict[str, Any]]:
+async def _normalized_quiz(courses, doc: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    Accept either:
-      - a JSON string representing a list or dict
-      - an already parsed list/dict from Groq's JSON mode
-    Normalize to a list of question dicts. If top-level dict contains "quiz",
-    extract it. If shape unexpected, return empty list.
+    Return the course's precomputed `normalized_quiz`. Courses created before
+    it existed are normalized from the raw quiz once and written back.
     """
-    if isinstance(raw_quiz, str):
-        try:
-            parsed = json.loads(raw_quiz)
-        except Exception:
-            logger.exception("Failed to json.loads raw_quiz")
-            return []
-    else:
-        parsed = raw_quiz
-
-    if isinstance(parsed, dict) and "quiz" in parsed:
-        quiz_list = parsed["quiz"]
-    elif isinstance(parsed, list):
-        quiz_list = parsed
-    else:
-        logger.warning("Unexpected quiz shape: %s", type(parsed))
-        quiz_list = []
-
-    if not isinstance(quiz_list, list):
-        logger.warning("Quiz is not a list after extraction, got: %s", type(quiz_list))
-        return []
-
-    # Ensure each item is a dict
-    normalized = []
-    for item in quiz_list:
-        if isinstance(item, dict):
-            normalized.append(item)
-        else:
-            logger.warning("Skipping non-dict quiz item: %s", item)
+    normalized = doc.get("normalized_quiz")
+    if normalized is not None:
+        return normalized
+
+    logger.warning("Course %s has no normalized_quiz, backfilling", doc.get("video_id"))
+    raw = await courses.find_one({"_id": doc["_id"]}, {"quiz": 1})
+    normalized = normalize_quiz((raw or {}).get("quiz", "[]"))
+    await courses.update_one({"_id": doc["_id"]}, {"$set": {"normalized_quiz": normalized}})
     return normalized
 
 
-@router.post("/video-to-quiz", response_model=VideoToQuizResponse)
+@router.post("/video-to-quiz", response_model=JobSubmittedResponse, status_code=202)
 async def video_to_quiz(
     course_title: str = Form(...),
     passing_criteria: int = Form(...),
     num_questions: int = Form(...),
-    video_file: UploadFile = File(...)
+    video_file: UploadFile = File(...),
+    force_regenerate: bool = Form(False)
 ):
     """
-    Create a new course from an uploaded video, generate transcript + quiz,
-    and store it in DB. Rejects duplicate course_title (case-insensitive).
-    Response includes quiz with answers.
+    Accept an uploaded video and queue a background job that extracts audio,
+    transcribes it, generates the quiz and stores the course in DB.
+    Rejects duplicate course_title (case-insensitive).
+    A quiz previously generated for the same transcript and num_questions is
+    reused; pass force_regenerate=true to ask the LLM for a fresh one.
+    Returns the job id right away; poll /api/jobs/{job_id} for progress.
     """
     db = get_db()
     courses = db["courses"]
 
-    # Case-insensitive duplicate-title check
-    title_regex = {"$regex": f"^{re.escape(course_title)}$", "$options": "i"}
-    existing = await courses.find_one({"course_title": title_regex})
+    # Case-insensitive duplicate-title check (unique index on the normalized title)
+    existing = await courses.find_one({"course_title_normalized": normalize_title(course_title)}, {"_id": 1})
     if existing:
         raise HTTPException(
             status_code=400,
             detail=f"A course with title '{course_title}' already exists."
         )
 
+    # Refuse before streaming the upload to disk if the queue is backed up
+    queued = await job_store.count_queued()
+    if queued >= settings.job_queue_size:
+        logger.warning("Rejecting upload for '%s': %d jobs queued", course_title, queued)
+        raise HTTPException(
+            status_code=503,
+            detail=f"Job queue is full ({queued} pending)",
+            headers={"Retry-After": "30"},
+        )
+
     video_id = uuid.uuid4().hex
     ext = os.path.splitext(video_file.filename or "")[1] or ".mp4"
     video_path = os.path.join(settings.tmp_dir, f"{video_id}{ext}")
-    audio_path = os.path.join(settings.tmp_dir, f"{video_id}.mp3")
 
-    # Save uploaded video
+    # Stream uploaded video to disk in fixed-size chunks
     try:
-        contents = await video_file.read()
-        with open(video_path, "wb") as f:
-            f.write(contents)
+        saved = await save_upload(
+            video_file, video_path, settings.max_upload_bytes, settings.upload_chunk_size
+        )
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.exception("Failed to save uploaded video: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-    # Extract audio
-    try:
-        await asyncio.to_thread(extract_audio, video_path, audio_path)
-    except Exception as e:
-        logger.exception("Audio extraction failed: %s", e)
-        raise HTTPException(status_code=400, detail=f"Audio extraction failed: {e}")
+    job = await job_store.create_job(
+        VIDEO_TO_QUIZ,
+        {
+            "video_id": video_id,
+            "course_title": course_title,
+            "course_video_name": video_file.filename,
+            "passing_criteria": passing_criteria,
+            "num_questions": num_questions,
+            "force_regenerate": force_regenerate,
+            "video_sha256": saved.sha256,
+            "video_size": saved.size,
+            "video_path": video_path,
+        },
+        VIDEO_TO_QUIZ_STAGES,
+    )
+    if settings.app_role == "all":
+        get_job_pool().notify()
+
+    logger.info("Queued job %s for course '%s'", job["job_id"], course_title)
+    return JobSubmittedResponse(
+        job_id=job["job_id"],
+        status=job["status"],
+        video_id=video_id,
+        status_url=f"/api/jobs/{job['job_id']}",
+        events_url=f"/api/jobs/{job['job_id']}/events",
+    )
 
-    # Transcribe
+async def _record_quiz_result(video_id: str, user_email: Optional[str], evaluation: Dict[str, Any], passing_criteria: float) -> None:
     try:
-        transcript = await asyncio.to_thread(transcribe, audio_path)
+        await record_quiz_result(video_id, user_email, evaluation, passing_criteria)
     except Exception as e:
-        logger.exception("Transcription error: %s", e)
-        raise HTTPException(status_code=500, detail=f"Transcription error: {e}")
+        logger.exception("Could not record quiz result for %s: %s", video_id, e)
+
+
+async def _llm_marks(
+    video_id: str,
+    quiz_obj: List[Dict[str, Any]],
+    answers_list: List[Any],
+    correct_answers: List[Any],
+    ungraded: List[int],
+) -> int:
+    """
+    Marks the LLM gives the answers the local grader couldn't match. The
+    fallback is optional, so any failure (Groq error, timeout, missing key,
+    malformed reply) counts those answers as wrong instead of failing the
+    submission.
+    """
+    from app.services.quiz.checker import check_quiz_answers_llm
 
-    # Generate quiz (Groq JSON mode expected to return a list/dict containing quiz)
     try:
-        raw_quiz = await asyncio.to_thread(generate_quiz, transcript, num_questions)
-        # raw_quiz expected to be a JSON string (list) per generator implementation
+        llm_result = await check_quiz_answers_llm(
+            [quiz_obj[i] for i in ungraded if i < len(quiz_obj)],
+            [answers_list[i] for i in ungraded],
+            [correct_answers[i] if i < len(correct_answers) else "" for i in ungraded],
+        )
+        evaluation = llm_result.get("quiz_evaluation", llm_result) if isinstance(llm_result, dict) else None
+        if not isinstance(evaluation, dict):
+            raise ValueError(f"unexpected reply {llm_result!r}")
     except Exception as e:
-        logger.exception("Quiz generation failed: %s", e)
-        raise HTTPException(status_code=500, detail=f"Quiz generation failed: {e}")
-
-    # Parse quiz for response and DB storage
-    parsed_quiz_list = _parse_raw_quiz(raw_quiz)
-
-    # Build quiz_answers (list of answer texts) and sanitized_quiz (includes answer)
-    quiz_answers: List[str] = []
-    sanitized_quiz: List[Dict[str, Any]] = []
-
-    for item in parsed_quiz_list:
-        question_text = item.get("question", "")
-        options = item.get("options", []) if isinstance(item.get("options", []), list) else []
-        answer = item.get("answer")
-
-        # If answer missing but answer_index provided, try mapping
-        if (answer is None or (isinstance(answer, (int, float)) and not isinstance(answer, str))) and "answer_index" in item:
-            try:
-                idx = int(item.get("answer_index"))
-                if 0 <= idx < len(options):
-                    answer = options[idx]
-            except Exception:
-                answer = None
-
-        # If answer is an index-like string "0", try to cast
-        if answer is not None and not isinstance(answer, str):
-            try:
-                answer = str(answer)
-            except Exception:
-                answer = None
-
-        # Final safety: if answer text still not found, set to empty string
-        answer_text = answer if isinstance(answer, str) else ""
-
-        quiz_answers.append(answer_text)
-        sanitized_quiz.append({
-            "question": question_text,
-            "options": options,
-            "answer": answer_text
-        })
-
-    # Save course to DB
+        logger.warning("LLM check of %d answers for %s failed, using 0: %s", len(ungraded), video_id, e)
+        return 0
+
+    llm_marks = evaluation.get("marks") or 0
     try:
-        course_doc = {
-            "video_id": video_id,
-            "course_title": course_title,
-            "course_video_name": video_file.filename,
-            "transcript": transcript,
-            "passing_criteria": passing_criteria,
-            # store the raw value returned by generator (string or parsed) for fidelity
-            "quiz": raw_quiz,
-            "quiz_answers": quiz_answers,
-            "created_at": datetime.utcnow(),
-        }
-        await courses.insert_one(course_doc)
-    except Exception as e:
-        logger.exception("DB insert error: %s", e)
-        raise HTTPException(status_code=500, detail=f"DB insert error: {e}")
-
-    return VideoToQuizResponse(
-        course_title=course_title,
-        course_video_name=video_file.filename,
-        transcript=transcript,
-        passing_criteria=passing_criteria,
-        quiz=sanitized_quiz,
-        video_id=video_id
-    )
+        llm_marks = int(llm_marks)
+    except (TypeError, ValueError):
+        # e.g. "3/5" or "three": count the ungraded answers as wrong
+        logger.warning("Unusable marks %r from the LLM for %s, using 0", llm_marks, video_id)
+        return 0
+    return llm_marks
+
 
 @router.get("/check-quiz", response_model=QuizCheckResponse)
 async def check_quiz_endpoint(
+    background_tasks: BackgroundTasks,
     video_id: str = Query(..., description="UUID of the video"),
-    answers: str = Query(..., description="JSON encoded list of answers")
+    answers: str = Query(..., description="JSON encoded list of answers"),
+    current_user: Optional[Dict[str, Any]] = Depends(get_optional_user),
 ):
     """
     Check submitted answers against stored quiz for a given video_id.
     - `answers` should be a JSON list of answer strings or indices (frontend choice).
-    - Correct answers are read from the DB (course_doc['quiz_answers'] if present,
-      otherwise extracted from the stored quiz).
+    - Correct answers come from the course's precomputed `normalized_quiz`.
+    - Answers are graded locally (option index, letter or text); the LLM is
+      only consulted for free-text answers when `quiz_llm_fallback` is enabled.
     - Transcript is NOT used.
+    - The result is stored in `quiz_results` and the analytics rollups after
+      the response is sent, for the learner of the bearer token if there is
+      one (anonymously otherwise).
     """
-    from app.services.quiz.checker import check_quiz_answers_llm
-
     try:
         # parse submitted answers
         answers_list = json.loads(answers)
@@ -214,52 +201,45 @@ async def check_quiz_endpoint(
         db = get_db()
         courses = db["courses"]
 
-        course_doc = await courses.find_one({"video_id": video_id})
+        course_doc = await courses.find_one(
+            {"video_id": video_id},
+            {"_id": 1, "video_id": 1, "course_title": 1, "passing_criteria": 1, "normalized_quiz": 1},
+        )
         if not course_doc:
             raise HTTPException(status_code=404, detail="Course not found")
 
-        # Get stored quiz (raw) and normalize to a list of question dicts
-        raw_quiz = course_doc.get("quiz", "[]")
-        quiz_obj = _parse_raw_quiz(raw_quiz)
-
-        # Obtain correct answers from DB if available
-        correct_answers = course_doc.get("quiz_answers")
-        if not isinstance(correct_answers, list) or not correct_answers:
-            # Fallback: extract "answer" (or map answer_index) from each question item
-            correct_answers = []
-            for item in quiz_obj:
-                ans = None
-                if isinstance(item, dict):
-                    # direct answer text
-                    if "answer" in item and isinstance(item["answer"], str):
-                        ans = item["answer"]
-                    # fallback to answer_index -> map to options if possible
-                    elif "answer_index" in item and isinstance(item.get("options"), list):
-                        try:
-                            idx = int(item.get("answer_index"))
-                            opts = item.get("options", [])
-                            if 0 <= idx < len(opts):
-                                ans = opts[idx]
-                        except Exception:
-                            ans = None
-                correct_answers.append(ans if isinstance(ans, str) else "")
-
-        # Call the checker LLM in a thread. Pass (quiz_obj, user_answers, correct_answers).
-        # (Checker should accept these args and return a dict with at least 'marks' and 'percentage'.)
-        result = await asyncio.to_thread(check_quiz_answers_llm, quiz_obj, answers_list, correct_answers)
+        quiz_obj = await _normalized_quiz(courses, course_doc)
+        correct_answers = [item["answer"] for item in quiz_obj]
+
+        result = grade_quiz(quiz_obj, answers_list, correct_answers)
 
+        ungraded = result["ungraded"]
+        if ungraded and settings.quiz_llm_fallback:
+            llm_marks = await _llm_marks(video_id, quiz_obj, answers_list, correct_answers, ungraded)
+            add_marks(result, max(0, min(llm_marks, len(ungraded))))
+
+        evaluation = result["quiz_evaluation"]
+        user_email = current_user.get("email") if current_user else None
+        background_tasks.add_task(
+            _record_quiz_result, video_id, user_email, dict(evaluation), course_doc.get("passing_criteria", 0)
+        )
         return {
             "video_id": video_id,
             "course_title": course_doc.get("course_title"),
-            "marks": result.get("marks"),
-            "percentage": result.get("percentage"),
+            "marks": evaluation["marks"],
+            "percentage": evaluation["percentage"],
             "result": result
         }
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception("Error in check_quiz_endpoint: %s", e)
+        # Traceback only at debug level: this path can fail for every request
+        # while e.g. the database is down
+        logger.error(
+            "Error in check_quiz_endpoint for %s: %s", video_id, e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -282,40 +262,113 @@ async def create_certificate(
     try:
         # Directly await the async certificate generator function
         cert_path = await generate_certificate(video_id, name, user_percentage)
-        return FileResponse(cert_path, media_type="application/pdf", filename=os.path.basename(cert_path))
+        safe_name = name.replace(" ", "_")
+        return FileResponse(cert_path, media_type="application/pdf", filename=f"certificate_{safe_name}.pdf")
     except Exception as e:
         logger.exception("Certificate generation failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/courses")
-async def list_courses():
+@router.post("/certificates/bulk")
+async def create_certificates_bulk(payload: BulkCertificateRequest):
     """
-    Return all courses in the DB (basic fields).
+    Issue certificates for many people on one course in a single request.
+
+    The course is looked up once and every recipient is checked against its
+    passing criteria up front: if anyone falls short the whole batch is
+    rejected with the list of names, unless `skip_ineligible` is set, in
+    which case they are left out (their count is in `X-Certificates-Skipped`).
+    Certificates are rendered in parallel and streamed back as a ZIP
+    (`format=zip`, one PDF per person) or a single merged PDF (`format=pdf`).
     """
+    if not payload.recipients:
+        raise HTTPException(status_code=400, detail="recipients must not be empty")
+    if len(payload.recipients) > settings.certificate_bulk_max:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.certificate_bulk_max} recipients per request",
+        )
+
     try:
-        db = get_db()
-        courses = db["courses"]
+        course = await get_certificate_course(payload.video_id)
+    except Exception as e:
+        logger.exception("Bulk certificate course lookup failed: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+    if course is None:
+        raise HTTPException(status_code=404, detail="Course not found")
 
-        cursor = courses.find(
-            {},
-            {
-                "_id": 1,
-                "video_id": 1,
-                "course_title": 1,
-                "course_video_name": 1,
-                "passing_criteria": 1,
-                "created_at": 1,
+    passing_criteria = course["passing_criteria"]
+    eligible = [r.name for r in payload.recipients if r.percentage >= passing_criteria]
+    ineligible = [r.name for r in payload.recipients if r.percentage < passing_criteria]
+    if ineligible and not payload.skip_ineligible:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "message": f"{len(ineligible)} recipient(s) did not meet passing criteria ({passing_criteria}%)",
+                "ineligible": ineligible,
             },
         )
+    if not eligible:
+        raise HTTPException(status_code=400, detail="No recipient met the passing criteria")
+
+    window = 2 * max(1, get_certificate_renderer().workers)
+    pdfs = render_certificates(eligible, course["course_title"], certificate_date(), window)
+    headers = {
+        "X-Certificates-Issued": str(len(eligible)),
+        "X-Certificates-Skipped": str(len(ineligible)),
+    }
+    logger.info(
+        "Issuing %d certificates for %s as %s (%d skipped)",
+        len(eligible), payload.video_id, payload.format, len(ineligible)
+    )
 
-        results = []
-        async for doc in cursor:
-            doc["_id"] = str(doc["_id"])
-            results.append(doc)
+    download_name = f"certificates_{safe_filename(payload.video_id)}"
+    if payload.format == "pdf":
+        headers["Content-Disposition"] = f'attachment; filename="{download_name}.pdf"'
+        return StreamingResponse(merged_pdf_stream(pdfs), media_type="application/pdf", headers=headers)
 
-        return {"count": len(results), "courses": results}
+    headers["Content-Disposition"] = f'attachment; filename="{download_name}.zip"'
+    return StreamingResponse(
+        zip_stream(pdfs, certificate_filenames(eligible)), media_type="application/zip", headers=headers
+    )
+
+
+COURSE_FIELDS = ("video_id", "course_title", "course_video_name", "passing_criteria", "created_at")
+QUIZ_LIST_FIELDS = ("video_id", "course_title", "quiz")
 
+
+@router.get("/courses")
+async def list_courses(
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    after: Optional[str] = Query(None, description="Cursor: `next_after` from the previous page"),
+    fields: Optional[str] = Query(None, description=f"Comma-separated subset of {', '.join(COURSE_FIELDS)}"),
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+):
+    """
+    Return courses in creation order, one page at a time (basic fields).
+    Pass the response's `next_after` as `after` to fetch the next page.
+    With `format=ndjson` courses are streamed one per line instead, followed by
+    a {"next_after": ...} line when more remain.
+    """
+    try:
+        courses = get_db()["courses"]
+        cursor = keyset_find(
+            courses, {}, parse_fields(fields, COURSE_FIELDS, COURSE_FIELDS), parse_cursor(after), limit
+        )
+
+        async def items():
+            async for doc in cursor:
+                doc["_id"] = str(doc["_id"])
+                yield doc
+
+        if format == "ndjson":
+            return StreamingResponse(ndjson_page(items(), limit), media_type="application/x-ndjson")
+
+        page, next_after = await collect_page(items(), limit)
+        return {"count": len(page), "courses": page, "next_after": next_after}
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("Error listing courses: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -352,78 +405,59 @@ async def get_quiz(video_id: str):
         db = get_db()
         courses = db["courses"]
 
-        course_doc = await courses.find_one({"video_id": video_id})
+        course_doc = await courses.find_one(
+            {"video_id": video_id},
+            {"_id": 1, "video_id": 1, "course_title": 1, "normalized_quiz": 1},
+        )
         if not course_doc:
             raise HTTPException(status_code=404, detail="Course not found")
 
-        raw_quiz = course_doc.get("quiz", "[]")
-        parsed_quiz = _parse_raw_quiz(raw_quiz)
-
-        # Ensure returned items include question, options, answer
-        sanitized = []
-        for item in parsed_quiz:
-            q = item.get("question")
-            opts = item.get("options", []) if isinstance(item.get("options", []), list) else []
-            ans = item.get("answer")
-            # fallback to answer_index mapping
-            if (ans is None or not isinstance(ans, str)) and "answer_index" in item:
-                try:
-                    idx = int(item.get("answer_index"))
-                    if 0 <= idx < len(opts):
-                        ans = opts[idx]
-                except Exception:
-                    ans = ans or ""
-            ans = ans if isinstance(ans, str) else ""
-            sanitized.append({"question": q, "options": opts, "answer": ans})
-
         return {
             "video_id": video_id,
             "course_title": course_doc.get("course_title"),
-            "quiz": sanitized
+            "quiz": await _normalized_quiz(courses, course_doc)
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("Error fetching quiz: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/quizzes")
-async def list_quizzes():
+async def list_quizzes(
+    limit: int = Query(settings.page_size_default, ge=1, le=settings.page_size_max),
+    after: Optional[str] = Query(None, description="Cursor: `next_after` from the previous page"),
+    fields: Optional[str] = Query(None, description=f"Comma-separated subset of {', '.join(QUIZ_LIST_FIELDS)}"),
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+):
     """
-    List all quizzes with their course names (includes answers).
+    List quizzes with their course names (includes answers), paginated and
+    streamable the same way as /api/courses.
     """
     try:
-        db = get_db()
-        courses = db["courses"]
+        courses = get_db()["courses"]
+        selected = parse_fields(fields, QUIZ_LIST_FIELDS, QUIZ_LIST_FIELDS)
+        # The quiz is served from the precomputed normalized_quiz field
+        db_fields = ["normalized_quiz" if name == "quiz" else name for name in selected]
+        cursor = keyset_find(courses, {}, db_fields, parse_cursor(after), limit)
 
-        cursor = courses.find({}, {"video_id": 1, "course_title": 1, "quiz": 1})
-        results = []
-        async for doc in cursor:
-            raw_quiz = doc.get("quiz", "[]")
-            parsed_quiz = _parse_raw_quiz(raw_quiz)
-            sanitized = []
-            for item in parsed_quiz:
-                q = item.get("question")
-                opts = item.get("options", []) if isinstance(item.get("options", []), list) else []
-                ans = item.get("answer")
-                if (ans is None or not isinstance(ans, str)) and "answer_index" in item:
-                    try:
-                        idx = int(item.get("answer_index"))
-                        if 0 <= idx < len(opts):
-                            ans = opts[idx]
-                    except Exception:
-                        ans = ans or ""
-                ans = ans if isinstance(ans, str) else ""
-                sanitized.append({"question": q, "options": opts, "answer": ans})
-
-            results.append({
-                "video_id": doc.get("video_id"),
-                "course_title": doc.get("course_title"),
-                "quiz": sanitized
-            })
-
-        return {"count": len(results), "quizzes": results}
+        async def items():
+            async for doc in cursor:
+                item = {"_id": str(doc["_id"])}
+                for name in selected:
+                    item[name] = await _normalized_quiz(courses, doc) if name == "quiz" else doc.get(name)
+                yield item
 
+        if format == "ndjson":
+            return StreamingResponse(ndjson_page(items(), limit), media_type="application/x-ndjson")
+
+        page, next_after = await collect_page(items(), limit)
+        return {"count": len(page), "quizzes": page, "next_after": next_after}
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("Error listing quizzes: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,6 +1,6 @@
 # ======= updated schemas.py =======
 from pydantic import BaseModel, EmailStr, validator
-from typing import List, Union, Dict
+from typing import List, Literal, Union, Dict
 from datetime import datetime
 import re
 
@@ -45,12 +45,6 @@ class QuizCheckResponse(BaseModel):
     percentage: float | None = None
     result: Dict[str, Any]
 
-
-class QuizCheckResponse(BaseModel):
-    video_id: str
-    course_title: str 
-    result: Dict
-
 # Video->Quiz
 class VideoToQuizRequest(BaseModel):
     course_title: str
@@ -66,9 +60,49 @@ class VideoToQuizResponse(BaseModel):
     quiz: List[QuizQuestion]
     video_id: str
 
+# Jobs
+class JobStage(BaseModel):
+    name: str
+    status: str
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    duration_ms: float | None = None
+    reason: str | None = None
+    error: str | None = None
+
+class JobSubmittedResponse(BaseModel):
+    job_id: str
+    status: str
+    video_id: str
+    status_url: str
+    events_url: str
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str
+    stages: List[JobStage]
+    result: Dict[str, Any] | None = None
+    error: str | None = None
+    attempts: int = 0
+    created_at: datetime
+    updated_at: datetime
+
+# Certificates
+class CertificateRecipient(BaseModel):
+    name: str
+    percentage: float
+
+class BulkCertificateRequest(BaseModel):
+    video_id: str
+    recipients: List[CertificateRecipient]
+    format: Literal["zip", "pdf"] = "zip"
+    # Leave out recipients below passing_criteria instead of rejecting the batch
+    skip_ineligible: bool = False
+
 # Progress
 class SaveProgressRequest(BaseModel):
-    user_username: str
+    user_email: str
     video_id: str
     progress_time: float
 
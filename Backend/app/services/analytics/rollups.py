@@ -0,0 +1,218 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ReturnDocument, UpdateOne
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.db.client import get_db
+
+logger = get_logger("services.analytics.rollups")
+
+# Rollup collections, updated incrementally as events happen:
+#   analytics_courses      one document per course (_id = video_id)
+#   analytics_course_days  one per course per UTC day (_id = "<video_id>:<YYYY-MM-DD>")
+# Bookkeeping used to count distinct learners without scanning:
+#   analytics_learners     one per (course, learner): first activity, quiz attempts, first
+#                          pass, completion (first pass while enrolled)
+#   analytics_learner_days one per (course, learner, day); expires after `analytics_learner_days_ttl_days`
+QUIZ_RESULTS = "quiz_results"
+COURSES = "analytics_courses"
+COURSE_DAYS = "analytics_course_days"
+LEARNERS = "analytics_learners"
+LEARNER_DAYS = "analytics_learner_days"
+
+
+def day_key(when: datetime) -> str:
+    return when.strftime("%Y-%m-%d")
+
+
+def course_day_id(video_id: str, day: str) -> str:
+    return f"{video_id}:{day}"
+
+
+async def _inc_courses(db, counts: Dict[str, Dict[str, float]], now: datetime) -> None:
+    if counts:
+        await db[COURSES].bulk_write([
+            UpdateOne({"_id": video_id}, {"$inc": inc, "$set": {"updated_at": now}}, upsert=True)
+            for video_id, inc in counts.items()
+        ], ordered=False)
+
+
+async def _inc_course_days(db, counts: Dict[str, Dict[str, float]], day: str, now: datetime) -> None:
+    if counts:
+        await db[COURSE_DAYS].bulk_write([
+            UpdateOne(
+                {"_id": course_day_id(video_id, day)},
+                {"$inc": inc, "$set": {"video_id": video_id, "day": day, "updated_at": now}},
+                upsert=True,
+            )
+            for video_id, inc in counts.items()
+        ], ordered=False)
+
+
+async def _insert_new(collection, ids: List[Tuple[str, Dict[str, Any]]]) -> List[int]:
+    """
+    Upsert marker documents and return the positions of the ones that didn't
+    exist yet (the first time a learner shows up for a course / day).
+    """
+    if not ids:
+        return []
+    result = await collection.bulk_write(
+        [UpdateOne({"_id": _id}, {"$setOnInsert": fields}, upsert=True) for _id, fields in ids],
+        ordered=False,
+    )
+    return list(result.upserted_ids.keys())
+
+
+async def record_activity(pairs: Iterable[Tuple[str, str]], when: Optional[datetime] = None) -> None:
+    """
+    Count (user_email, video_id) pairs as active: a learner's first activity
+    on a course bumps the course's `learners`, their first activity on a day
+    bumps that day's `active_learners`.
+    """
+    pairs = sorted(set(pairs))
+    if not pairs:
+        return
+    db = get_db()
+    now = when or datetime.utcnow()
+    day = day_key(now)
+    expires_at = now + timedelta(days=settings.analytics_learner_days_ttl_days)
+
+    new_learners = await _insert_new(db[LEARNERS], [
+        (f"{video_id}:{user_email}", {"video_id": video_id, "user_email": user_email, "first_active_at": now})
+        for user_email, video_id in pairs
+    ])
+    new_today = await _insert_new(db[LEARNER_DAYS], [
+        (f"{video_id}:{day}:{user_email}", {"video_id": video_id, "day": day, "expires_at": expires_at})
+        for user_email, video_id in pairs
+    ])
+
+    learners = Counter(pairs[i][1] for i in new_learners)
+    active = Counter(pairs[i][1] for i in new_today)
+    await _inc_courses(db, {v: {"learners": n} for v, n in learners.items()}, now)
+    await _inc_course_days(db, {v: {"active_learners": n} for v, n in active.items()}, day, now)
+
+
+async def _mark_completed(db, video_id: str, user_email: str, now: datetime) -> bool:
+    """
+    Mark the learner as having completed the course once they are both
+    enrolled and have passed its quiz, whichever happens last. True only
+    the one time it is marked, so each enrollment completes at most once
+    and `completions` never exceeds `enrollments`.
+    """
+    if not await db["enrollments"].find_one({"user_email": user_email, "video_id": video_id}, {"_id": 1}):
+        return False
+    result = await db[LEARNERS].update_one(
+        {"_id": f"{video_id}:{user_email}", "passed_at": {"$exists": True}, "completed_at": {"$exists": False}},
+        {"$set": {"completed_at": now}},
+    )
+    return result.modified_count == 1
+
+
+async def record_enrollment(video_id: str, user_email: Optional[str] = None) -> None:
+    """
+    Count a new (not re-submitted) enrollment, and a completion if the
+    learner had already passed the course's quiz.
+    """
+    now = datetime.utcnow()
+    db = get_db()
+    inc = {"enrollments": 1}
+    if user_email and await _mark_completed(db, video_id, user_email, now):
+        inc["completions"] = 1
+    await _inc_courses(db, {video_id: inc}, now)
+    await _inc_course_days(db, {video_id: inc}, day_key(now), now)
+
+
+async def record_quiz_result(
+    video_id: str,
+    user_email: Optional[str],
+    evaluation: Dict[str, Any],
+    passing_criteria: float,
+) -> None:
+    """
+    Persist one graded quiz attempt and fold it into the rollups. Attempts
+    without a user_email count towards attempts and averages only; a pass
+    counts as a completion only if the learner is enrolled (or once they
+    enroll).
+    """
+    db = get_db()
+    now = datetime.utcnow()
+    day = day_key(now)
+    percentage = float(evaluation.get("percentage") or 0.0)
+    passed = percentage >= passing_criteria
+
+    await db[QUIZ_RESULTS].insert_one({
+        "video_id": video_id,
+        "user_email": user_email,
+        "marks": evaluation.get("marks"),
+        "total": evaluation.get("total"),
+        "percentage": percentage,
+        "passed": passed,
+        "created_at": now,
+    })
+
+    inc: Dict[str, float] = {"quiz_attempts": 1, "quiz_percentage_sum": percentage, "quiz_passes": int(passed)}
+    course_inc = dict(inc)
+    if user_email:
+        await record_activity([(user_email, video_id)], now)
+        update: Dict[str, Any] = {
+            "$setOnInsert": {"video_id": video_id, "user_email": user_email, "first_active_at": now},
+            "$inc": {"quiz_attempts": 1},
+            "$max": {"best_percentage": percentage},
+        }
+        if passed:
+            update["$min"] = {"passed_at": now}
+        before = await db[LEARNERS].find_one_and_update(
+            {"_id": f"{video_id}:{user_email}"}, update,
+            upsert=True, return_document=ReturnDocument.BEFORE,
+        )
+        before = before or {}
+        if not before.get("quiz_attempts"):
+            course_inc["quiz_takers"] = 1
+        if passed and not before.get("completed_at") and await _mark_completed(db, video_id, user_email, now):
+            course_inc["completions"] = 1
+            inc["completions"] = 1
+
+    await _inc_courses(db, {video_id: course_inc}, now)
+    await _inc_course_days(db, {video_id: inc}, day, now)
+
+
+def _ratio(numerator: float, denominator: float, scale: float = 1.0) -> Optional[float]:
+    return round(numerator / denominator * scale, 2) if denominator else None
+
+
+def course_summary(video_id: str, doc: Optional[Dict[str, Any]], today: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    doc = doc or {}
+    today = today or {}
+    attempts = doc.get("quiz_attempts", 0)
+    return {
+        "video_id": video_id,
+        "enrollments": doc.get("enrollments", 0),
+        "learners": doc.get("learners", 0),
+        "quiz_takers": doc.get("quiz_takers", 0),
+        "completions": doc.get("completions", 0),
+        # Share of enrolled learners who have passed the quiz
+        "completion_rate": _ratio(doc.get("completions", 0), doc.get("enrollments", 0), 100),
+        "quiz_attempts": attempts,
+        "average_quiz_percentage": _ratio(doc.get("quiz_percentage_sum", 0.0), attempts),
+        "quiz_pass_rate": _ratio(doc.get("quiz_passes", 0), attempts, 100),
+        "active_learners_today": today.get("active_learners", 0),
+        "updated_at": doc.get("updated_at"),
+    }
+
+
+def day_summary(video_id: str, day: str, doc: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    doc = doc or {}
+    attempts = doc.get("quiz_attempts", 0)
+    return {
+        "video_id": video_id,
+        "day": day,
+        "active_learners": doc.get("active_learners", 0),
+        "enrollments": doc.get("enrollments", 0),
+        "completions": doc.get("completions", 0),
+        "quiz_attempts": attempts,
+        "average_quiz_percentage": _ratio(doc.get("quiz_percentage_sum", 0.0), attempts),
+        "quiz_pass_rate": _ratio(doc.get("quiz_passes", 0), attempts, 100),
+    }
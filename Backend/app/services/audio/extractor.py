@@ -1,23 +1,105 @@
 import os
-from moviepy import VideoFileClip
+import shutil
+import subprocess
+from functools import lru_cache
+from app.core.config import settings
 from app.core.logger import get_logger
 
 logger = get_logger("services.audio.extractor")
 
+# Whisper works on 16 kHz mono; extracting straight to that format means the
+# transcriber never has to decode or resample again.
+SAMPLE_RATE = 16000
+
+
+@lru_cache(maxsize=1)
+def ffmpeg_binary() -> str:
+    """
+    Resolve the ffmpeg executable: `settings.ffmpeg_binary`, then ffmpeg on
+    PATH, then the binary bundled with imageio-ffmpeg.
+    """
+    if settings.ffmpeg_binary:
+        return settings.ffmpeg_binary
+    found = shutil.which("ffmpeg")
+    if found:
+        return found
+    try:
+        import imageio_ffmpeg  # type: ignore
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception as e:
+        raise RuntimeError("ffmpeg not found. Install ffmpeg or set FFMPEG_BINARY.") from e
+
+
+def audio_extension() -> str:
+    """File extension produced by the configured extractor backend."""
+    return ".mp3" if settings.audio_extractor == "moviepy" else ".wav"
+
+
+def _ffmpeg_command(video_path: str, output: str, fmt: str) -> list:
+    return [
+        ffmpeg_binary(),
+        "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+        "-i", video_path,
+        "-map", "0:a:0",        # first audio stream only, video is never decoded
+        "-vn", "-sn", "-dn",
+        "-ac", "1",
+        "-ar", str(SAMPLE_RATE),
+        "-c:a", "pcm_s16le",
+        "-f", fmt,
+        output,
+    ]
+
+
+def _run_ffmpeg(cmd: list, video_path: str) -> bytes:
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        stderr = proc.stderr.decode("utf-8", errors="replace").strip()
+        logger.error("ffmpeg failed for %s: %s", video_path, stderr)
+        if "matches no streams" in stderr:
+            raise RuntimeError("No audio track present in video")
+        raise RuntimeError(f"ffmpeg failed: {stderr}")
+    return proc.stdout
+
+
+def _extract_with_ffmpeg(video_path: str, audio_path: str) -> None:
+    _run_ffmpeg(_ffmpeg_command(video_path, audio_path, "wav"), video_path)
+
+
+def _extract_with_moviepy(video_path: str, audio_path: str) -> None:
+    from moviepy import VideoFileClip
+
+    with VideoFileClip(video_path) as clip:
+        if clip.audio is None:
+            logger.error("No audio track present in video: %s", video_path)
+            raise RuntimeError("No audio track present in video")
+        clip.audio.write_audiofile(audio_path)
+
+
 def extract_audio(video_path: str, audio_path: str) -> None:
     """
     Extract audio from `video_path` and save to `audio_path`.
+    The "ffmpeg" backend demuxes only the audio stream to 16 kHz mono WAV;
+    "moviepy" is the older full-decode path writing MP3.
     This is synchronous (use asyncio.to_thread to call from async).
     """
-    logger.info("extract_audio: %s -> %s", video_path, audio_path)
+    logger.info("extract_audio (%s): %s -> %s", settings.audio_extractor, video_path, audio_path)
 
     if not os.path.isfile(video_path):
         logger.error("Video file missing: %s", video_path)
         raise FileNotFoundError(f"Video not found: {video_path}")
 
-    with VideoFileClip(video_path) as clip:
-        if clip.audio is None:
-            logger.error("No audio track present in video: %s", video_path)
-            raise RuntimeError("No audio track present in video")
-        clip.audio.write_audiofile(audio_path)
+    if settings.audio_extractor == "moviepy":
+        _extract_with_moviepy(video_path, audio_path)
+    else:
+        _extract_with_ffmpeg(video_path, audio_path)
     logger.info("Audio written: %s", audio_path)
+
+
+def read_pcm(video_path: str) -> bytes:
+    """
+    Decode the audio track of `video_path` to raw 16 kHz mono signed 16-bit
+    PCM through a pipe, without writing a temp file.
+    """
+    if not os.path.isfile(video_path):
+        raise FileNotFoundError(f"Video not found: {video_path}")
+    return _run_ffmpeg(_ffmpeg_command(video_path, "pipe:1", "s16le"), video_path)
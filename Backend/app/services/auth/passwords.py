@@ -0,0 +1,62 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.metrics import Family, register_collector
+
+logger = get_logger("services.auth.passwords")
+
+pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many hash/verify calls are already queued."""
+
+
+# bcrypt releases the GIL while hashing, so threads give real parallelism
+_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt"
+)
+# Calls running or waiting on the executor. Only touched from the event loop.
+_pending = 0
+
+
+async def _run(fn, *args):
+    global _pending
+    if _pending >= settings.password_hash_queue_limit:
+        logger.warning("Password hasher saturated (%d pending), rejecting", _pending)
+        raise PasswordHasherBusy(f"{_pending} password operations pending")
+    _pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+    finally:
+        _pending -= 1
+
+
+async def hash_password(password: str) -> str:
+    """bcrypt-hash `password` off the event loop."""
+    return await _run(pwd_ctx.hash, password)
+
+
+async def verify_password(password: str, hashed: Optional[str]) -> bool:
+    """Check `password` against a stored bcrypt hash off the event loop."""
+    if not hashed:
+        return False
+    return await _run(pwd_ctx.verify, password, hashed)
+
+
+def pending() -> int:
+    return _pending
+
+
+def shutdown() -> None:
+    _executor.shutdown(wait=False, cancel_futures=True)
+
+
+register_collector(lambda: [
+    Family("password_hasher_pending", "gauge", "bcrypt hash/verify calls running or queued", [({}, _pending)])
+])
@@ -0,0 +1,140 @@
+import time
+from typing import Any, Dict, Optional
+
+from bson import json_util
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.metrics import register_collector, stats_families
+
+logger = get_logger("services.auth.user_cache")
+
+# Decoded JWT claims, keyed by token. Tokens are immutable, so these only
+# need to expire with the token itself.
+_claims = TTLCache(settings.user_cache_max_entries, settings.access_token_expire_minutes * 60)
+# User documents keyed by email, used when no shared store is configured
+_users = TTLCache(settings.user_cache_max_entries, settings.user_cache_ttl_seconds)
+
+# Shared store client, created by connect() from the app lifespan
+_redis = None
+_redis_stats = {"hits": 0, "misses": 0, "errors": 0}
+
+
+async def connect() -> None:
+    """Create the Redis client when `user_cache_redis_url` is configured."""
+    global _redis
+    if not settings.user_cache_redis_url or _redis is not None:
+        return
+    try:
+        import redis.asyncio as redis_asyncio  # type: ignore
+        _redis = redis_asyncio.from_url(settings.user_cache_redis_url)
+        logger.info("User cache backed by shared Redis store")
+    except Exception as e:
+        logger.warning("Redis client import failed, using in-process user cache: %s", e)
+        _redis = None
+
+
+async def close() -> None:
+    global _redis
+    if _redis is not None:
+        # redis-py >= 5 names it aclose(), older releases close()
+        await getattr(_redis, "aclose", _redis.close)()
+        _redis = None
+
+_REDIS_PREFIX = "learning_academy:user:"
+
+
+def _seconds_until(exp: Any) -> Optional[float]:
+    if isinstance(exp, (int, float)):
+        return exp - time.time()
+    return None
+
+
+def get_claims(token: str) -> Optional[Dict[str, Any]]:
+    return _claims.get(token)
+
+
+def put_claims(token: str, claims: Dict[str, Any]) -> None:
+    _claims.set(token, claims, ttl=_seconds_until(claims.get("exp")))
+
+
+async def get_user(email: str) -> Optional[Dict[str, Any]]:
+    """
+    Cached user document for `email`, or None on a miss. With a shared store
+    configured, user documents live only there so an invalidation from any
+    worker is seen by all of them.
+    """
+    if _redis is None:
+        return _users.get(email)
+    try:
+        raw = await _redis.get(_REDIS_PREFIX + email)
+    except Exception as e:
+        _redis_stats["errors"] += 1
+        logger.warning("Shared user cache read failed: %s", e)
+        return None
+    if raw is None:
+        _redis_stats["misses"] += 1
+        return None
+    _redis_stats["hits"] += 1
+    return json_util.loads(raw)
+
+
+async def put_user(email: str, user: Dict[str, Any], exp: Any = None) -> None:
+    """
+    Cache `user` (without its password hash) for at most user_cache_ttl_seconds
+    and never beyond the expiry of the token it was looked up for.
+    """
+    cached = {k: v for k, v in user.items() if k != "password"}
+    ttl = settings.user_cache_ttl_seconds
+    remaining = _seconds_until(exp)
+    if remaining is not None:
+        ttl = min(ttl, remaining)
+    if ttl <= 0:
+        return
+
+    if _redis is None:
+        _users.set(email, cached, ttl=ttl)
+        return
+    try:
+        await _redis.set(_REDIS_PREFIX + email, json_util.dumps(cached), ex=max(1, int(ttl)))
+    except Exception as e:
+        _redis_stats["errors"] += 1
+        logger.warning("Shared user cache write failed: %s", e)
+
+
+async def invalidate_user(email: str) -> None:
+    """Drop the cached document for `email`; call after any change to the user."""
+    _users.delete(email)
+    if _redis is not None:
+        try:
+            await _redis.delete(_REDIS_PREFIX + email)
+        except Exception as e:
+            _redis_stats["errors"] += 1
+            logger.warning("Shared user cache invalidation failed: %s", e)
+
+
+def stats() -> Dict[str, Any]:
+    users = _users.stats() if _redis is None else {
+        **_redis_stats,
+        "hit_rate": round(_redis_stats["hits"] / max(1, _redis_stats["hits"] + _redis_stats["misses"]), 4),
+    }
+    return {
+        "backend": "redis" if _redis is not None else "memory",
+        "claims": _claims.stats(),
+        "users": users,
+    }
+
+
+def _collect_metrics():
+    current = stats()
+    return (
+        stats_families("user_cache_claims", "Token claims cache", current["claims"], counters=("hits", "misses"))
+        + stats_families(
+            "user_cache_users", f"User document cache ({current['backend']})", current["users"],
+            counters=("hits", "misses", "errors"),
+        )
+    )
+
+
+register_collector(_collect_metrics)
@@ -0,0 +1,137 @@
+import io
+import os
+import time
+import uuid
+import asyncio
+import zipfile
+from typing import AsyncIterator, List
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger("services.certificate.bundle")
+
+_READ_CHUNK = 256 * 1024
+# Certificates added to the merged PDF per incremental save
+_MERGE_BATCH = 50
+
+
+class _Spool(io.RawIOBase):
+    """Write-only, unseekable sink that hands back whatever was written since the last drain."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def safe_filename(text: str) -> str:
+    """`text` with anything but letters, digits, '-', '_' and '.' replaced by '_'."""
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in text.strip())
+
+
+def certificate_filenames(names: List[str]) -> List[str]:
+    """certificate_<name>.pdf per name, numbered when names repeat."""
+    seen = {}
+    filenames = []
+    for name in names:
+        base = "certificate_" + safe_filename(name)
+        seen[base] = seen.get(base, 0) + 1
+        filenames.append(f"{base}.pdf" if seen[base] == 1 else f"{base}_{seen[base]}.pdf")
+    return filenames
+
+
+async def zip_stream(pdfs: AsyncIterator[bytes], filenames: List[str]) -> AsyncIterator[bytes]:
+    """
+    Stream a ZIP of the PDFs as they arrive. Entries are written with data
+    descriptors (the archive is never seeked), so only the entry being
+    compressed is held in memory.
+    """
+    spool = _Spool()
+    date_time = time.localtime()[:6]
+    with zipfile.ZipFile(spool, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        index = 0
+        async for pdf in pdfs:
+            info = zipfile.ZipInfo(filenames[index], date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            await asyncio.to_thread(archive.writestr, info, pdf)
+            index += 1
+            yield spool.drain()
+    # Central directory, written on close
+    yield spool.drain()
+
+
+def _append_batch(path: str, batch: List[bytes], first: bool) -> None:
+    """
+    Add the PDFs to the document at `path`: the first batch creates it,
+    later ones are appended with an incremental save, which writes only the
+    new objects at the end of the file without loading the earlier pages.
+    """
+    import fitz  # PyMuPDF
+
+    merged = fitz.open() if first else fitz.open(path)
+    try:
+        for pdf in batch:
+            with fitz.open(stream=pdf, filetype="pdf") as doc:
+                merged.insert_pdf(doc)
+        if first:
+            # Objects shared by every page, like the template's fonts, are stored once
+            merged.save(path, garbage=3, deflate=True)
+        else:
+            merged.saveIncr()
+    finally:
+        merged.close()
+
+
+def _read_chunk(f) -> bytes:
+    return f.read(_READ_CHUNK)
+
+
+async def merged_pdf_stream(pdfs: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Merge the PDFs into one document and stream it. A PDF's cross-reference
+    table comes last, so the document is built in a temp file first,
+    `_MERGE_BATCH` certificates at a time (memory stays bounded however many
+    there are); that file is then streamed from disk and removed.
+    """
+    os.makedirs(settings.tmp_dir, exist_ok=True)
+    path = os.path.join(settings.tmp_dir, f"certificates_{uuid.uuid4().hex}.pdf")
+    try:
+        batch: List[bytes] = []
+        first = True
+        async for pdf in pdfs:
+            batch.append(pdf)
+            if len(batch) == _MERGE_BATCH:
+                await asyncio.to_thread(_append_batch, path, batch, first)
+                batch, first = [], False
+        if batch:
+            await asyncio.to_thread(_append_batch, path, batch, first)
+        elif first:
+            return
+
+        f = await asyncio.to_thread(open, path, "rb")
+        try:
+            while True:
+                chunk = await asyncio.to_thread(_read_chunk, f)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            await asyncio.to_thread(f.close)
+    finally:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Could not remove merged certificate file %s: %s", path, e)
@@ -1,78 +1,134 @@
 import os
+import asyncio
 from datetime import datetime
-import fitz  # PyMuPDF
+from collections import deque
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
 from app.core.config import settings
 from app.core.logger import get_logger
 from app.db.client import get_db
+from app.services.certificate.renderer import (
+    TEMPLATE_FILENAME,
+    certificate_key,
+    get_certificate_renderer,
+)
 
 logger = get_logger("services.certificate.generator")
 
 
+async def get_certificate_course(video_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the course fields a certificate needs (title and passing criteria),
+    or None if there is no such course.
+    """
+    courses = get_db()["courses"]
+    course_doc = await courses.find_one(
+        {"video_id": video_id}, {"_id": 0, "course_title": 1, "passing_criteria": 1}
+    )
+    if not course_doc:
+        return None
+
+    return {
+        "course_title": course_doc.get("course_title", "Unknown Course"),
+        "passing_criteria": course_doc.get("passing_criteria", 0),
+    }
+
+
+def check_passing(user_name: str, user_percentage: float, passing_criteria: float) -> None:
+    if user_percentage < passing_criteria:
+        logger.warning(
+            "User %s did not meet passing criteria. Required=%s, Got=%s",
+            user_name, passing_criteria, user_percentage
+        )
+        raise Exception(
+            f"User {user_name} did not meet passing criteria ({passing_criteria}%). "
+            "Certificate cannot be issued."
+        )
+
+
+def certificate_date() -> str:
+    return datetime.now().strftime("%B %d, %Y")
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
 async def generate_certificate(
     video_id: str,
     user_name: str,
     user_percentage: float,
-    template_filename: str = "Certificate_Template_Blank.pdf"
+    template_filename: str = TEMPLATE_FILENAME
 ) -> str:
+    """
+    Issue a certificate and return the path of the PDF. Files are named
+    after a hash of the template and the printed fields, so users who share
+    a name never overwrite each other's certificate, and re-issuing the same
+    certificate on the same day reuses the existing file.
+    """
     logger.info("Starting certificate generation", extra={
         "video_id": video_id,
         "user_name": user_name,
         "user_percentage": user_percentage
     })
 
-    # Retrieve course details from DB
-    db = get_db()
-    courses = db["courses"]
-    course_doc = await courses.find_one({"video_id": video_id})
-
-    if not course_doc:
+    course = await get_certificate_course(video_id)
+    if course is None:
         logger.error("Course not found for video_id=%s", video_id)
         raise Exception(f"Course not found for video_id {video_id}")
-
-    course_name = course_doc.get("course_title", "Unknown Course")
-    passing_criteria = course_doc.get("passing_criteria", 0)
+    course_name = course["course_title"]
+    passing_criteria = course["passing_criteria"]
     logger.info(
         "Course found: %s (passing criteria: %s%%)",
         course_name, passing_criteria
     )
 
     # Check if user meets passing criteria
-    if user_percentage < passing_criteria:
-        logger.warning(
-            "User %s did not meet passing criteria. Required=%s, Got=%s",
-            user_name, passing_criteria, user_percentage
-        )
-        raise Exception(
-            f"User {user_name} did not meet passing criteria ({passing_criteria}%). "
-            "Certificate cannot be issued."
-        )
+    check_passing(user_name, user_percentage, passing_criteria)
+
+    date_str = certificate_date()
+    key = certificate_key(user_name, course_name, date_str, template_filename)
+    output_path = os.path.join(settings.certificates_dir, f"{key}.pdf")
+    if os.path.exists(output_path):
+        logger.info("Reusing certificate for %s at %s", user_name, output_path)
+        return output_path
 
-    base_dir = os.path.dirname(__file__)
-    template_path = os.path.join(base_dir, template_filename)
-    if not os.path.exists(template_path):
-        logger.error("Certificate template not found: %s", template_path)
-        raise FileNotFoundError(f"Certificate template not found at {template_path}")
+    pdf = await get_certificate_renderer().render(user_name, course_name, date_str, template_filename)
 
     os.makedirs(settings.certificates_dir, exist_ok=True)
-    date_str = datetime.now().strftime("%B %d, %Y")
-    safe_name = user_name.replace(" ", "_")
-    output_path = os.path.join(settings.certificates_dir, f"certificate_{safe_name}.pdf")
+    await asyncio.to_thread(_write_atomic, output_path, pdf)
 
-    logger.debug("Using template: %s", template_path)
-    logger.debug("Output path: %s", output_path)
+    logger.info("Certificate successfully generated for %s at %s", user_name, output_path)
+    return output_path
 
-    doc = fitz.open(template_path)
-    page = doc[0]
 
-    # Insert text at positions
-    logger.debug("Inserting text into certificate PDF")
-    page.insert_text((330, 305), user_name, fontsize=22, fontname="helv", fill=(0, 0, 0))
-    page.insert_text((320, 370), course_name, fontsize=18, fontname="helv", fill=(0, 0, 0))
-    page.insert_text((400, 410), date_str, fontsize=14, fontname="helv", fill=(0, 0, 0))
-    page.insert_text((170, 440), "Muhammad Aktar", fontsize=14, fontname="helv", fill=(0, 0, 0))
+async def render_certificates(
+    names: Iterable[str], course_name: str, date_str: str, window: int
+) -> AsyncIterator[bytes]:
+    """
+    Render a certificate per name and yield the PDFs in order. At most
+    `window` renders are in flight, so memory stays bounded however many
+    names there are; renders still pending when the consumer stops are
+    cancelled.
+    """
+    renderer = get_certificate_renderer()
+    names = iter(names)
+    pending: deque = deque()
 
-    doc.save(output_path)
-    doc.close()
+    def submit() -> None:
+        name = next(names, None)
+        if name is not None:
+            pending.append(asyncio.ensure_future(renderer.render(name, course_name, date_str)))
 
-    logger.info("Certificate successfully generated for %s at %s", user_name, output_path)
-    return output_path
+    for _ in range(max(1, window)):
+        submit()
+    try:
+        while pending:
+            pdf = await pending.popleft()
+            submit()
+            yield pdf
+    finally:
+        for future in pending:
+            future.cancel()
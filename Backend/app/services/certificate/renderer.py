@@ -0,0 +1,138 @@
+import os
+import asyncio
+import hashlib
+import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger("services.certificate.renderer")
+
+TEMPLATE_FILENAME = "Certificate_Template_Blank.pdf"
+SIGNATORY = "Muhammad Aktar"
+
+# Set inside each worker process by _init_worker
+_template: Optional[bytes] = None
+
+
+@lru_cache(maxsize=4)
+def template_bytes(template_filename: str = TEMPLATE_FILENAME) -> bytes:
+    """Read a certificate template once and keep it in memory."""
+    template_path = os.path.join(os.path.dirname(__file__), template_filename)
+    if not os.path.exists(template_path):
+        logger.error("Certificate template not found: %s", template_path)
+        raise FileNotFoundError(f"Certificate template not found at {template_path}")
+    with open(template_path, "rb") as f:
+        return f.read()
+
+
+def render_pdf(template: bytes, user_name: str, course_name: str, date_str: str) -> bytes:
+    """Fill the template's name, course, date and signatory; return the PDF bytes."""
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(stream=template, filetype="pdf")
+    try:
+        page = doc[0]
+        page.insert_text((330, 305), user_name, fontsize=22, fontname="helv", fill=(0, 0, 0))
+        page.insert_text((320, 370), course_name, fontsize=18, fontname="helv", fill=(0, 0, 0))
+        page.insert_text((400, 410), date_str, fontsize=14, fontname="helv", fill=(0, 0, 0))
+        page.insert_text((170, 440), SIGNATORY, fontsize=14, fontname="helv", fill=(0, 0, 0))
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def _init_worker(template: bytes) -> None:
+    global _template
+    import fitz  # noqa: F401  (import once per worker, not per certificate)
+
+    _template = template
+
+
+def _render_in_worker(user_name: str, course_name: str, date_str: str, template: Optional[bytes] = None) -> bytes:
+    return render_pdf(template or _template, user_name, course_name, date_str)
+
+
+def certificate_key(user_name: str, course_name: str, date_str: str, template_filename: str = TEMPLATE_FILENAME) -> str:
+    """
+    Content address of a certificate: the same template and fields always
+    give the same key. (The PDF bytes themselves aren't reproducible, since
+    PyMuPDF writes a fresh document ID on every save.)
+    """
+    h = hashlib.sha256(template_bytes(template_filename))
+    for field in (user_name, course_name, date_str):
+        h.update(b"\0" + field.encode("utf-8"))
+    return h.hexdigest()
+
+
+class CertificateRenderer:
+    """
+    Renders certificates on a pool of worker processes that each hold the
+    template bytes, so PyMuPDF never runs on the event loop and the template
+    is never re-read from disk. With `workers=0` rendering happens on a
+    thread of the current process instead.
+    """
+
+    def __init__(self, workers: int, template_filename: str = TEMPLATE_FILENAME):
+        self.template_filename = template_filename
+        self.workers = workers
+        self._executor = None
+        if workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(template_bytes(template_filename),),
+            )
+        logger.info("Certificate renderer: %s", f"{workers} worker processes" if workers else "in-process")
+
+    async def render(
+        self, user_name: str, course_name: str, date_str: str, template_filename: Optional[str] = None
+    ) -> bytes:
+        """
+        Render one certificate and return the PDF bytes. Templates other than
+        the pool's own are shipped to the worker with the call.
+        """
+        template_filename = template_filename or self.template_filename
+        if self._executor is None:
+            return await asyncio.to_thread(
+                render_pdf, template_bytes(template_filename), user_name, course_name, date_str
+            )
+        other = template_bytes(template_filename) if template_filename != self.template_filename else None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, _render_in_worker, user_name, course_name, date_str, other
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_renderer: Optional[CertificateRenderer] = None
+_renderer_lock = threading.Lock()
+
+
+def get_certificate_renderer() -> CertificateRenderer:
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            workers = settings.certificate_workers
+            if workers < 0:
+                workers = 0
+            elif workers == 0:
+                workers = min(4, os.cpu_count() or 1)
+            _renderer = CertificateRenderer(workers)
+        return _renderer
+
+
+def shutdown_certificate_renderer() -> None:
+    global _renderer
+    with _renderer_lock:
+        if _renderer is not None:
+            _renderer.shutdown()
+            _renderer = None
@@ -0,0 +1,160 @@
+import os
+import json
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.db.client import get_db
+from app.db.indexes import normalize_title
+from app.services.audio.extractor import audio_extension, extract_audio, read_pcm
+from app.services.transcribe.transcriber import transcribe_segments, transcribe_pcm_segments
+from app.services.quiz.generator import generate_quiz, quiz_cache_key, QUIZ_MODEL
+from app.services.quiz.cache import get_cached_quiz, put_cached_quiz
+from app.services.quiz.parser import parse_raw_quiz, normalize_quiz
+from app.services.jobs.store import VIDEO_TO_QUIZ, track_stage, skip_stage
+from app.services.storage.artifacts import get_artifact_store
+
+logger = get_logger("services.jobs.pipeline")
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Could not remove temp file %s: %s", path, e)
+
+
+def _temp_paths(params: Dict[str, Any]) -> Tuple[str, str]:
+    """The uploaded video and the scratch audio file extracted from it."""
+    video_path = params["video_path"]
+    # Chosen here rather than by the API, which doesn't import the extractor
+    return video_path, params.get("audio_path") or os.path.splitext(video_path)[0] + audio_extension()
+
+
+def discard_video_to_quiz(job: Dict[str, Any]) -> None:
+    """Remove the temp files of a job that will not run again (e.g. out of attempts)."""
+    for path in _temp_paths(job["params"]):
+        _remove_quietly(path)
+
+
+async def run_video_to_quiz(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run extract -> transcribe -> generate -> insert for an uploaded video and
+    return the job result. Extract/transcribe are skipped when their output
+    is already in the artifact store for this video's content hash, and
+    generate when the quiz cache has a quiz for the same transcript and
+    question count (unless `force_regenerate` is set). Temp files are removed
+    once the job has finished, successfully or not.
+    """
+    job_id = job["job_id"]
+    params = job["params"]
+    video_path, scratch_audio_path = _temp_paths(params)
+    audio_path = scratch_audio_path
+    num_questions = params["num_questions"]
+    digest = params.get("video_sha256")
+    artifacts = get_artifact_store()
+    audio_name = "audio" + os.path.splitext(audio_path)[1]
+
+    async def cached(name: str, loader):
+        if digest is None:
+            return None
+        return await asyncio.to_thread(loader, digest, name)
+
+    try:
+        cached_transcript = await cached("transcript.json", artifacts.get_text)
+        transcription = json.loads(cached_transcript) if cached_transcript else None
+        if transcription is None and settings.audio_pipe_to_transcriber:
+            async with track_stage(job_id, "extract"):
+                pcm = await asyncio.to_thread(read_pcm, video_path)
+            async with track_stage(job_id, "transcribe"):
+                transcription = await transcribe_pcm_segments(pcm)
+                del pcm
+                if digest is not None:
+                    await asyncio.to_thread(
+                        artifacts.put_text, digest, "transcript.json", json.dumps(transcription)
+                    )
+        elif transcription is None:
+            cached_audio = await cached(audio_name, artifacts.get_path)
+            if cached_audio is None:
+                async with track_stage(job_id, "extract"):
+                    await asyncio.to_thread(extract_audio, video_path, audio_path)
+                    if digest is not None:
+                        audio_path = await asyncio.to_thread(
+                            artifacts.put_file, digest, audio_name, audio_path
+                        )
+            else:
+                audio_path = cached_audio
+                await skip_stage(job_id, "extract")
+
+            async with track_stage(job_id, "transcribe"):
+                transcription = await transcribe_segments(audio_path)
+                if digest is not None:
+                    await asyncio.to_thread(
+                        artifacts.put_text, digest, "transcript.json", json.dumps(transcription)
+                    )
+        else:
+            await skip_stage(job_id, "extract")
+            await skip_stage(job_id, "transcribe")
+        transcript = transcription["text"]
+
+        quiz_key = quiz_cache_key(transcript, num_questions)
+        raw_quiz = None if params.get("force_regenerate") else await get_cached_quiz(quiz_key)
+        if raw_quiz is None:
+            async with track_stage(job_id, "generate"):
+                raw_quiz = await generate_quiz(transcript, num_questions)
+                # An empty quiz is worth retrying, so don't cache it
+                if parse_raw_quiz(raw_quiz):
+                    await put_cached_quiz(quiz_key, raw_quiz, model=QUIZ_MODEL, num_questions=num_questions)
+        else:
+            await skip_stage(job_id, "generate")
+
+        async with track_stage(job_id, "insert"):
+            normalized_quiz = normalize_quiz(raw_quiz)
+            course_doc = {
+                "video_id": params["video_id"],
+                "course_title": params["course_title"],
+                "course_title_normalized": normalize_title(params["course_title"]),
+                "course_video_name": params["course_video_name"],
+                "transcript": transcript,
+                "transcript_segments": transcription["segments"],
+                "passing_criteria": params["passing_criteria"],
+                # store the raw value returned by generator (string or parsed) for fidelity
+                "quiz": raw_quiz,
+                "normalized_quiz": normalized_quiz,
+                "quiz_answers": [item["answer"] for item in normalized_quiz],
+                "created_at": datetime.utcnow(),
+            }
+            # Upsert: a rerun of a job whose worker died after this write
+            # finds the course already there instead of a duplicate key
+            await get_db()["courses"].update_one(
+                {"video_id": params["video_id"]}, {"$setOnInsert": course_doc}, upsert=True
+            )
+    except asyncio.CancelledError:
+        # Keep the temp files so the job can be resumed after a restart
+        raise
+    except Exception:
+        _remove_quietly(video_path)
+        _remove_quietly(scratch_audio_path)
+        raise
+    _remove_quietly(video_path)
+    _remove_quietly(scratch_audio_path)
+
+    return {
+        "video_id": params["video_id"],
+        "course_title": params["course_title"],
+        "num_questions": len(normalized_quiz),
+    }
+
+
+HANDLERS = {
+    VIDEO_TO_QUIZ: run_video_to_quiz,
+}
+
+# Called instead of the handler for a job that is given up on
+DISCARDS = {
+    VIDEO_TO_QUIZ: discard_video_to_quiz,
+}
@@ -0,0 +1,175 @@
+import os
+import socket
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger, request_id_var
+from app.services.jobs import store
+
+logger = get_logger("services.jobs.pool")
+
+
+class JobPool:
+    """
+    Bounded pool of asyncio workers that claim jobs from the Mongo-backed
+    queue (the `jobs` collection) and run them.
+
+    Everything a worker needs lives in the job document, so any process with
+    a pool can run any job: the API itself in the "all" role, or separate
+    `python -m app.worker` processes. A claimed job is leased to this process
+    and the lease renewed while it runs; if the process dies the lease lapses
+    and the job is claimed again, up to `max_attempts` times.
+    """
+
+    def __init__(self, workers: int, poll_interval: float, lease_seconds: float, max_attempts: int):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._handlers: Dict[str, Any] = {}
+        self._discards: Dict[str, Any] = {}
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        # The pipeline pulls in the media stack, so only processes that run
+        # jobs import it
+        from app.services.jobs.pipeline import DISCARDS, HANDLERS
+
+        self._handlers = HANDLERS
+        self._discards = DISCARDS
+        for i in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker(i), name=f"job-worker-{i}"))
+        logger.info("Job pool %s started with %d workers", self.worker_id, self.workers)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        logger.info("Job pool stopped")
+
+    def notify(self) -> None:
+        """Wake idle workers now instead of at their next poll, e.g. after queueing a job."""
+        self._wakeup.set()
+
+    async def _next_job(self) -> Dict[str, Any]:
+        while True:
+            self._wakeup.clear()
+            try:
+                job = await store.claim_job(self.worker_id, self.lease_seconds)
+            except Exception as e:
+                logger.warning("Could not claim a job: %s", e)
+                job = None
+            if job is not None:
+                return job
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._next_job()
+            try:
+                await self._run(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Worker %d crashed on job %s", index, job["job_id"])
+
+    async def _keep_lease(self, job_id: str, task: asyncio.Task) -> None:
+        """
+        Renew the job's lease while `task` runs it. A failed renewal (e.g. a
+        short Mongo outage) is retried until the lease would have lapsed;
+        once the lease is lost another worker may claim the job, so `task`
+        is cancelled and this returns.
+        """
+        loop = asyncio.get_running_loop()
+        renewed_at = loop.time()
+        interval = self.lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                held = await store.renew_lease(job_id, self.worker_id, self.lease_seconds)
+            except Exception as e:
+                if loop.time() - renewed_at < self.lease_seconds:
+                    logger.warning("Could not renew the lease on job %s, retrying: %s", job_id, e)
+                    interval = min(self.lease_seconds / 10, 5.0)
+                    continue
+                held = False
+            if not held:
+                logger.warning("Lost the lease on job %s, stopping it", job_id)
+                task.cancel()
+                return
+            renewed_at = loop.time()
+            interval = self.lease_seconds / 3
+
+    async def _run(self, job: Dict[str, Any]) -> None:
+        job_id = job["job_id"]
+        handler = self._handlers.get(job["kind"])
+        if handler is None:
+            await store.set_status(
+                job_id, store.FAILED, worker_id=self.worker_id, error=f"Unknown job kind: {job['kind']}"
+            )
+            return
+        if job["attempts"] > self.max_attempts:
+            await store.set_status(
+                job_id, store.FAILED, worker_id=self.worker_id,
+                error=f"Gave up after {self.max_attempts} attempts",
+            )
+            discard = self._discards.get(job["kind"])
+            if discard is not None:
+                try:
+                    await asyncio.to_thread(discard, job)
+                except Exception as e:
+                    logger.warning("Could not clean up abandoned job %s: %s", job_id, e)
+            return
+        if job["attempts"] > 1:
+            logger.info("Retrying job %s (attempt %d)", job_id, job["attempts"])
+
+        # Log lines of the job's stages carry its id
+        request_id = request_id_var.set(job_id)
+        # The handler runs as its own task so losing the lease can stop it
+        task = asyncio.create_task(handler(job))
+        lease = asyncio.create_task(self._keep_lease(job_id, task))
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if lease.done() and not lease.cancelled() and not asyncio.current_task().cancelling():
+                # The job belongs to whichever worker claimed it since
+                logger.warning("Abandoned job %s after losing its lease", job_id)
+                return
+            # Shutting down: hand the job back so another worker can run it
+            await store.release_job(job_id, self.worker_id)
+            logger.info("Released job %s", job_id)
+            raise
+        except Exception as e:
+            logger.exception("Job %s failed: %s", job_id, e)
+            if not await store.set_status(job_id, store.FAILED, worker_id=self.worker_id, error=str(e)):
+                logger.warning("Lease on job %s lapsed before it failed; outcome discarded", job_id)
+        else:
+            if await store.set_status(job_id, store.SUCCEEDED, worker_id=self.worker_id, result=result):
+                logger.info("Job %s succeeded", job_id)
+            else:
+                logger.warning("Lease on job %s lapsed before it finished; result discarded", job_id)
+        finally:
+            lease.cancel()
+            request_id_var.reset(request_id)
+
+
+_pool: Optional[JobPool] = None
+
+
+def get_job_pool() -> JobPool:
+    global _pool
+    if _pool is None:
+        _pool = JobPool(
+            settings.job_workers,
+            settings.job_poll_interval,
+            settings.job_lease_seconds,
+            settings.job_max_attempts,
+        )
+    return _pool
@@ -0,0 +1,192 @@
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from pymongo import ReturnDocument
+
+from app.db.client import get_db
+from app.core.logger import get_logger
+from app.core.metrics import Counter, Family, Histogram, register_collector
+
+logger = get_logger("services.jobs.store")
+
+JOB_STAGE_SECONDS = Histogram(
+    "job_stage_duration_seconds", "Time spent in each pipeline stage", ("stage", "status")
+)
+JOB_STAGES_SKIPPED = Counter("job_stages_skipped_total", "Pipeline stages whose output was reused", ("stage",))
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+SKIPPED = "skipped"
+TERMINAL_STATUSES = (SUCCEEDED, FAILED)
+
+VIDEO_TO_QUIZ = "video_to_quiz"
+VIDEO_TO_QUIZ_STAGES = ["extract", "transcribe", "generate", "insert"]
+
+_PUBLIC_FIELDS = {"_id": 0, "params.video_path": 0, "params.audio_path": 0}
+
+
+def _jobs():
+    return get_db()["jobs"]
+
+
+async def create_job(kind: str, params: Dict[str, Any], stages: List[str]) -> Dict[str, Any]:
+    """
+    Persist a new job in `queued` state with one pending entry per stage.
+    """
+    now = datetime.utcnow()
+    job = {
+        "job_id": uuid.uuid4().hex,
+        "kind": kind,
+        "status": QUEUED,
+        "params": params,
+        "stages": [{"name": name, "status": "pending"} for name in stages],
+        "result": None,
+        "error": None,
+        "attempts": 0,
+        "created_at": now,
+        "updated_at": now,
+    }
+    await _jobs().insert_one(job)
+    job.pop("_id", None)
+    return job
+
+
+async def get_job(job_id: str, public: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Return the job document. `public=True` hides internal fields such as
+    temp file paths so the document can be sent to clients as-is.
+    """
+    projection = _PUBLIC_FIELDS if public else {"_id": 0}
+    return await _jobs().find_one({"job_id": job_id}, projection)
+
+
+async def count_queued() -> int:
+    return await _jobs().count_documents({"status": QUEUED})
+
+
+async def claim_job(worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+    """
+    Atomically take the oldest runnable job: one that is queued, or running
+    under a lease that has lapsed (its process died). The job is marked
+    running, leased to `worker_id` and its attempt count incremented.
+    Returns None when there is nothing to run.
+    """
+    now = datetime.utcnow()
+    return await _jobs().find_one_and_update(
+        {"$or": [
+            {"status": QUEUED},
+            {"status": RUNNING, "lease_until": {"$lt": now}},
+        ]},
+        {
+            "$set": {
+                "status": RUNNING,
+                "worker_id": worker_id,
+                "lease_until": now + timedelta(seconds=lease_seconds),
+                "updated_at": now,
+            },
+            "$inc": {"attempts": 1},
+        },
+        sort=[("created_at", 1)],
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+async def renew_lease(job_id: str, worker_id: str, lease_seconds: float) -> bool:
+    """Extend a running job's lease; False if `worker_id` no longer holds it."""
+    result = await _jobs().update_one(
+        {"job_id": job_id, "status": RUNNING, "worker_id": worker_id},
+        {"$set": {"lease_until": datetime.utcnow() + timedelta(seconds=lease_seconds)}},
+    )
+    return result.matched_count == 1
+
+
+async def release_job(job_id: str, worker_id: str) -> None:
+    """
+    Put a job this worker was running back in the queue, e.g. on shutdown,
+    without counting the interrupted run as an attempt.
+    """
+    await _jobs().update_one(
+        {"job_id": job_id, "status": RUNNING, "worker_id": worker_id},
+        {
+            "$set": {"status": QUEUED, "updated_at": datetime.utcnow()},
+            "$unset": {"worker_id": "", "lease_until": ""},
+            "$inc": {"attempts": -1},
+        },
+    )
+
+
+async def set_status(job_id: str, status: str, worker_id: Optional[str] = None, **fields: Any) -> bool:
+    """
+    Set a job's status. With `worker_id`, only while that worker still holds
+    the running job, so a worker whose lease lapsed can't overwrite the
+    outcome of the one that took the job over. False if nothing was updated.
+    """
+    query: Dict[str, Any] = {"job_id": job_id}
+    if worker_id is not None:
+        query.update(status=RUNNING, worker_id=worker_id)
+    update = {"status": status, "updated_at": datetime.utcnow(), **fields}
+    result = await _jobs().update_one(query, {"$set": update})
+    return result.matched_count == 1
+
+
+async def delete_job(job_id: str) -> None:
+    await _jobs().delete_one({"job_id": job_id})
+
+
+async def _set_stage(job_id: str, stage: str, **fields: Any) -> None:
+    update = {f"stages.$.{key}": value for key, value in fields.items()}
+    update["updated_at"] = datetime.utcnow()
+    await _jobs().update_one({"job_id": job_id, "stages.name": stage}, {"$set": update})
+
+
+async def skip_stage(job_id: str, stage: str, reason: str = "cached") -> None:
+    """Mark a stage whose output was reused instead of recomputed."""
+    await _set_stage(job_id, stage, status=SKIPPED, reason=reason, finished_at=datetime.utcnow())
+    JOB_STAGES_SKIPPED.inc(stage)
+
+
+@asynccontextmanager
+async def track_stage(job_id: str, stage: str):
+    """
+    Record start/finish timestamps, duration and outcome of one pipeline stage.
+    Exceptions are recorded on the stage and re-raised.
+    """
+    started = time.perf_counter()
+    await _set_stage(job_id, stage, status=RUNNING, started_at=datetime.utcnow())
+    try:
+        yield
+    except Exception as e:
+        elapsed = time.perf_counter() - started
+        JOB_STAGE_SECONDS.observe(elapsed, stage, FAILED)
+        duration_ms = round(elapsed * 1000, 1)
+        await _set_stage(
+            job_id, stage,
+            status=FAILED, finished_at=datetime.utcnow(), duration_ms=duration_ms, error=str(e)
+        )
+        raise
+    elapsed = time.perf_counter() - started
+    JOB_STAGE_SECONDS.observe(elapsed, stage, SUCCEEDED)
+    duration_ms = round(elapsed * 1000, 1)
+    await _set_stage(
+        job_id, stage,
+        status=SUCCEEDED, finished_at=datetime.utcnow(), duration_ms=duration_ms
+    )
+    logger.info("Job %s stage %s finished in %.1f ms", job_id, stage, duration_ms)
+
+
+async def _collect_metrics():
+    queued = await count_queued()
+    running = await _jobs().count_documents({"status": RUNNING})
+    return [
+        Family("jobs_queued", "gauge", "Jobs waiting in the queue", [({}, queued)]),
+        Family("jobs_running", "gauge", "Jobs claimed by a worker", [({}, running)]),
+    ]
+
+
+register_collector(_collect_metrics)
@@ -0,0 +1,194 @@
+import time
+import random
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.metrics import Counter, Family, Histogram, register_collector
+
+logger = get_logger("services.llm.gateway")
+
+LLM_REQUEST_SECONDS = Histogram(
+    "llm_request_duration_seconds", "Latency of successful Groq calls", ("model",)
+)
+# outcome: ok, retried (failed and retried) or failed (failed for good)
+LLM_REQUESTS = Counter("llm_requests_total", "Groq call attempts by outcome", ("model", "outcome"))
+
+
+class LLMNotConfigured(RuntimeError):
+    """Raised when a Groq call is attempted without GROQ_API_KEY."""
+
+
+def _new_stats() -> Dict[str, float]:
+    return {
+        "calls": 0,
+        "errors": 0,
+        "retries": 0,
+        "latency_seconds_total": 0.0,
+        "latency_seconds_max": 0.0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+    }
+
+
+class GroqGateway:
+    """
+    Single async entry point for Groq chat and transcription calls.
+
+    One AsyncGroq client over a pooled httpx connection pool is shared by the
+    whole process. Each model gets its own concurrency semaphore; 429 and 5xx
+    responses, timeouts and connection errors are retried with full-jitter
+    exponential backoff (honouring Retry-After). Latency and token usage are
+    recorded per model.
+    """
+
+    def __init__(self, api_key: str, transport: Any = None):
+        """`transport` replaces httpx's network transport, e.g. with a local stand-in for Groq."""
+        import httpx
+        from groq import AsyncGroq
+
+        self._http = httpx.AsyncClient(
+            transport=transport,
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_connections,
+            ),
+            timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=10.0),
+        )
+        # Retries are done here, not by the SDK, so they share the semaphore and stats
+        self._client = AsyncGroq(
+            api_key=api_key,
+            http_client=self._http,
+            max_retries=0,
+            timeout=settings.llm_timeout_seconds,
+        )
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, Dict[str, float]] = defaultdict(_new_stats)
+        self._in_flight: Dict[str, int] = defaultdict(int)
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(model)
+        if sem is None:
+            sem = self._semaphores[model] = asyncio.Semaphore(settings.llm_concurrency_per_model)
+        return sem
+
+    @staticmethod
+    def _retryable(error: Exception) -> bool:
+        import groq
+
+        if isinstance(error, (groq.APITimeoutError, groq.APIConnectionError)):
+            return True
+        if isinstance(error, groq.APIStatusError):
+            return error.status_code == 429 or error.status_code >= 500
+        return False
+
+    @staticmethod
+    def _backoff(attempt: int, error: Exception) -> float:
+        delay = random.uniform(0, min(settings.llm_backoff_max_seconds, settings.llm_backoff_base_seconds * 2 ** attempt))
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), settings.llm_backoff_max_seconds))
+            except ValueError:
+                pass
+        return delay
+
+    def _record(self, model: str, elapsed: float, usage: Any) -> None:
+        stats = self._stats[model]
+        stats["calls"] += 1
+        stats["latency_seconds_total"] += elapsed
+        stats["latency_seconds_max"] = max(stats["latency_seconds_max"], elapsed)
+        if usage is not None:
+            for field in ("prompt_tokens", "completion_tokens", "total_tokens"):
+                stats[field] += getattr(usage, field, 0) or 0
+
+    async def _call(self, model: str, fn, **kwargs) -> Any:
+        attempt = 0
+        async with self._semaphore(model):
+            self._in_flight[model] += 1
+            try:
+                while True:
+                    started = time.perf_counter()
+                    try:
+                        result = await fn(model=model, **kwargs)
+                    except Exception as e:
+                        self._stats[model]["errors"] += 1
+                        if not self._retryable(e) or attempt >= settings.llm_max_retries:
+                            LLM_REQUESTS.inc(model, "failed")
+                            logger.error("Groq %s call failed after %d attempt(s): %s", model, attempt + 1, e)
+                            raise
+                        delay = self._backoff(attempt, e)
+                        attempt += 1
+                        self._stats[model]["retries"] += 1
+                        LLM_REQUESTS.inc(model, "retried")
+                        logger.warning("Groq %s call failed (%s), retry %d in %.2fs", model, e, attempt, delay)
+                        await asyncio.sleep(delay)
+                        continue
+                    elapsed = time.perf_counter() - started
+                    self._record(model, elapsed, getattr(result, "usage", None))
+                    LLM_REQUEST_SECONDS.observe(elapsed, model)
+                    LLM_REQUESTS.inc(model, "ok")
+                    logger.info("Groq %s call took %.2fs", model, elapsed)
+                    return result
+            finally:
+                self._in_flight[model] -= 1
+
+    async def chat(self, model: str, messages: list, **kwargs) -> Any:
+        return await self._call(model, self._client.chat.completions.create, messages=messages, **kwargs)
+
+    async def transcribe(self, model: str, file: Any, **kwargs) -> Any:
+        return await self._call(model, self._client.audio.transcriptions.create, file=file, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {model: dict(values) for model, values in self._stats.items()}
+
+    def in_flight(self) -> Dict[str, int]:
+        """Calls holding a concurrency slot, per model."""
+        return dict(self._in_flight)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+
+_gateway: Optional[GroqGateway] = None
+
+
+def groq_configured() -> bool:
+    return bool(settings.groq_api_key)
+
+
+def get_gateway() -> GroqGateway:
+    global _gateway
+    if _gateway is None:
+        if not settings.groq_api_key:
+            raise LLMNotConfigured("GROQ_API_KEY is not set")
+        _gateway = GroqGateway(settings.groq_api_key)
+        logger.info("Groq gateway initialized")
+    return _gateway
+
+
+def _collect_metrics():
+    if _gateway is None:
+        return []
+    stats = _gateway.stats()
+    return [
+        Family("llm_requests_in_flight", "gauge", "Groq calls holding a concurrency slot",
+               [({"model": model}, n) for model, n in _gateway.in_flight().items()]),
+        Family("llm_tokens_total", "counter", "Tokens reported by Groq",
+               [({"model": model, "kind": kind}, values[f"{kind}_tokens"])
+                for model, values in stats.items() for kind in ("prompt", "completion")]),
+    ]
+
+
+register_collector(_collect_metrics)
+
+
+async def close_gateway() -> None:
+    global _gateway
+    if _gateway is not None:
+        await _gateway.aclose()
+        _gateway = None
@@ -0,0 +1,169 @@
+import time
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.metrics import register_collector, stats_families
+from app.db.client import get_db
+from app.services.analytics.rollups import record_activity
+
+logger = get_logger("services.progress.buffer")
+
+# (user_email, video_id) -> (progress_time, saved_at)
+_Key = Tuple[str, str]
+_Entry = Tuple[float, datetime]
+
+
+class ProgressBuffer:
+    """
+    Write-behind buffer for video progress. Only the latest progress_time per
+    (user, video) is kept; the buffer is written to `video_progress` with one
+    unordered bulk_write every `flush_interval` seconds, or sooner once
+    `max_pending` entries are waiting.
+
+    Reads must go through `get` first: a value saved in this process but not
+    yet flushed lives only here. Each process has its own buffer, so with
+    several uvicorn workers a read served by another worker can lag by up to
+    one flush interval.
+    """
+
+    def __init__(self, flush_interval: float, max_pending: int):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[_Key, _Entry] = {}
+        # Entries handed to the running bulk_write, still visible to readers
+        self._flushing: Dict[_Key, _Entry] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {
+            "saves": 0,
+            # Saves overwritten in the buffer before they were flushed
+            "writes_saved": 0,
+            "flushes": 0,
+            "documents_written": 0,
+            "flush_errors": 0,
+            "last_flush_ms": 0.0,
+        }
+
+    def put(self, user_email: str, video_id: str, progress_time: float) -> None:
+        key = (user_email, video_id)
+        if key in self._pending:
+            self._stats["writes_saved"] += 1
+        self._pending[key] = (progress_time, datetime.utcnow())
+        self._stats["saves"] += 1
+        if len(self._pending) >= self.max_pending:
+            self._wake.set()
+
+    def get(self, user_email: str, video_id: str) -> Optional[float]:
+        """Buffered progress_time not yet in Mongo, or None."""
+        key = (user_email, video_id)
+        entry = self._pending.get(key) or self._flushing.get(key)
+        return entry[0] if entry else None
+
+    def _requeue(self, batch: Dict[_Key, _Entry]) -> None:
+        # Anything saved since the flush started is newer, keep it
+        for key, entry in batch.items():
+            self._pending.setdefault(key, entry)
+
+    async def flush(self) -> int:
+        """Write everything buffered so far; returns the number of documents written."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            self._flushing, self._pending = self._pending, {}
+            batch = self._flushing
+            requests = [
+                UpdateOne(
+                    {"user_email": user_email, "video_id": video_id},
+                    {"$set": {"progress_time": progress_time, "updated_at": saved_at}},
+                    upsert=True,
+                )
+                for (user_email, video_id), (progress_time, saved_at) in batch.items()
+            ]
+            started = time.perf_counter()
+            try:
+                await get_db()["video_progress"].bulk_write(requests, ordered=False)
+            except asyncio.CancelledError:
+                self._requeue(batch)
+                raise
+            except Exception as e:
+                self._stats["flush_errors"] += 1
+                logger.error("Progress flush of %d entries failed, will retry: %s", len(batch), e)
+                self._requeue(batch)
+                return 0
+            finally:
+                self._flushing = {}
+            # Cached dashboards read before the write no longer get these
+            # values from the buffer
+            from app.services.progress.dashboard import invalidate_users
+
+            invalidate_users({user_email for user_email, _ in batch})
+            self._stats["flushes"] += 1
+            self._stats["documents_written"] += len(batch)
+            self._stats["last_flush_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            try:
+                await record_activity(batch.keys())
+            except Exception as e:
+                logger.warning("Could not update learner activity rollups: %s", e)
+            return len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Progress flush loop error")
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="progress-flush")
+            logger.info(
+                "Progress write-behind buffer started (every %.1fs or %d entries)",
+                self.flush_interval, self.max_pending
+            )
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write out whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        written = await self.flush()
+        if self._pending:
+            logger.error("%d progress updates could not be written on shutdown", len(self._pending))
+        logger.info("Progress buffer stopped (%d written on shutdown)", written)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "pending": len(self._pending)}
+
+
+_buffer: Optional[ProgressBuffer] = None
+
+
+def get_progress_buffer() -> ProgressBuffer:
+    global _buffer
+    if _buffer is None:
+        _buffer = ProgressBuffer(settings.progress_flush_interval, settings.progress_flush_max_pending)
+    return _buffer
+
+
+def _collect_metrics():
+    if _buffer is None:
+        return []
+    return stats_families(
+        "progress_buffer", "Progress write-behind buffer", _buffer.stats(),
+        counters=("saves", "writes_saved", "flushes", "documents_written", "flush_errors"),
+    )
+
+
+register_collector(_collect_metrics)
@@ -0,0 +1,118 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.metrics import register_collector, stats_families
+from app.db.client import get_db
+from app.services.progress.buffer import get_progress_buffer
+
+logger = get_logger("services.progress.dashboard")
+
+# Joined dashboard rows keyed by (user_email, video_ids or None)
+_cache = TTLCache(settings.dashboard_cache_max_entries, settings.dashboard_cache_ttl_seconds)
+# Bumped on every invalidation, so rows read before it aren't cached after it
+_generation = 0
+
+
+def dashboard_pipeline(user_email: str, video_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    One aggregation over `enrollments` that joins each enrollment with the
+    user's progress and the course's metadata. Both lookups match on the
+    unique (user_email, video_id) and video_id indexes and project only the
+    fields the dashboard shows, so transcripts and quizzes never leave Mongo.
+    """
+    match: Dict[str, Any] = {"user_email": user_email}
+    if video_ids:
+        match["video_id"] = {"$in": video_ids}
+
+    return [
+        {"$match": match},
+        {"$lookup": {
+            "from": "video_progress",
+            "let": {"video_id": "$video_id"},
+            "pipeline": [
+                {"$match": {"user_email": user_email, "$expr": {"$eq": ["$video_id", "$$video_id"]}}},
+                {"$project": {"_id": 0, "progress_time": 1, "updated_at": 1}},
+                {"$limit": 1},
+            ],
+            "as": "progress",
+        }},
+        {"$lookup": {
+            "from": "courses",
+            "let": {"video_id": "$video_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$video_id", "$$video_id"]}}},
+                {"$project": {"_id": 0, "course_title": 1, "passing_criteria": 1, "created_at": 1}},
+                {"$limit": 1},
+            ],
+            "as": "course",
+        }},
+        {"$unwind": {"path": "$progress", "preserveNullAndEmptyArrays": True}},
+        {"$unwind": {"path": "$course", "preserveNullAndEmptyArrays": True}},
+        {"$project": {
+            "_id": 0,
+            "video_id": 1,
+            "course_name": 1,
+            "enrolled_at": 1,
+            # $ifNull so missing progress/courses come back as null, not absent
+            "progress_time": {"$ifNull": ["$progress.progress_time", None]},
+            "progress_updated_at": {"$ifNull": ["$progress.updated_at", None]},
+            "course_title": {"$ifNull": ["$course.course_title", None]},
+            "passing_criteria": {"$ifNull": ["$course.passing_criteria", None]},
+            "course_created_at": {"$ifNull": ["$course.created_at", None]},
+        }},
+        {"$sort": {"enrolled_at": -1}},
+    ]
+
+
+def _cache_key(user_email: str, video_ids: Optional[List[str]]) -> Tuple[str, Optional[Tuple[str, ...]]]:
+    return user_email, tuple(sorted(set(video_ids))) if video_ids else None
+
+
+async def load_dashboard(user_email: str, video_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Enrollments joined with progress and course metadata for one user,
+    newest enrollment first. Results are cached for
+    `dashboard_cache_ttl_seconds` and dropped when this process enrolls the
+    user or writes their progress (directly or in a buffer flush); progress
+    still in the write-behind buffer is applied on every call. Progress
+    written by other processes can take up to the TTL to show.
+    """
+    key = _cache_key(user_email, video_ids)
+    rows = _cache.get(key)
+    if rows is None:
+        generation = _generation
+        cursor = get_db()["enrollments"].aggregate(dashboard_pipeline(user_email, video_ids))
+        rows = await cursor.to_list(length=None)
+        if generation == _generation:
+            _cache.set(key, rows)
+
+    if not settings.progress_write_behind:
+        return rows
+    buffer = get_progress_buffer()
+    merged = []
+    for row in rows:
+        buffered = buffer.get(user_email, row["video_id"])
+        merged.append(row if buffered is None else {**row, "progress_time": buffered})
+    return merged
+
+
+def invalidate_user(user_email: str) -> None:
+    """Drop every cached dashboard of `user_email` (after an enrollment or direct progress write)."""
+    invalidate_users({user_email})
+
+
+def invalidate_users(user_emails: Iterable[str]) -> None:
+    """Drop every cached dashboard of these users, e.g. after a progress buffer flush."""
+    global _generation
+    user_emails = set(user_emails)
+    _generation += 1
+    _cache.delete_where(lambda key: key[0] in user_emails)
+
+
+def stats() -> Dict[str, Any]:
+    return _cache.stats()
+
+
+register_collector(lambda: stats_families("dashboard_cache", "Dashboard row cache", stats(), counters=("hits", "misses")))
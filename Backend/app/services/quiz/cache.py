@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from pymongo import ASCENDING
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.metrics import register_collector, stats_families
+from app.db.client import get_db
+
+logger = get_logger("services.quiz.cache")
+
+COLLECTION = "llm_cache"
+
+_stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "errors": 0}
+
+
+def _collection():
+    return get_db()[COLLECTION]
+
+
+async def get_cached_quiz(key: str) -> Optional[str]:
+    """
+    Raw quiz JSON stored under `key` by put_cached_quiz, or None when it is
+    missing or expired. A hit refreshes the entry's last use, which decides
+    what goes first once the cache is over `quiz_cache_max_bytes`.
+    Cache failures are logged and treated as a miss.
+    """
+    now = datetime.utcnow()
+    try:
+        # Mongo's TTL monitor only runs once a minute, so check expiry here too
+        doc = await _collection().find_one_and_update(
+            {"_id": key, "expires_at": {"$gt": now}},
+            {"$set": {"last_used_at": now}, "$inc": {"hits": 1}},
+            projection={"value": 1},
+        )
+    except Exception as e:
+        _stats["errors"] += 1
+        logger.warning("Quiz cache read failed: %s", e)
+        return None
+    if doc is None:
+        _stats["misses"] += 1
+        return None
+    _stats["hits"] += 1
+    return doc["value"]
+
+
+async def put_cached_quiz(key: str, raw_quiz: str, **meta: Any) -> None:
+    """
+    Store `raw_quiz` under `key` for `quiz_cache_ttl_seconds`, replacing any
+    previous entry, then evict the least recently used entries until the
+    stored quizzes fit in `quiz_cache_max_bytes`. `meta` (model, num_questions, ...) is stored
+    alongside for inspection.
+    """
+    now = datetime.utcnow()
+    doc = {
+        **meta,
+        "value": raw_quiz,
+        "size": len(raw_quiz),
+        "hits": 0,
+        "created_at": now,
+        "last_used_at": now,
+        "expires_at": now + timedelta(seconds=settings.quiz_cache_ttl_seconds),
+    }
+    try:
+        collection = _collection()
+        await collection.replace_one({"_id": key}, doc, upsert=True)
+        _stats["writes"] += 1
+
+        excess = await _total_size(collection) - settings.quiz_cache_max_bytes
+        if excess > 0:
+            stale, freed = [], 0
+            cursor = collection.find({"_id": {"$ne": key}}, {"size": 1}).sort("last_used_at", ASCENDING)
+            async for d in cursor:
+                if freed >= excess:
+                    break
+                stale.append(d["_id"])
+                freed += d.get("size", 0)
+            result = await collection.delete_many({"_id": {"$in": stale}})
+            _stats["evictions"] += result.deleted_count
+            logger.info("Evicted %d quiz cache entries", result.deleted_count)
+    except Exception as e:
+        _stats["errors"] += 1
+        logger.warning("Quiz cache write failed: %s", e)
+
+
+async def _total_size(collection) -> int:
+    result = await collection.aggregate(
+        [{"$group": {"_id": None, "bytes": {"$sum": "$size"}}}]
+    ).to_list(1)
+    return result[0]["bytes"] if result else 0
+
+
+def stats() -> Dict[str, Any]:
+    lookups = _stats["hits"] + _stats["misses"]
+    return {**_stats, "hit_rate": round(_stats["hits"] / lookups, 4) if lookups else 0.0}
+
+
+register_collector(lambda: stats_families(
+    "quiz_cache", "Generated-quiz cache", stats(), counters=("hits", "misses", "writes", "evictions", "errors")
+))
@@ -1,15 +1,15 @@
-from groq import Groq
 import json
 from typing import List, Union, Dict
 
 from app.core.logger import get_logger
-from app.core.config import settings
+from app.services.llm.gateway import get_gateway
 
 logger = get_logger("services.quiz.checker")
 
-client = Groq(api_key=settings.groq_api_key)
+CHECKER_MODEL = "openai/gpt-oss-120b"
 
-def check_quiz_answers_llm(
+
+async def check_quiz_answers_llm(
     questions: Union[List[dict], List],
     user_answers: List[str],
     correct_answers: List[str]
@@ -19,8 +19,8 @@ def check_quiz_answers_llm(
     Transcript is NOT used anymore.
     """
 
-    response = client.chat.completions.create(
-        model="openai/gpt-oss-120b",
+    response = await get_gateway().chat(
+        model=CHECKER_MODEL,
         messages=[
             {
                 "role": "system",
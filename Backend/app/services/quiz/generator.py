@@ -1,28 +1,24 @@
-from groq import Groq
 import json
+import asyncio
+import hashlib
+from typing import Any, List, Set
 
-from app.core.logger import get_logger
 from app.core.config import settings
+from app.core.logger import get_logger, log_payload
+from app.services.llm.gateway import get_gateway
+from app.services.quiz.grader import normalize_text
+from app.services.quiz.sections import split_transcript
 
 logger = get_logger("services.quiz.generator")
 
-client = Groq(api_key=settings.groq_api_key)
+QUIZ_MODEL = "openai/gpt-oss-120b"
 
-def generate_quiz(transcript: str, num_questions: int) -> str:
-    """
-    Use Groq JSON mode to generate a list of questions. Returns a JSON string
-    of a list like:
-    [
-      {"question": "...", "options": ["a","b","c"], "answer": "a"},
-      ...
-    ]
-    """
-    response = client.chat.completions.create(
-        model="openai/gpt-oss-120b",
-        messages=[
-            {
-                "role": "system",
-                "content": """You are an expert trainer that generates quizzes.
+# Extra candidates asked of each section, to make up for dropped duplicates
+_SPARE_PER_SECTION = 1
+# Word-set Jaccard similarity above which two questions count as duplicates
+_DUPLICATE_SIMILARITY = 0.8
+
+SYSTEM_PROMPT = """You are an expert trainer that generates quizzes.
 Respond only with JSON using this format exactly:
 {
   "quiz": [
@@ -35,18 +31,38 @@ Respond only with JSON using this format exactly:
 }
 Return exactly the number of questions requested by the user.
 Do NOT include metadata, explanations, or any additional fields."""
-            },
-            {
-                "role": "user",
-                "content": f"Generate {num_questions} MCQ-style questions from the following transcript:\n\"\"\"{transcript}\"\"\""
-            }
+
+
+def _user_prompt(transcript: str, num_questions: int) -> str:
+    return f"Generate {num_questions} MCQ-style questions from the following transcript:\n\"\"\"{transcript}\"\"\""
+
+
+def quiz_cache_key(transcript: str, num_questions: int) -> str:
+    """
+    Key identifying one generate_quiz call: changing the model, the prompt,
+    the transcript, the question count or the section size gives a
+    different key.
+    """
+    payload = json.dumps([
+        QUIZ_MODEL, SYSTEM_PROMPT, _user_prompt(transcript, num_questions), num_questions,
+        settings.quiz_section_tokens,
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def _request_quiz(transcript: str, num_questions: int) -> List[Any]:
+    """One JSON-mode chat call; returns the parsed list of questions."""
+    response = await get_gateway().chat(
+        model=QUIZ_MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": _user_prompt(transcript, num_questions)},
         ],
         response_format={"type": "json_object"}
     )
 
     raw = response.choices[0].message.content
-    logger.debug("Groq response raw type: %s", type(raw))
-    logger.debug("Groq response raw content: %s", raw)
+    log_payload(logger, "Groq quiz response (%s)", raw, type(raw).__name__)
 
     # Accept already-parsed dict/list or JSON string
     if isinstance(raw, (dict, list)):
@@ -55,7 +71,8 @@ Do NOT include metadata, explanations, or any additional fields."""
         try:
             result = json.loads(raw)
         except Exception as e:
-            logger.exception("Failed to parse Groq response: %s", e)
+            logger.error("Failed to parse Groq response (%d chars): %s", len(raw or ""), e)
+            log_payload(logger, "Unparseable Groq response", raw)
             raise
 
     # Accept either {"quiz": [...]} or directly [...]
@@ -64,11 +81,126 @@ Do NOT include metadata, explanations, or any additional fields."""
     elif isinstance(result, list):
         quiz_list = result
     else:
-        logger.warning("Unexpected generator result shape: %s", result)
+        logger.warning("Unexpected generator result shape: %s", type(result).__name__)
+        log_payload(logger, "Unexpected generator result", result)
         quiz_list = []
 
     if not quiz_list:
-        logger.warning("Generated quiz is empty. Raw result: %s", result)
+        logger.warning("Generated quiz is empty")
+        log_payload(logger, "Empty quiz result", result)
+    return quiz_list if isinstance(quiz_list, list) else []
+
+
+def _section_quotas(num_questions: int, num_sections: int) -> List[int]:
+    """
+    Spread num_questions over the sections as evenly as possible; when there
+    are fewer questions than sections they go to evenly spaced sections.
+    """
+    def boundary(s: int) -> int:
+        # round(s * num_questions / num_sections) in integer arithmetic
+        return (2 * s * num_questions + num_sections) // (2 * num_sections)
+
+    return [boundary(s + 1) - boundary(s) for s in range(num_sections)]
+
+
+def _words(item: Any) -> Set[str]:
+    question = item.get("question", "") if isinstance(item, dict) else item
+    return set(normalize_text(question).split())
+
+
+def _is_duplicate(words: Set[str], seen: List[Set[str]]) -> bool:
+    for other in seen:
+        union = words | other
+        if union and len(words & other) / len(union) >= _DUPLICATE_SIMILARITY:
+            return True
+    return False
+
+
+def _select(candidates: List[List[Any]], quotas: List[int], num_questions: int) -> List[Any]:
+    """
+    Drop near-duplicate questions across sections, take each section's quota,
+    then fill any shortfall from the other sections' spare candidates.
+    Questions are returned in transcript order.
+    """
+    seen: List[Set[str]] = []
+    unique: List[List[Any]] = []
+    for section in candidates:
+        kept = []
+        for item in section:
+            words = _words(item)
+            if not words or _is_duplicate(words, seen):
+                continue
+            seen.append(words)
+            kept.append(item)
+        unique.append(kept)
+
+    chosen = [kept[:quota] for kept, quota in zip(unique, quotas)]
+    spare = [kept[quota:] for kept, quota in zip(unique, quotas)]
+    missing = num_questions - sum(len(c) for c in chosen)
+    # Round-robin over the sections so the shortfall doesn't all land in one place
+    while missing > 0 and any(spare):
+        for s in range(len(spare)):
+            if missing > 0 and spare[s]:
+                chosen[s].append(spare[s].pop(0))
+                missing -= 1
+    return [item for section in chosen for item in section]
+
+
+async def _map_reduce(sections: List[str], num_questions: int) -> List[Any]:
+    """
+    Generate candidate questions for every section concurrently (bounded by
+    the gateway's per-model limit) and merge them into one quiz.
+    """
+    quotas = _section_quotas(num_questions, len(sections))
+    requests = [
+        _request_quiz(section, quota + _SPARE_PER_SECTION) if quota else None
+        for section, quota in zip(sections, quotas)
+    ]
+    pending = [r for r in requests if r is not None]
+    results = iter(await asyncio.gather(*pending, return_exceptions=True))
+
+    candidates: List[List[Any]] = []
+    errors = []
+    for s, request in enumerate(requests):
+        result = next(results) if request is not None else []
+        if isinstance(result, Exception):
+            logger.warning("Quiz generation failed for section %d/%d: %s", s + 1, len(sections), result)
+            errors.append(result)
+            result = []
+        candidates.append(result)
+    if errors and len(errors) == len(pending):
+        raise errors[0]
+
+    quiz_list = _select(candidates, quotas, num_questions)
+    logger.info(
+        "Generated %d questions from %d sections (%d candidates)",
+        len(quiz_list), len(sections), sum(len(c) for c in candidates),
+    )
+    if len(quiz_list) < num_questions:
+        logger.warning("Only %d of %d requested questions after dedup", len(quiz_list), num_questions)
+    return quiz_list
+
+
+async def generate_quiz(transcript: str, num_questions: int) -> str:
+    """
+    Use Groq JSON mode to generate a list of questions. Returns a JSON string
+    of a list like:
+    [
+      {"question": "...", "options": ["a","b","c"], "answer": "a"},
+      ...
+    ]
+    Transcripts longer than `settings.quiz_section_tokens` are split into
+    sections that are sent to the model concurrently; the questions are then
+    deduplicated and picked evenly across the sections.
+    """
+    sections = [transcript]
+    if settings.quiz_section_tokens > 0:
+        sections = await asyncio.to_thread(split_transcript, transcript, settings.quiz_section_tokens)
+
+    if len(sections) > 1:
+        quiz_list = await _map_reduce(sections, num_questions)
+    else:
+        quiz_list = await _request_quiz(transcript, num_questions)
 
     # Return a JSON string of the list for consistent DB storage
     return json.dumps(quiz_list, ensure_ascii=False)
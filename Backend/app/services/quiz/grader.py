@@ -0,0 +1,120 @@
+import re
+import string
+from typing import Any, Dict, List, Optional
+
+from app.core.logger import get_logger
+
+logger = get_logger("services.quiz.grader")
+
+_WHITESPACE = re.compile(r"\s+")
+# "b", "B)", "(b)", "b." -> option letter b
+_LETTER = re.compile(r"^\(?([a-z])[\).:]?$")
+_PUNCTUATION = string.punctuation + "“”‘’"
+
+
+def normalize_text(value: Any) -> str:
+    """Casefold, collapse whitespace and strip surrounding punctuation."""
+    text = _WHITESPACE.sub(" ", str(value)).strip().casefold()
+    return text.strip(_PUNCTUATION + " ")
+
+
+def option_index(answer: Any, options: List[str]) -> Optional[int]:
+    """
+    Resolve a submitted or stored answer to a 0-based option index.
+    Accepts the option index (int or numeric string), the option letter
+    ("b", "B)", "(b)") or the option text, ignoring case and whitespace.
+    Returns None when the answer matches no option.
+    """
+    if answer is None or isinstance(answer, bool) or not options:
+        return None
+
+    if isinstance(answer, int):
+        return answer if 0 <= answer < len(options) else None
+    if isinstance(answer, float):
+        return int(answer) if answer.is_integer() and 0 <= answer < len(options) else None
+
+    text = normalize_text(answer)
+    if not text:
+        return None
+
+    # Option text wins over index/letter, in case an option is itself "2" or "a"
+    normalized_options = [normalize_text(opt) for opt in options]
+    if text in normalized_options:
+        return normalized_options.index(text)
+
+    if text.isdigit():
+        idx = int(text)
+        return idx if idx < len(options) else None
+
+    match = _LETTER.match(text)
+    if match:
+        idx = ord(match.group(1)) - ord("a")
+        return idx if idx < len(options) else None
+    return None
+
+
+def grade_quiz(
+    questions: List[Dict[str, Any]],
+    user_answers: List[Any],
+    correct_answers: List[str]
+) -> Dict[str, Any]:
+    """
+    Grade submitted answers against the stored correct answers without any
+    network call. Multiple-choice answers are compared by option index;
+    questions without options are compared as normalized text, and those that
+    don't match exactly are listed in `ungraded` for an optional LLM check.
+
+    Returns the same `quiz_evaluation` shape the LLM checker produced, plus a
+    per-question breakdown.
+    """
+    total = max(len(questions), len(correct_answers))
+    marks = 0
+    details = []
+    ungraded = []
+
+    for i in range(total):
+        question = questions[i] if i < len(questions) else {}
+        options = question.get("options") if isinstance(question.get("options"), list) else []
+        correct = correct_answers[i] if i < len(correct_answers) else question.get("answer", "")
+        submitted = user_answers[i] if i < len(user_answers) else None
+
+        # Normalized quizzes carry the precomputed index of the correct option
+        if "answer_index" in question:
+            correct_idx = question["answer_index"]
+        else:
+            correct_idx = option_index(correct, options)
+        if correct_idx is not None:
+            selected_idx = option_index(submitted, options)
+            is_correct = selected_idx is not None and selected_idx == correct_idx
+            details.append({"question": i, "selected": selected_idx, "correct_option": correct_idx, "correct": is_correct})
+        else:
+            # Free-text question (or stored answer not among the options)
+            is_correct = submitted is not None and normalize_text(submitted) == normalize_text(correct) != ""
+            if not is_correct and submitted is not None and normalize_text(submitted):
+                ungraded.append(i)
+            details.append({"question": i, "selected": submitted, "correct_option": None, "correct": is_correct})
+
+        if is_correct:
+            marks += 1
+
+    return {
+        "quiz_evaluation": {
+            "marks": marks,
+            "total": total,
+            "percentage": round(marks / total * 100, 2) if total else 0.0,
+        },
+        "details": details,
+        "ungraded": ungraded,
+    }
+
+
+def add_marks(result: Dict[str, Any], extra_marks: int) -> Dict[str, Any]:
+    """
+    Add marks awarded outside the local grader (e.g. by the LLM for free-text
+    answers) and recompute the percentage.
+    """
+    evaluation = result["quiz_evaluation"]
+    evaluation["marks"] += extra_marks
+    total = evaluation["total"]
+    evaluation["percentage"] = round(evaluation["marks"] / total * 100, 2) if total else 0.0
+    return result
@@ -0,0 +1,94 @@
+import json
+from typing import Any, Dict, List
+
+from app.core.logger import get_logger
+
+logger = get_logger("services.quiz.parser")
+
+
+def parse_raw_quiz(raw_quiz: Any) -> List[Dict[str, Any]]:
+    """
+    Accept either:
+      - a JSON string representing a list or dict
+      - an already parsed list/dict from Groq's JSON mode
+    Normalize to a list of question dicts. If top-level dict contains "quiz",
+    extract it. If shape unexpected, return empty list.
+    """
+    if isinstance(raw_quiz, str):
+        try:
+            parsed = json.loads(raw_quiz)
+        except Exception:
+            logger.exception("Failed to json.loads raw_quiz")
+            return []
+    else:
+        parsed = raw_quiz
+
+    if isinstance(parsed, dict) and "quiz" in parsed:
+        quiz_list = parsed["quiz"]
+    elif isinstance(parsed, list):
+        quiz_list = parsed
+    else:
+        logger.warning("Unexpected quiz shape: %s", type(parsed))
+        quiz_list = []
+
+    if not isinstance(quiz_list, list):
+        logger.warning("Quiz is not a list after extraction, got: %s", type(quiz_list))
+        return []
+
+    # Ensure each item is a dict
+    normalized = []
+    for item in quiz_list:
+        if isinstance(item, dict):
+            normalized.append(item)
+        else:
+            logger.warning("Skipping non-dict quiz item: %s", item)
+    return normalized
+
+
+def sanitize_quiz(parsed_quiz: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reduce parsed question dicts to {"question", "options", "answer"}, mapping
+    `answer_index` onto the option text when the answer text is missing.
+    """
+    sanitized = []
+    for item in parsed_quiz:
+        question_text = item.get("question", "")
+        options = item.get("options", []) if isinstance(item.get("options", []), list) else []
+        answer = item.get("answer")
+
+        # If answer missing but answer_index provided, try mapping
+        if (answer is None or not isinstance(answer, str)) and "answer_index" in item:
+            try:
+                idx = int(item.get("answer_index"))
+                if 0 <= idx < len(options):
+                    answer = options[idx]
+            except Exception:
+                answer = None
+
+        # If answer is an index-like value, keep its text form
+        if answer is not None and not isinstance(answer, str):
+            try:
+                answer = str(answer)
+            except Exception:
+                answer = None
+
+        # Final safety: if answer text still not found, set to empty string
+        answer_text = answer if isinstance(answer, str) else ""
+        sanitized.append({"question": question_text, "options": options, "answer": answer_text})
+    return sanitized
+
+
+def normalize_quiz(raw_quiz: Any) -> List[Dict[str, Any]]:
+    """
+    Canonical quiz stored on the course document as `normalized_quiz`:
+    a list of {"question", "options", "answer", "answer_index"} where
+    `answer_index` is the 0-based index of the correct option, or None for
+    free-text questions. Computed once at write time so read paths don't
+    parse or sanitize anything.
+    """
+    from app.services.quiz.grader import option_index
+
+    normalized = sanitize_quiz(parse_raw_quiz(raw_quiz))
+    for item in normalized:
+        item["answer_index"] = option_index(item["answer"], item["options"])
+    return normalized
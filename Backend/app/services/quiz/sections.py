@@ -0,0 +1,77 @@
+import re
+from functools import lru_cache
+from typing import List
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger("services.quiz.sections")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# Rough size of a token in English text, used when no tokenizer is available
+_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """
+    The tiktoken encoding named by `settings.quiz_tokenizer`, or None if it
+    can't be loaded (tiktoken downloads its BPE files on first use, which
+    fails on hosts without internet access).
+    """
+    try:
+        import tiktoken  # type: ignore
+        return tiktoken.get_encoding(settings.quiz_tokenizer)
+    except Exception as e:
+        logger.warning("tiktoken encoding %s unavailable, estimating tokens from length: %s", settings.quiz_tokenizer, e)
+        return None
+
+
+def count_tokens(text: str) -> int:
+    encoding = _encoding()
+    if encoding is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoding.encode_ordinary(text))
+
+
+def _split_long(text: str, max_tokens: int) -> List[str]:
+    """Hard-split one oversized sentence into pieces of at most max_tokens."""
+    encoding = _encoding()
+    if encoding is None:
+        step = max_tokens * _CHARS_PER_TOKEN
+        return [text[i:i + step] for i in range(0, len(text), step)]
+    tokens = encoding.encode_ordinary(text)
+    return [encoding.decode(tokens[i:i + max_tokens]) for i in range(0, len(tokens), max_tokens)]
+
+
+def split_transcript(transcript: str, max_tokens: int) -> List[str]:
+    """
+    Split `transcript` into consecutive sections of at most `max_tokens`
+    tokens, cutting between sentences where possible. A transcript that
+    already fits is returned as a single section.
+    """
+    text = transcript.strip()
+    if not text or count_tokens(text) <= max_tokens:
+        return [text]
+
+    sections: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for sentence in _SENTENCE_END.split(text):
+        tokens = count_tokens(sentence) + 1  # + the joining space
+        if tokens > max_tokens:
+            pieces = _split_long(sentence, max_tokens)
+        else:
+            pieces = [sentence]
+        for piece in pieces:
+            piece_tokens = tokens if len(pieces) == 1 else count_tokens(piece) + 1
+            if current and current_tokens + piece_tokens > max_tokens:
+                sections.append(" ".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+    if current:
+        sections.append(" ".join(current))
+
+    logger.info("Split transcript of ~%d tokens into %d sections (max %d)", count_tokens(text), len(sections), max_tokens)
+    return sections
@@ -0,0 +1,161 @@
+import os
+import shutil
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.metrics import register_collector, stats_families
+
+logger = get_logger("services.storage.artifacts")
+
+
+class ArtifactStore:
+    """
+    Content-addressed cache of files derived from an uploaded video
+    (extracted audio, transcript), keyed by the video's SHA-256.
+
+    Layout is `<root>/<digest[:2]>/<digest>/<name>`. Reads refresh the file's
+    mtime. Writes add to a running total of the store's size (taken from one
+    walk of the tree on the first write); only once that passes `max_bytes`
+    is the tree walked again, to recount and evict least-recently-used files.
+    Methods block on disk I/O; call them via asyncio.to_thread.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._total_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, digest: str, name: str) -> str:
+        return os.path.join(self.root, digest[:2], digest, name)
+
+    def get_path(self, digest: str, name: str) -> Optional[str]:
+        """Return the cached file path, or None on a miss."""
+        path = self._path(digest, name)
+        with self._lock:
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return path
+
+    def get_text(self, digest: str, name: str) -> Optional[str]:
+        path = self.get_path(digest, name)
+        if path is None:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def put_file(self, digest: str, name: str, src_path: str) -> str:
+        """
+        Move `src_path` into the store and return its new path.
+        """
+        path = self._path(digest, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        replaced = _size(path)
+        shutil.move(src_path, path)
+        self._stored(path, replaced)
+        return path
+
+    def put_text(self, digest: str, name: str, text: str) -> str:
+        path = self._path(digest, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        replaced = _size(path)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        self._stored(path, replaced)
+        return path
+
+    def _stored(self, path: str, replaced: int) -> None:
+        """Count a file just written at `path` (over `replaced` bytes) and evict if over budget."""
+        size = _size(path)
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._total_bytes += size - replaced
+            if self._total_bytes > self.max_bytes:
+                self._evict(keep=path)
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every file in the store."""
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        # Recount from disk: other processes sharing the store write to it too
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            # The file that was just written is what the caller is about to use
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            self.evictions += 1
+            logger.info("Evicted artifact %s (%d bytes)", path, size)
+            self._remove_empty_dirs(os.path.dirname(path))
+        self._total_bytes = total
+
+    def _remove_empty_dirs(self, digest_dir: str) -> None:
+        for path in (digest_dir, os.path.dirname(digest_dir)):
+            try:
+                os.rmdir(path)
+            except OSError:
+                return
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+_store: Optional[ArtifactStore] = None
+
+
+def get_artifact_store() -> ArtifactStore:
+    global _store
+    if _store is None:
+        _store = ArtifactStore(settings.artifacts_dir, settings.artifacts_max_bytes)
+    return _store
+
+
+def _collect_metrics():
+    if _store is None:
+        return []
+    return stats_families(
+        "artifact_store", "Audio/transcript artifact store", _store.stats(), counters=("hits", "misses", "evictions")
+    )
+
+
+register_collector(_collect_metrics)
@@ -0,0 +1,69 @@
+import os
+import asyncio
+import hashlib
+from typing import BinaryIO, NamedTuple
+
+from fastapi import UploadFile
+
+from app.core.logger import get_logger
+
+logger = get_logger("services.storage.upload")
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds the configured maximum size."""
+
+
+class SavedUpload(NamedTuple):
+    path: str
+    size: int
+    sha256: str
+
+
+def _write_chunk(f: BinaryIO, hasher, chunk: bytes) -> None:
+    hasher.update(chunk)
+    f.write(chunk)
+
+
+async def save_upload(
+    upload: UploadFile,
+    dest_path: str,
+    max_bytes: int,
+    chunk_size: int = 1024 * 1024
+) -> SavedUpload:
+    """
+    Copy `upload` to `dest_path` in `chunk_size` blocks, hashing the content
+    as it goes. Only one chunk is held in memory at a time and file I/O runs
+    in a worker thread, so the event loop never blocks on disk.
+    Raises UploadTooLarge (and removes the partial file) past `max_bytes`.
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLarge(f"Upload is {upload.size} bytes, limit is {max_bytes} bytes")
+
+    hasher = hashlib.sha256()
+    size = 0
+    f = await asyncio.to_thread(open, dest_path, "wb")
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge(f"Upload exceeds the limit of {max_bytes} bytes")
+            await asyncio.to_thread(_write_chunk, f, hasher, chunk)
+    except BaseException:
+        await asyncio.to_thread(f.close)
+        await asyncio.to_thread(_remove_partial, dest_path)
+        raise
+    await asyncio.to_thread(f.close)
+
+    logger.info("Saved upload %s (%d bytes)", dest_path, size)
+    return SavedUpload(dest_path, size, hasher.hexdigest())
+
+
+def _remove_partial(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
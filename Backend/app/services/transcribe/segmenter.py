@@ -0,0 +1,69 @@
+import wave
+from typing import List, NamedTuple
+
+import numpy as np
+
+from app.core.logger import get_logger
+from app.services.audio.extractor import SAMPLE_RATE, read_pcm
+
+logger = get_logger("services.transcribe.segmenter")
+
+FRAME_MS = 30
+# Energy is averaged over ~300 ms so a cut lands in a pause, not between syllables
+SMOOTHING_FRAMES = 10
+
+
+class Chunk(NamedTuple):
+    start: int  # sample offset, inclusive
+    end: int    # sample offset, exclusive
+
+
+def load_pcm(audio_path: str) -> bytes:
+    """
+    Return the audio as raw 16 kHz mono signed 16-bit PCM. WAV files already
+    in that format are read directly; anything else is decoded with ffmpeg.
+    """
+    try:
+        with wave.open(audio_path, "rb") as w:
+            if (w.getnchannels(), w.getsampwidth(), w.getframerate()) == (1, 2, SAMPLE_RATE):
+                return w.readframes(w.getnframes())
+    except (wave.Error, EOFError):
+        pass
+    return read_pcm(audio_path)
+
+
+def split_on_silence(samples: np.ndarray, sample_rate: int, max_chunk_seconds: float) -> List[Chunk]:
+    """
+    Split `samples` into chunks no longer than `max_chunk_seconds`. Each cut
+    is placed at the quietest point in the second half of the allowed window,
+    so chunks end in pauses rather than mid-word.
+    """
+    max_len = int(max_chunk_seconds * sample_rate)
+    total = len(samples)
+    if total <= max_len:
+        return [Chunk(0, total)]
+
+    frame = int(sample_rate * FRAME_MS / 1000)
+    n_frames = total // frame
+    frames = samples[: n_frames * frame].astype(np.float32).reshape(n_frames, frame)
+    energy = np.sqrt(np.mean(frames ** 2, axis=1))
+    kernel = np.ones(SMOOTHING_FRAMES, dtype=np.float32) / SMOOTHING_FRAMES
+    energy = np.convolve(energy, kernel, mode="same")
+
+    chunks = []
+    start = 0
+    while total - start > max_len:
+        lo = (start + max_len // 2) // frame
+        hi = (start + max_len) // frame
+        # Latest quietest frame in the window, so chunks stay close to max length
+        quietest = hi - 1 - int(np.argmin(energy[lo:hi][::-1]))
+        cut = quietest * frame + frame // 2
+        chunks.append(Chunk(start, cut))
+        start = cut
+    chunks.append(Chunk(start, total))
+
+    logger.info(
+        "Split %.1fs of audio into %d chunks (max %.0fs)",
+        total / sample_rate, len(chunks), max_chunk_seconds
+    )
+    return chunks
@@ -1,65 +1,134 @@
+import io
 import os
-from functools import lru_cache
+import wave
+import asyncio
+from typing import Any, Dict, List
 from app.core.logger import get_logger
 from app.core.config import settings
+from app.services.audio.extractor import SAMPLE_RATE
+from app.services.llm.gateway import get_gateway, groq_configured
+from app.services.transcribe.whisper_pool import get_whisper_pool, whisper_available
 
 logger = get_logger("services.transcribe.transcriber")
 
-# Try to import Groq client (preferred if available)
-_groq_client = None
-if settings.groq_api_key:
-    try:
-        from groq import Groq  # type: ignore
-        _groq_client = Groq(api_key=settings.groq_api_key)
-        logger.info("Groq client initialized")
-    except Exception as e:
-        logger.warning("Groq client import failed: %s", e)
-        _groq_client = None
-
-
-# Lazily load Whisper model, only once
-@lru_cache(maxsize=1)
-def get_whisper_model():
-    try:
-        import whisper  # type: ignore
-        logger.info("Loading local Whisper model (small)...")
-        model = whisper.load_model("small")
-        logger.info("Whisper model loaded successfully")
-        return model
-    except Exception as e:
-        logger.error("Failed to load Whisper model: %s", e)
-        return None
-
-
-def transcribe(audio_path: str) -> str:
+TRANSCRIBE_MODEL = "whisper-large-v3"
+
+
+def _no_backend() -> RuntimeError:
+    logger.error("No transcription backend available. Set GROQ_API_KEY or install whisper.")
+    return RuntimeError("No transcription backend available. Set GROQ_API_KEY or install whisper.")
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _offset_segments(segments: Any, offset: float) -> List[Dict[str, Any]]:
+    return [
+        {
+            "start": round(float(_field(seg, "start", 0.0)) + offset, 2),
+            "end": round(float(_field(seg, "end", 0.0)) + offset, 2),
+            "text": str(_field(seg, "text", "")).strip(),
+        }
+        for seg in segments or []
+    ]
+
+
+async def _transcribe_chunk_groq(pcm: bytes, offset: float) -> Dict[str, Any]:
+    transcription = await get_gateway().transcribe(
+        model=TRANSCRIBE_MODEL,
+        file=("audio.wav", pcm_to_wav(pcm)),
+        response_format="verbose_json"
+    )
+    return {
+        "text": (_field(transcription, "text", "") or "").strip(),
+        "segments": _offset_segments(_field(transcription, "segments"), offset),
+    }
+
+
+async def _transcribe_chunk_whisper(pcm: bytes, offset: float) -> Dict[str, Any]:
+    result = await asyncio.to_thread(get_whisper_pool().transcribe, pcm)
+    return {
+        "text": (result.get("text") or "").strip(),
+        "segments": _offset_segments(result.get("segments"), offset),
+    }
+
+
+async def transcribe_pcm_segments(pcm: bytes) -> Dict[str, Any]:
     """
-    Transcribe audio_path. Prefer Groq if available, else whisper model if installed.
+    Transcribe raw 16 kHz mono signed 16-bit PCM. Long audio is split on
+    silence into chunks of at most `settings.transcribe_chunk_seconds`, which
+    are transcribed concurrently and stitched back in order.
+    Returns {"text": str, "segments": [{"start", "end", "text"}, ...]} with
+    timestamps in seconds from the start of the audio.
+    """
+    import numpy as np
+    from app.services.transcribe.segmenter import split_on_silence
+
+    if groq_configured():
+        logger.info("Using Groq transcription backend")
+        transcribe_chunk = _transcribe_chunk_groq
+        concurrency = settings.transcribe_concurrency
+    elif whisper_available():
+        logger.info("Using local Whisper transcription backend")
+        transcribe_chunk = _transcribe_chunk_whisper
+        concurrency = get_whisper_pool().size
+    else:
+        raise _no_backend()
+
+    samples = np.frombuffer(pcm, np.int16)
+    chunks = await asyncio.to_thread(split_on_silence, samples, SAMPLE_RATE, settings.transcribe_chunk_seconds)
+    jobs = [(samples[c.start:c.end].tobytes(), c.start / SAMPLE_RATE) for c in chunks]
+
+    # Per-job cap on top of the gateway's per-model limit, so one long video
+    # can't take every Groq slot
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(job):
+        async with semaphore:
+            return await transcribe_chunk(*job)
+
+    # gather() keeps submission order, so the stitched text stays in order
+    results = await asyncio.gather(*(run(job) for job in jobs))
+
+    return {
+        "text": " ".join(r["text"] for r in results if r["text"]),
+        "segments": [seg for r in results for seg in r["segments"]],
+    }
+
+
+async def transcribe_segments(audio_path: str) -> Dict[str, Any]:
+    """
+    Transcribe audio_path into text plus timestamped segments.
+    Prefer Groq if available, else whisper model if installed.
     If neither available, raise RuntimeError.
     """
+    from app.services.transcribe.segmenter import load_pcm
+
     logger.info("Transcribing audio: %s", audio_path)
     if not os.path.exists(audio_path):
         raise FileNotFoundError(f"Audio not found: {audio_path}")
+    if not groq_configured() and not whisper_available():
+        raise _no_backend()
+    pcm = await asyncio.to_thread(load_pcm, audio_path)
+    return await transcribe_pcm_segments(pcm)
 
-    # --- Try Groq first ---
-    if _groq_client:
-        logger.info("Using Groq transcription backend")
-        with open(audio_path, "rb") as f:
-            audio_bytes = f.read()
-        transcription = _groq_client.audio.transcriptions.create(
-            file=(os.path.basename(audio_path), audio_bytes),
-            model="whisper-large-v3",
-            response_format="verbose_json"
-        )
-        text = getattr(transcription, "text", None) or transcription.get("text", "")
-        return text
-
-    # --- Fallback: local Whisper ---
-    whisper_model = get_whisper_model()
-    if whisper_model:
-        logger.info("Using local Whisper transcription backend")
-        result = whisper_model.transcribe(audio_path)
-        return result.get("text", "")
 
-    # --- If nothing available ---
-    logger.error("No transcription backend available. Set GROQ_API_KEY or install whisper.")
-    raise RuntimeError("No transcription backend available. Set GROQ_API_KEY or install whisper.")
+async def transcribe(audio_path: str) -> str:
+    """
+    Transcribe audio_path and return the plain text.
+    """
+    return (await transcribe_segments(audio_path))["text"]
+
+
+def pcm_to_wav(pcm: bytes, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Wrap raw mono signed 16-bit PCM in an in-memory WAV container."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(pcm)
+    return buf.getvalue()
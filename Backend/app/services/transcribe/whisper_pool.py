@@ -0,0 +1,186 @@
+import os
+import time
+import threading
+import importlib.util
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.metrics import Family, register_collector
+from app.services.audio.extractor import SAMPLE_RATE
+
+logger = get_logger("services.transcribe.whisper_pool")
+
+# Set inside each worker process by _init_worker
+_model = None
+
+
+def _init_worker(model_size: str, threads: int) -> None:
+    global _model
+    import torch  # type: ignore
+    import whisper  # type: ignore
+
+    torch.set_num_threads(threads)
+    started = time.perf_counter()
+    _model = whisper.load_model(model_size)
+    logger.info(
+        "Whisper worker %d loaded model %s in %.1fs",
+        os.getpid(), model_size, time.perf_counter() - started
+    )
+
+
+def _transcribe_in_worker(pcm: bytes) -> Dict[str, Any]:
+    import numpy as np
+
+    audio = np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+    result = _model.transcribe(audio)
+    return {
+        "text": result.get("text", ""),
+        "segments": [
+            {"start": seg["start"], "end": seg["end"], "text": seg["text"]}
+            for seg in result.get("segments", [])
+        ],
+    }
+
+
+def _warm_up_in_worker() -> float:
+    import numpy as np
+
+    started = time.perf_counter()
+    _model.transcribe(np.zeros(SAMPLE_RATE, dtype=np.float32))
+    return time.perf_counter() - started
+
+
+def whisper_available() -> bool:
+    return importlib.util.find_spec("whisper") is not None
+
+
+class WhisperPool:
+    """
+    N single-process executors, each holding its own Whisper model, so
+    concurrent transcriptions never share a model object. Work goes to the
+    worker with the fewest pending calls. A worker whose process died (most
+    often Whisper running out of memory on a long file) is replaced.
+    """
+
+    def __init__(self, size: int, model_size: str, threads_per_worker: int):
+        self.model_size = model_size
+        self.threads_per_worker = threads_per_worker
+        self._workers = [self._new_worker() for _ in range(size)]
+        self._pending = [0] * size
+        self._completed = [0] * size
+        self._lock = threading.Lock()
+        logger.info("Whisper pool: %d workers, model=%s, %d threads each", size, model_size, threads_per_worker)
+
+    def _new_worker(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.model_size, self.threads_per_worker),
+        )
+
+    def _replace(self, index: int, broken: ProcessPoolExecutor) -> None:
+        # Several callers may see the same broken executor; replace it once
+        with self._lock:
+            if self._workers[index] is not broken:
+                return
+            self._workers[index] = self._new_worker()
+        broken.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Whisper worker %d died; started a new one", index)
+
+    @property
+    def size(self) -> int:
+        return len(self._workers)
+
+    def _acquire(self) -> int:
+        with self._lock:
+            index = min(range(self.size), key=self._pending.__getitem__)
+            self._pending[index] += 1
+            return index
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._pending[index] -= 1
+            self._completed[index] += 1
+
+    def transcribe(self, pcm: bytes) -> Dict[str, Any]:
+        """
+        Transcribe raw 16 kHz mono signed 16-bit PCM on the least busy worker.
+        Blocks until done; call from a thread. If the worker's process dies,
+        the call is retried once on its replacement.
+        """
+        index = self._acquire()
+        try:
+            worker = self._workers[index]
+            try:
+                return worker.submit(_transcribe_in_worker, pcm).result()
+            except BrokenProcessPool:
+                self._replace(index, worker)
+            return self._workers[index].submit(_transcribe_in_worker, pcm).result()
+        finally:
+            self._release(index)
+
+    def warm_up(self) -> None:
+        """Start every worker, load its model and run one tiny inference."""
+        futures = [worker.submit(_warm_up_in_worker) for worker in self._workers]
+        for index, future in enumerate(futures):
+            logger.info("Whisper worker %d warm (first inference %.2fs)", index, future.result())
+
+    def stats(self) -> List[Dict[str, int]]:
+        with self._lock:
+            return [
+                {"worker": i, "pending": self._pending[i], "completed": self._completed[i]}
+                for i in range(self.size)
+            ]
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: Optional[WhisperPool] = None
+_pool_lock = threading.Lock()
+
+
+def default_pool_size() -> int:
+    """One worker per `whisper_threads_per_worker` CPU cores."""
+    return max(1, (os.cpu_count() or 1) // max(1, settings.whisper_threads_per_worker))
+
+
+def get_whisper_pool() -> WhisperPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WhisperPool(
+                settings.whisper_workers or default_pool_size(),
+                settings.whisper_model,
+                settings.whisper_threads_per_worker,
+            )
+        return _pool
+
+
+def shutdown_whisper_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def _collect_metrics():
+    if _pool is None:
+        return []
+    workers = _pool.stats()
+    return [
+        Family("whisper_pool_pending", "gauge", "Transcriptions running or queued per Whisper worker",
+               [({"worker": w["worker"]}, w["pending"]) for w in workers]),
+        Family("whisper_pool_completed_total", "counter", "Transcriptions finished per Whisper worker",
+               [({"worker": w["worker"]}, w["completed"]) for w in workers]),
+    ]
+
+
+register_collector(_collect_metrics)
@@ -0,0 +1,77 @@
+"""
+Media worker: runs video -> quiz jobs from the Mongo-backed queue, so the
+transcription stack can be scaled apart from API processes started with
+APP_ROLE=api.
+
+    python -m app.worker
+
+Runs `settings.job_workers` jobs at a time until SIGINT/SIGTERM, then hands
+any job still running back to the queue. Its metrics (job stages, Whisper
+pool, Groq calls) are served at :`settings.worker_metrics_port`/metrics.
+"""
+import os
+import signal
+import asyncio
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.metrics import start_metrics_server
+from app.db.client import get_db, close_client
+from app.db.indexes import ensure_indexes
+from app.services.jobs.pool import JobPool, get_job_pool
+from app.services.llm.gateway import close_gateway, get_gateway, groq_configured
+
+logger = get_logger("app.worker")
+
+
+async def start_jobs() -> JobPool:
+    """Load the media stack, warm Whisper if configured and start claiming jobs."""
+    from app.services.transcribe.whisper_pool import get_whisper_pool, whisper_available
+
+    if settings.whisper_warmup and whisper_available():
+        await asyncio.to_thread(get_whisper_pool().warm_up)
+    job_pool = get_job_pool()
+    await job_pool.start()
+    return job_pool
+
+
+async def stop_jobs(job_pool: JobPool) -> None:
+    from app.services.transcribe.whisper_pool import shutdown_whisper_pool
+
+    await job_pool.stop()
+    shutdown_whisper_pool()
+
+
+async def run() -> None:
+    os.makedirs(settings.tmp_dir, exist_ok=True)
+    await ensure_indexes(get_db())
+    if groq_configured():
+        get_gateway()
+    job_pool = await start_jobs()
+    metrics_server = None
+    if settings.metrics_enabled and settings.worker_metrics_port:
+        metrics_server = await start_metrics_server(settings.worker_metrics_host, settings.worker_metrics_port)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    logger.info("Worker %s waiting for jobs", job_pool.worker_id)
+    try:
+        await stop.wait()
+    finally:
+        logger.info("Worker %s shutting down", job_pool.worker_id)
+        if metrics_server is not None:
+            metrics_server.close()
+            await metrics_server.wait_closed()
+        await stop_jobs(job_pool)
+        await close_gateway()
+        close_client()
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
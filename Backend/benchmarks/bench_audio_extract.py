@@ -0,0 +1,93 @@
+"""
+Compare the ffmpeg and moviepy audio extractor backends on wall time and
+peak memory.
+
+    python -m benchmarks.bench_audio_extract [--video path.mp4] [--seconds 120]
+
+Without --video a synthetic 720p clip with a sine-wave audio track is
+generated. Each run happens in a fresh process so peak RSS (the process
+plus the ffmpeg children it spawns) is not polluted by earlier runs.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+import multiprocessing as mp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_synthetic_video(path: str, seconds: int) -> None:
+    from app.services.audio.extractor import ffmpeg_binary
+
+    subprocess.run(
+        [
+            ffmpeg_binary(), "-nostdin", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", f"testsrc=size=1280x720:rate=30:duration={seconds}",
+            "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=44100:duration={seconds}",
+            "-c:v", "mpeg4", "-q:v", "5", "-c:a", "aac", "-shortest", path,
+        ],
+        check=True,
+    )
+
+
+def _run_backend(backend: str, video_path: str, out_dir: str, queue) -> None:
+    os.environ["AUDIO_EXTRACTOR"] = backend
+    from app.services.audio.extractor import extract_audio, audio_extension
+
+    audio_path = os.path.join(out_dir, f"bench_{backend}{audio_extension()}")
+    started = time.perf_counter()
+    extract_audio(video_path, audio_path)
+    wall = time.perf_counter() - started
+
+    # ru_maxrss is in KiB on Linux
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    child_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    queue.put({
+        "backend": backend,
+        "wall_s": round(wall, 3),
+        "peak_rss_mb": round(self_rss, 1),
+        "peak_child_rss_mb": round(child_rss, 1),
+        "output_bytes": os.path.getsize(audio_path),
+    })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Video to extract from (default: synthetic clip)")
+    parser.add_argument("--seconds", type=int, default=120, help="Length of the synthetic clip")
+    parser.add_argument("--backends", default="ffmpeg,moviepy")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        video_path = args.video
+        if not video_path:
+            video_path = os.path.join(tmp, "synthetic.mp4")
+            make_synthetic_video(video_path, args.seconds)
+
+        ctx = mp.get_context("spawn")
+        results = []
+        for backend in args.backends.split(","):
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_run_backend, args=(backend, video_path, tmp, queue))
+            proc.start()
+            proc.join()
+            if proc.exitcode != 0:
+                results.append({"backend": backend, "error": f"exit code {proc.exitcode}"})
+                continue
+            results.append(queue.get())
+
+    report = {"video": args.video or f"synthetic {args.seconds}s 720p", "results": results}
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
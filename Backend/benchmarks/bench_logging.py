@@ -0,0 +1,104 @@
+"""
+Log calls per second as seen by the caller, with records written directly
+by the calling thread versus handed to the background writer thread
+(settings.log_async), for text and JSON output.
+
+    python -m benchmarks.bench_logging [--calls 50000] [--sink-latency-ms 0]
+
+Records go to a temp file; --sink-latency-ms adds a sleep to every write to
+stand in for a slow or back-pressured stderr (e.g. a log shipper pipe). The
+calls are made from a coroutine, as request handlers make them, and
+`loop_blocked_ms` is how long that kept the event loop busy. `drain_ms` is
+how long the writer thread then needed to finish.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _SlowFile:
+    def __init__(self, f, latency: float):
+        self._f = f
+        self._latency = latency
+
+    def write(self, data: str) -> int:
+        if self._latency:
+            time.sleep(self._latency)
+        return self._f.write(data)
+
+    def flush(self) -> None:
+        self._f.flush()
+
+
+async def _log_calls(logger: logging.Logger, calls: int) -> float:
+    started = time.perf_counter()
+    for i in range(calls):
+        logger.info("Saved progress for %s on %s at %.1f", "learner@example.com", "video-%d" % (i % 50), i * 0.5,
+                    extra={"video_id": i % 50})
+    return time.perf_counter() - started
+
+
+def _run(fmt: str, use_queue: bool, calls: int, latency: float) -> dict:
+    from app.core.logger import build_handler, request_id_var
+
+    with tempfile.TemporaryFile("w+") as f:
+        handler, listener = build_handler(_SlowFile(f, latency), fmt, use_queue)
+        logger = logging.getLogger(f"bench.{fmt}.{use_queue}")
+        logger.handlers = [handler]
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        if listener is not None:
+            listener.start()
+        request_id_var.set("bench")
+
+        elapsed = asyncio.run(_log_calls(logger, calls))
+        drain_started = time.perf_counter()
+        if listener is not None:
+            listener.stop()
+        drain = time.perf_counter() - drain_started
+        f.flush()
+        f.seek(0)
+        written = sum(1 for _ in f)
+
+    return {
+        "format": fmt,
+        "queued": use_queue,
+        "calls": calls,
+        "lines_written": written,
+        "calls_per_second": round(calls / elapsed),
+        "loop_blocked_ms": round(elapsed * 1000, 1),
+        "drain_ms": round(drain * 1000, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--sink-latency-ms", type=float, default=0.0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    latency = args.sink_latency_ms / 1000
+    report = {
+        "sink_latency_ms": args.sink_latency_ms,
+        "runs": [
+            _run(fmt, use_queue, args.calls, latency)
+            for fmt in ("text", "json")
+            for use_queue in (False, True)
+        ],
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Login-storm load test: /health latency while many /auth/token requests
+hash passwords concurrently.
+
+    python -m benchmarks.bench_login_storm [--logins 100] [--concurrency 50] [--mode offloaded|inline]
+
+Runs the app in-process over httpx's ASGI transport, so anything that
+blocks the event loop shows up directly in /health latency. `--mode inline`
+reproduces the old behaviour (bcrypt on the event loop) for comparison.
+Uses mongomock-motor unless --mongo-url points at a real server.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+
+EMAIL = "storm@example.com"
+PASSWORD = "Storm-Passw0rd!"
+
+
+def _percentiles(samples):
+    if not samples:
+        return {}
+    samples = sorted(samples)
+
+    def pct(p):
+        return round(samples[min(len(samples) - 1, int(len(samples) * p))] * 1000, 2)
+
+    return {"count": len(samples), "p50_ms": pct(0.50), "p95_ms": pct(0.95), "p99_ms": pct(0.99), "max_ms": round(samples[-1] * 1000, 2)}
+
+
+async def _probe_health(client, stop: asyncio.Event, interval: float):
+    """
+    Hit /health every `interval` seconds. Latency is measured from when the
+    probe was due, so time spent waiting on a blocked event loop counts.
+    """
+    latencies = []
+    due = time.perf_counter()
+    while not stop.is_set():
+        await client.get("/health")
+        done = time.perf_counter()
+        latencies.append(done - due)
+        due = done + interval
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def _storm(client, logins: int, concurrency: int) -> Counter:
+    sem = asyncio.Semaphore(concurrency)
+    statuses = Counter()
+
+    async def one():
+        async with sem:
+            r = await client.post("/auth/token", data={"username": EMAIL, "password": PASSWORD})
+            statuses[r.status_code] += 1
+
+    await asyncio.gather(*(one() for _ in range(logins)))
+    return statuses
+
+
+async def run(args) -> dict:
+    import httpx
+    import app.db.client as db_client
+    from app.core.config import settings
+
+    if args.mongo_url:
+        # settings was loaded with the import above; set it before get_db()
+        settings.mongodb_url = args.mongo_url
+    else:
+        from mongomock_motor import AsyncMongoMockClient
+        db_client._client = AsyncMongoMockClient()
+
+    from app.main import app
+    from app.services.auth import passwords
+
+    if args.mode == "inline":
+        async def _inline(fn, *fn_args):
+            return fn(*fn_args)
+        passwords._run = _inline
+
+    await db_client.get_db()["users"].delete_many({"email": EMAIL})
+    await db_client.get_db()["users"].insert_one({
+        "username": "storm", "email": EMAIL, "password": passwords.pwd_ctx.hash(PASSWORD),
+    })
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        stop = asyncio.Event()
+        baseline_task = asyncio.create_task(_probe_health(client, stop, args.probe_interval))
+        await asyncio.sleep(args.baseline_seconds)
+        stop.set()
+        baseline = await baseline_task
+
+        stop = asyncio.Event()
+        probe_task = asyncio.create_task(_probe_health(client, stop, args.probe_interval))
+        started = time.perf_counter()
+        statuses = await _storm(client, args.logins, args.concurrency)
+        storm_seconds = time.perf_counter() - started
+        stop.set()
+        during = await probe_task
+
+    return {
+        "mode": args.mode,
+        "logins": args.logins,
+        "concurrency": args.concurrency,
+        "storm_seconds": round(storm_seconds, 2),
+        "login_statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "health_baseline": _percentiles(baseline),
+        "health_during_storm": _percentiles(during),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--mode", choices=["offloaded", "inline"], default="offloaded")
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    parser.add_argument("--baseline-seconds", type=float, default=2.0)
+    parser.add_argument("--mongo-url", help="Real MongoDB to use instead of mongomock-motor")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Requests per second for quiz grading: the old per-submission LLM round-trip
+versus the local grader.
+
+    python -m benchmarks.bench_quiz_grading [--llm-latency 1.5] [--concurrency 40]
+
+The LLM path runs the real `check_quiz_answers_llm` through the Groq gateway
+with a stub client that sleeps for --llm-latency seconds. The local path runs
+`grade_quiz` inline, as the endpoint does now.
+"""
+import os
+import sys
+import json
+import time
+import types
+import random
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+
+
+def make_quiz(num_questions: int):
+    quiz = []
+    for i in range(num_questions):
+        options = [f"Option {chr(65 + j)} for question {i}" for j in range(4)]
+        quiz.append({"question": f"Question {i}?", "options": options, "answer": random.choice(options)})
+    return quiz
+
+
+class _StubCompletions:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        content = json.dumps({"quiz_evaluation": {"marks": 3, "percentage": 60.0}})
+        message = types.SimpleNamespace(content=content)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+async def _drive(handler, requests: int, concurrency: int) -> dict:
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with sem:
+            started = time.perf_counter()
+            await handler()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "seconds": round(elapsed, 3),
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3),
+    }
+
+
+async def run(args) -> dict:
+    from app.services.llm import gateway
+    from app.services.quiz import checker
+    from app.services.quiz.grader import grade_quiz
+
+    llm = gateway.get_gateway()
+    llm._client = types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=_StubCompletions(args.llm_latency))
+    )
+    quiz = make_quiz(args.questions)
+    correct = [q["answer"] for q in quiz]
+    submitted = [random.randrange(4) for _ in quiz]
+
+    async def llm_handler():
+        await checker.check_quiz_answers_llm(quiz, submitted, correct)
+
+    async def local_handler():
+        grade_quiz(quiz, submitted, correct)
+
+    report = {
+        "questions": args.questions,
+        "concurrency": args.concurrency,
+        "llm_latency_s": args.llm_latency,
+        "llm": await _drive(llm_handler, args.llm_requests, args.concurrency),
+        "local": await _drive(local_handler, args.local_requests, args.concurrency),
+        "gateway": llm.stats(),
+    }
+    await gateway.close_gateway()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=40)
+    parser.add_argument("--llm-latency", type=float, default=1.5, help="Simulated Groq latency (s)")
+    parser.add_argument("--llm-requests", type=int, default=200)
+    parser.add_argument("--local-requests", type=int, default=20000)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Cold-start budget for the API process: time and memory to `import app.main`,
+plus which heavy modules that import dragged in.
+
+    python -m benchmarks.check_startup [--budget-ms 1500] [--runs 5] [--lifespan]
+
+Each run imports the app in a fresh interpreter. The check fails (exit
+status 1) when the median import time is over --budget-ms or when any module
+in HEAVY_MODULES was imported; those must only load on first use. With
+--lifespan the startup hook is also run, against mongomock-motor, and its
+duration reported.
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported by `import app.main`
+HEAVY_MODULES = [
+    "fitz", "pymupdf", "moviepy", "imageio_ffmpeg", "numpy", "torch", "whisper",
+    "groq", "httpx", "tiktoken", "redis",
+    # The media side of the app itself, only loaded by processes that run jobs
+    "app.services.audio.extractor", "app.services.transcribe.transcriber", "app.services.jobs.pipeline",
+]
+
+_PROBE = r"""
+import sys, json, time, resource
+started = time.perf_counter()
+import app.main
+import_ms = (time.perf_counter() - started) * 1000
+report = {
+    "import_ms": import_ms,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "heavy_modules": [m for m in HEAVY if m in sys.modules],
+    "modules": len(sys.modules),
+}
+if LIFESPAN:
+    import asyncio
+    from mongomock_motor import AsyncMongoMockClient
+    import app.db.client as db_client
+
+    async def run_lifespan():
+        db_client._client = AsyncMongoMockClient()
+        started = time.perf_counter()
+        async with app.main.app.router.lifespan_context(app.main.app):
+            report["lifespan_startup_ms"] = (time.perf_counter() - started) * 1000
+            report["rss_after_startup_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    asyncio.run(run_lifespan())
+print("STARTUP_REPORT " + json.dumps(report))
+"""
+
+
+def _probe(lifespan: bool) -> dict:
+    code = f"HEAVY = {HEAVY_MODULES!r}\nLIFESPAN = {lifespan!r}\n" + _PROBE
+    env = {**os.environ, "MONGO_EXPLAIN_CHECK": "false"}
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith("STARTUP_REPORT "):
+            return json.loads(line[len("STARTUP_REPORT "):])
+    raise RuntimeError(f"Probe failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--lifespan", action="store_true", help="Also time the startup hook (needs mongomock-motor)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    runs = [_probe(args.lifespan) for _ in range(args.runs)]
+    heavy = sorted({m for run in runs for m in run["heavy_modules"]})
+    report = {
+        "runs": args.runs,
+        "budget_ms": args.budget_ms,
+        "import_ms_median": round(statistics.median(r["import_ms"] for r in runs), 1),
+        "import_ms_max": round(max(r["import_ms"] for r in runs), 1),
+        "rss_mb_median": round(statistics.median(r["rss_mb"] for r in runs), 1),
+        "modules": runs[0]["modules"],
+        "heavy_modules": heavy,
+    }
+    if args.lifespan:
+        report["lifespan_startup_ms_median"] = round(statistics.median(r["lifespan_startup_ms"] for r in runs), 1)
+        report["rss_after_startup_mb_median"] = round(statistics.median(r["rss_after_startup_mb"] for r in runs), 1)
+
+    failures = []
+    if report["import_ms_median"] > args.budget_ms:
+        failures.append(f"import app.main took {report['import_ms_median']} ms (budget {args.budget_ms} ms)")
+    if heavy:
+        failures.append(f"import app.main loaded heavy modules: {', '.join(heavy)}")
+    report["ok"] = not failures
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    for failure in failures:
+        print("FAIL: " + failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
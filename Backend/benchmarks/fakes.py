@@ -0,0 +1,134 @@
+"""
+Local stand-ins so the benchmarks run without network access or a MongoDB
+server: a fake Groq API behind httpx, mongomock-motor in place of MongoDB,
+and synthetic video/quiz fixtures.
+"""
+import os
+import re
+import json
+import random
+import asyncio
+import subprocess
+from typing import Any, Dict, List
+
+TRANSCRIPT = (
+    "Welcome to workplace safety fundamentals. Always wear protective equipment on the shop floor. "
+    "Report spills immediately and mark the area. Fire exits must stay clear at all times. "
+    "Lift with your legs, not your back, and ask for help with loads over twenty kilograms. "
+    "Know where the first aid kit and the nearest defibrillator are kept."
+)
+
+_QUESTION_COUNT = re.compile(r"Generate (\d+) MCQ")
+
+
+def make_quiz(num_questions: int) -> List[Dict[str, Any]]:
+    """Quiz items in the shape the generator asks Groq for."""
+    quiz = []
+    for i in range(num_questions):
+        options = [f"Option {chr(65 + j)} for question {i}" for j in range(4)]
+        quiz.append({"question": f"Question {i} about workplace safety?", "options": options,
+                     "answer": random.choice(options)})
+    return quiz
+
+
+def fake_groq_transport(latency: float, latency_jitter: float = 0.2):
+    """
+    httpx transport answering Groq chat completions with a quiz (or a quiz
+    evaluation, for the checker's prompt) and audio transcriptions with
+    TRANSCRIPT, after `latency` seconds (+/- `latency_jitter` of it). The
+    real Groq SDK and gateway run on top of it.
+    """
+    import httpx
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(max(0.0, latency * random.uniform(1 - latency_jitter, 1 + latency_jitter)))
+        path = request.url.path
+        if path.endswith("/audio/transcriptions"):
+            return httpx.Response(200, json={
+                "text": TRANSCRIPT,
+                "segments": [{"start": 0.0, "end": 5.0, "text": TRANSCRIPT}],
+            })
+        if path.endswith("/chat/completions"):
+            body = json.loads(request.content)
+            prompt = body["messages"][-1]["content"]
+            match = _QUESTION_COUNT.search(prompt)
+            if match:
+                content = {"quiz": make_quiz(int(match.group(1)))}
+            else:
+                content = {"quiz_evaluation": {"marks": 1, "percentage": 100.0}}
+            content = json.dumps(content)
+            return httpx.Response(200, json={
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                          "total_tokens": (len(prompt) + len(content)) // 4},
+            })
+        return httpx.Response(404, json={"error": {"message": f"No fake for {path}"}})
+
+    return httpx.MockTransport(handler)
+
+
+def install_fake_groq(latency: float) -> None:
+    """Make get_gateway() return a gateway talking to the fake Groq API."""
+    os.environ.setdefault("GROQ_API_KEY", "bench")
+    from app.core.config import settings
+    from app.services.llm import gateway
+
+    settings.groq_api_key = settings.groq_api_key or "bench"
+    gateway._gateway = gateway.GroqGateway(settings.groq_api_key, transport=fake_groq_transport(latency))
+
+
+def use_mock_mongo() -> None:
+    """
+    Point the app at an in-memory mongomock-motor client, smoothing over
+    two mongomock gaps the app's queries hit: bulk_write as sent by recent
+    pymongo (an explicit `sort=None` per update) and find_one_and_update
+    with `_id` projected out (returns None).
+    """
+    import mongomock.collection as mongomock_collection
+    from mongomock_motor import AsyncMongoMockClient
+    import app.db.client as db_client
+
+    add_update = mongomock_collection.BulkOperationBuilder.add_update
+    if not getattr(add_update, "_bench_patched", False):
+        def _add_update(self, *args, sort=None, **kwargs):
+            return add_update(self, *args, **kwargs)
+        _add_update._bench_patched = True
+        mongomock_collection.BulkOperationBuilder.add_update = _add_update
+
+        find_and_modify = mongomock_collection.Collection._find_and_modify
+
+        def _find_and_modify(self, query, projection=None, *args, **kwargs):
+            if isinstance(projection, dict) and projection.get("_id") == 0:
+                rest = {k: v for k, v in projection.items() if k != "_id"} or None
+                doc = find_and_modify(self, query, rest, *args, **kwargs)
+                if doc is not None:
+                    doc.pop("_id", None)
+                return doc
+            return find_and_modify(self, query, projection, *args, **kwargs)
+        mongomock_collection.Collection._find_and_modify = _find_and_modify
+
+    db_client._client = AsyncMongoMockClient()
+
+
+def make_video(path: str, seconds: float = 5.0) -> str:
+    """Write a small synthetic MP4 (test-pattern video, sine-tone audio) to `path`."""
+    from app.services.audio.extractor import ffmpeg_binary
+
+    subprocess.run(
+        [
+            ffmpeg_binary(), "-y", "-loglevel", "error",
+            "-f", "lavfi", "-i", f"testsrc=size=160x120:rate=10:duration={seconds}",
+            "-f", "lavfi", "-i", f"sine=frequency=440:duration={seconds}",
+            "-c:v", "mpeg4", "-c:a", "aac", "-shortest", path,
+        ],
+        check=True,
+    )
+    return path
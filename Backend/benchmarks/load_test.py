@@ -0,0 +1,314 @@
+"""
+Offline load test of the main endpoints: throughput and p50/p95/p99 latency
+per scenario, written as JSON to diff between commits.
+
+    python -m benchmarks.load_test [--scenarios all] [--requests 200] [--concurrency 20]
+                                   [--groq-latency 0.5] [--mongo-url URL] [--output results.json]
+
+Scenarios:
+  video_to_quiz  POST /api/video-to-quiz with a synthetic MP4 (unique bytes
+                 per upload, so nothing is served from the artifact or quiz
+                 caches), then waits for each job; reports upload latency
+                 and end-to-end job latency separately
+  check_quiz     GET /api/check-quiz against seeded courses, as seeded
+                 learners (bearer tokens), so results reach the analytics
+  progress_save  POST /progress/save for a spread of learners and videos
+  auth_token     POST /auth/token for seeded users (bcrypt-bound)
+  certificate    POST /api/certificate, a fresh certificate per request
+
+The app runs in-process (with its lifespan: job pool, progress buffer, Groq
+gateway) over httpx's ASGI transport. Groq is replaced by the fake in
+benchmarks.fakes, answering after --groq-latency seconds through the real
+SDK; MongoDB by mongomock-motor unless --mongo-url points at a server
+(use a throwaway database: the run seeds and writes to it). mongomock is
+much slower than MongoDB for some operations, so compare runs made the
+same way.
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import subprocess
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "bench")
+os.environ.setdefault("MONGO_EXPLAIN_CHECK", "false")
+
+SCENARIOS = ["video_to_quiz", "check_quiz", "progress_save", "auth_token", "certificate"]
+PASSWORD = "Bench-Passw0rd!"
+QUESTIONS = 10
+
+
+def _percentiles(samples):
+    if not samples:
+        return {"count": 0}
+    samples = sorted(samples)
+
+    def pct(p):
+        return round(samples[min(len(samples) - 1, int(len(samples) * p))] * 1000, 2)
+
+    return {"count": len(samples), "p50_ms": pct(0.50), "p95_ms": pct(0.95), "p99_ms": pct(0.99), "max_ms": round(samples[-1] * 1000, 2)}
+
+
+async def _drive(requests: int, concurrency: int, send) -> dict:
+    """Call `send(i)` for i in range(requests), `concurrency` at a time; `send` returns the HTTP status."""
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+    statuses = Counter()
+
+    async def one(i: int):
+        async with sem:
+            started = time.perf_counter()
+            try:
+                status = await send(i)
+            except Exception as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[status] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "statuses": {str(k): v for k, v in sorted(statuses.items(), key=lambda kv: str(kv[0]))},
+        "latency": _percentiles(latencies),
+    }
+
+
+async def _seed_courses(db, count: int):
+    from benchmarks.fakes import TRANSCRIPT, make_quiz
+    from app.db.indexes import normalize_title
+
+    courses = []
+    for i in range(count):
+        quiz = make_quiz(QUESTIONS)
+        courses.append({
+            "video_id": f"bench-course-{i}",
+            "course_title": f"Bench course {i}",
+            "course_title_normalized": normalize_title(f"Bench course {i}"),
+            "course_video_name": "bench.mp4",
+            "transcript": TRANSCRIPT,
+            "transcript_segments": [],
+            "passing_criteria": 50,
+            "quiz": json.dumps(quiz),
+            "normalized_quiz": quiz,
+            "quiz_answers": [item["answer"] for item in quiz],
+        })
+    await db["courses"].insert_many(courses)
+    return courses
+
+
+async def _seed_users(db, count: int):
+    from app.services.auth import passwords
+
+    hashed = await passwords.hash_password(PASSWORD)
+    emails = [f"bench{i}@example.com" for i in range(count)]
+    await db["users"].insert_many([
+        {"username": f"bench{i}", "email": email, "password": hashed} for i, email in enumerate(emails)
+    ])
+    return emails
+
+
+async def _seed_learners(db, count: int):
+    """Learner accounts (no password) and a bearer token for each."""
+    from app.routers.auth import _create_access_token
+
+    emails = [f"learner{i}@example.com" for i in range(count)]
+    await db["users"].insert_many([{"username": f"learner{i}", "email": email} for i, email in enumerate(emails)])
+    return [_create_access_token({"sub": email}) for email in emails]
+
+
+async def video_to_quiz(client, args, fixtures) -> dict:
+    from app.services.jobs import store as job_store
+
+    with open(fixtures["video"], "rb") as f:
+        video = f.read()
+    run = os.urandom(4).hex()
+    submitted = {}
+
+    async def send(i: int):
+        # Trailing bytes give every upload its own hash; ffmpeg ignores them
+        body = video + os.urandom(16)
+        r = await client.post(
+            "/api/video-to-quiz",
+            data={"course_title": f"Load {run} {i}", "passing_criteria": "50",
+                  "num_questions": str(QUESTIONS), "force_regenerate": "true"},
+            files={"video_file": (f"load_{i}.mp4", body, "video/mp4")},
+        )
+        if r.status_code == 202:
+            submitted[r.json()["job_id"]] = time.perf_counter()
+        return r.status_code
+
+    report = await _drive(args.requests_video, args.concurrency, send)
+
+    job_latencies = []
+    outcomes = Counter()
+    pending = dict(submitted)
+    deadline = time.perf_counter() + args.job_timeout
+    while pending and time.perf_counter() < deadline:
+        for job_id, started in list(pending.items()):
+            job = await job_store.get_job(job_id)
+            if job and job["status"] in job_store.TERMINAL_STATUSES:
+                job_latencies.append(time.perf_counter() - started)
+                outcomes[job["status"]] += 1
+                del pending[job_id]
+        await asyncio.sleep(0.05)
+    outcomes["timed_out"] += len(pending)
+    report["jobs"] = {"outcomes": dict(outcomes), "latency": _percentiles(job_latencies)}
+    return report
+
+
+async def check_quiz(client, args, fixtures) -> dict:
+    courses = fixtures["courses"]
+    tokens = fixtures["learner_tokens"]
+
+    async def send(i: int):
+        course = courses[i % len(courses)]
+        answers = [random.choice(item["options"]) for item in course["normalized_quiz"]]
+        r = await client.get(
+            "/api/check-quiz",
+            params={"video_id": course["video_id"], "answers": json.dumps(answers)},
+            headers={"Authorization": f"Bearer {tokens[i % len(tokens)]}"},
+        )
+        return r.status_code
+
+    return await _drive(args.requests, args.concurrency, send)
+
+
+async def progress_save(client, args, fixtures) -> dict:
+    async def send(i: int):
+        r = await client.post("/progress/save", json={
+            "user_email": f"learner{i % 500}@example.com",
+            "video_id": f"bench-course-{i % 20}",
+            "progress_time": float(i),
+        })
+        return r.status_code
+
+    return await _drive(args.requests, args.concurrency, send)
+
+
+async def auth_token(client, args, fixtures) -> dict:
+    emails = fixtures["users"]
+
+    async def send(i: int):
+        r = await client.post("/auth/token", data={"username": emails[i % len(emails)], "password": PASSWORD})
+        return r.status_code
+
+    return await _drive(args.requests_auth, args.concurrency, send)
+
+
+async def certificate(client, args, fixtures) -> dict:
+    courses = fixtures["courses"]
+    run = os.urandom(4).hex()
+
+    async def send(i: int):
+        r = await client.post("/api/certificate", data={
+            "video_id": courses[i % len(courses)]["video_id"],
+            "name": f"Learner {run} {i}",
+            "user_percentage": "90",
+        })
+        return r.status_code
+
+    return await _drive(args.requests, args.concurrency, send)
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+async def run(args) -> dict:
+    import httpx
+    from benchmarks import fakes
+    from app.core.config import settings
+
+    work_dir = tempfile.mkdtemp(prefix="load_test_")
+    settings.tmp_dir = os.path.join(work_dir, "tmp")
+    settings.certificates_dir = os.path.join(work_dir, "certificates")
+    settings.artifacts_dir = os.path.join(work_dir, "artifacts")
+    settings.mongo_explain_check = False
+    settings.job_workers = args.job_workers
+    settings.job_poll_interval = 0.1
+    settings.job_queue_size = max(settings.job_queue_size, args.requests_video)
+
+    if args.mongo_url:
+        settings.mongodb_url = args.mongo_url
+    else:
+        fakes.use_mock_mongo()
+    fakes.install_fake_groq(args.groq_latency)
+
+    from app.main import app
+    from app.db.client import get_db
+
+    scenarios = SCENARIOS if args.scenarios == "all" else args.scenarios.split(",")
+    report = {
+        "commit": _git_commit(),
+        "mongo": "server" if args.mongo_url else "mongomock",
+        "groq_latency_s": args.groq_latency,
+        "cpu_count": os.cpu_count(),
+        "scenarios": {},
+    }
+    async with app.router.lifespan_context(app):
+        db = get_db()
+        fixtures = {}
+        if {"check_quiz", "certificate"} & set(scenarios):
+            fixtures["courses"] = await _seed_courses(db, 20)
+        if "check_quiz" in scenarios:
+            fixtures["learner_tokens"] = await _seed_learners(db, 500)
+        if "auth_token" in scenarios:
+            fixtures["users"] = await _seed_users(db, 10)
+        if "video_to_quiz" in scenarios:
+            fixtures["video"] = await asyncio.to_thread(
+                fakes.make_video, os.path.join(work_dir, "fixture.mp4"), args.video_seconds
+            )
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            for name in scenarios:
+                print(f"Running {name}...", file=sys.stderr)
+                report["scenarios"][name] = await globals()[name](client, args, fixtures)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", default="all", help=f"Comma-separated subset of {','.join(SCENARIOS)}")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--requests-video", type=int, default=10, help="Uploads for video_to_quiz")
+    parser.add_argument("--requests-auth", type=int, default=40, help="Logins for auth_token")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--groq-latency", type=float, default=0.5, help="Seconds per fake Groq call")
+    parser.add_argument("--video-seconds", type=float, default=5.0, help="Length of the synthetic video")
+    parser.add_argument("--job-workers", type=int, default=2)
+    parser.add_argument("--job-timeout", type=float, default=300.0)
+    parser.add_argument("--mongo-url", help="Real MongoDB to use instead of mongomock-motor")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios.split(",")) - set(SCENARIOS) - {"all"}
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+// Fetch every page of a paginated backend list (/api/courses, /api/quizzes).
+// Each page is requested with `after` set to the previous page's `next_after`
+// until the backend returns null. Resolves to the items under `key`.
+export async function fetchAllPages(url, key) {
+  const items = [];
+  let after = null;
+  do {
+    const pageUrl = after ? `${url}${url.includes('?') ? '&' : '?'}after=${encodeURIComponent(after)}` : url;
+    const res = await fetch(pageUrl);
+    if (!res.ok) {
+      throw new Error(`Failed to fetch ${key}`);
+    }
+    const data = await res.json();
+    items.push(...data[key]);
+    after = data.next_after;
+  } while (after);
+  return items;
+}